@@ -19,13 +19,12 @@ from backend.src.core.modules.auth.services.password_services import (
 from backend.src.core.modules.auth.services.refresh_token_service import (
     RefreshTokenService,
 )
-from backend.src.dependencies.auth.creators import (
-    get_refresh_token_service,
-)
+from backend.src.dependencies.auth.admission import auth_admission
 from backend.src.dependencies.auth.permissions import get_current_user
 from backend.src.dependencies.auth.providers import (
     get_password_change_service,
     get_login_service,
+    get_refresh_token_service,
 )
 
 router = APIRouter(prefix="/api/v1/auth", tags=["APIv1 Auth"])
@@ -37,9 +36,11 @@ router = APIRouter(prefix="/api/v1/auth", tags=["APIv1 Auth"])
         200: {"model": LoginSuccessResponse},
         404: {"model": ErrorResponse},
         409: {"model": ErrorResponse},
+        503: {"model": ErrorResponse},
     },
     response_model=LoginSuccessResponse,
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(auth_admission)],
 )
 async def login(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
@@ -64,7 +65,7 @@ async def refresh_token(
         RefreshTokenService, Depends(get_refresh_token_service)
     ],
 ):
-    return refresh_token_service.refresh(token)
+    return await refresh_token_service.refresh(token)
 
 
 @router.post(
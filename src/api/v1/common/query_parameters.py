@@ -23,3 +23,11 @@ class DateRangeParameters(BaseModel):
 
     class ConfigDict:
         frozen = True
+
+
+class PaginationParameters(BaseModel):
+    limit: int = Query(default=50, gt=0, le=500)
+    cursor: Optional[str] = Query(default=None)
+
+    class ConfigDict:
+        frozen = True
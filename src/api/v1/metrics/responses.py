@@ -0,0 +1,28 @@
+from pydantic import BaseModel
+
+
+class AdmissionMetricsResponse(BaseModel):
+    max_concurrency: int
+    max_queue_depth: int
+    in_flight: int
+    queue_depth: int
+    admitted: int
+    rejected: int
+    timed_out: int
+    average_wait_seconds: float
+    max_wait_seconds: float
+
+    class ConfigDict:
+        frozen = True
+
+
+class CacheMetricsResponse(BaseModel):
+    max_size: int
+    size: int
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+
+    class ConfigDict:
+        frozen = True
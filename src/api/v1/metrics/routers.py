@@ -0,0 +1,82 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, status
+
+from backend.src.api.v1.common.responses import ErrorResponse
+from backend.src.api.v1.metrics.responses import (
+    AdmissionMetricsResponse,
+    CacheMetricsResponse,
+)
+from backend.src.core.modules.auth.schemas import CurrentUserDTO
+from backend.src.core.modules.common.admission import AdmissionController
+from backend.src.core.modules.common.cache import TTLCache
+from backend.src.core.modules.transaction.statistics_cache import (
+    TransactionStatisticsCache,
+)
+from backend.src.dependencies.auth.creators import (
+    get_auth_admission_controller,
+    get_token_decode_cache,
+)
+from backend.src.dependencies.transaction.cache import (
+    get_transaction_statistics_cache,
+)
+from backend.src.dependencies.user.permissions import admin_permission
+
+router = APIRouter(prefix="/api/v1/metrics", tags=["APIv1 Metrics"])
+
+
+@router.get(
+    "/admission",
+    responses={
+        200: {"model": AdmissionMetricsResponse},
+        401: {"model": ErrorResponse},
+        403: {"model": ErrorResponse},
+    },
+    response_model=AdmissionMetricsResponse,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(admin_permission)],
+)
+async def get_admission_metrics(
+    admission_controller: Annotated[
+        AdmissionController, Depends(get_auth_admission_controller)
+    ],
+):
+    return admission_controller.get_metrics()
+
+
+@router.get(
+    "/token-cache",
+    responses={
+        200: {"model": CacheMetricsResponse},
+        401: {"model": ErrorResponse},
+        403: {"model": ErrorResponse},
+    },
+    response_model=CacheMetricsResponse,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(admin_permission)],
+)
+async def get_token_cache_metrics(
+    token_decode_cache: Annotated[
+        TTLCache[CurrentUserDTO], Depends(get_token_decode_cache)
+    ],
+):
+    return token_decode_cache.get_metrics()
+
+
+@router.get(
+    "/statistics-cache",
+    responses={
+        200: {"model": CacheMetricsResponse},
+        401: {"model": ErrorResponse},
+        403: {"model": ErrorResponse},
+    },
+    response_model=CacheMetricsResponse,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(admin_permission)],
+)
+async def get_statistics_cache_metrics(
+    statistics_cache: Annotated[
+        TransactionStatisticsCache, Depends(get_transaction_statistics_cache)
+    ],
+):
+    return statistics_cache.get_metrics()
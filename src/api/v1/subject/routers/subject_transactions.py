@@ -1,10 +1,13 @@
-from typing import List, Annotated
+from typing import Annotated
 
 from fastapi import APIRouter, status, Depends, Path
 
-from backend.src.api.v1.common.query_parameters import DateRangeParameters
 from backend.src.api.v1.common.responses import ErrorResponse
-from backend.src.api.v1.transaction.responses.transaction import TransactionBaseResponse
+from backend.src.api.v1.transaction.query_parameters import get_transaction_list_query
+from backend.src.api.v1.transaction.responses.transaction import TransactionPageResponse
+from backend.src.core.modules.transaction.schemas.transaction import (
+    TransactionListQueryDTO,
+)
 from backend.src.core.modules.transaction.services.query_service import (
     TransactionQueryService,
 )
@@ -20,10 +23,10 @@ router = APIRouter(
 @router.get(
     "/",
     responses={
-        200: {"model": List[TransactionBaseResponse]},
+        200: {"model": TransactionPageResponse},
         401: {"model": ErrorResponse},
     },
-    response_model=List[TransactionBaseResponse],
+    response_model=TransactionPageResponse,
     status_code=status.HTTP_200_OK,
     dependencies=[Depends(SubjectOwnerPermission())],
 )
@@ -32,8 +35,8 @@ async def get_subject_transactions(
     transaction_query_service: Annotated[
         TransactionQueryService, Depends(get_transaction_query_service)
     ],
-    date_range: Annotated[DateRangeParameters, Depends()],
+    list_query: Annotated[TransactionListQueryDTO, Depends(get_transaction_list_query)],
 ):
     return await transaction_query_service.get_subject_transactions(
-        subject_id, date_range.start_date, date_range.end_date
+        subject_id, list_query
     )
@@ -0,0 +1,28 @@
+from typing import Annotated
+
+from fastapi import Depends, Query
+
+from backend.src.api.v1.common.query_parameters import (
+    DateRangeParameters,
+    PaginationParameters,
+)
+from backend.src.core.modules.transaction.cursor import decode_cursor
+from backend.src.core.modules.transaction.schemas.transaction import (
+    TransactionListQueryDTO,
+)
+
+
+def get_transaction_list_query(
+    date_range: Annotated[DateRangeParameters, Depends()],
+    pagination: Annotated[PaginationParameters, Depends()],
+    include_description: Annotated[bool, Query()] = False,
+) -> TransactionListQueryDTO:
+    return TransactionListQueryDTO(
+        start_date=date_range.start_date,
+        end_date=date_range.end_date,
+        limit=pagination.limit,
+        cursor=(
+            decode_cursor(pagination.cursor) if pagination.cursor is not None else None
+        ),
+        include_description=include_description,
+    )
@@ -1,5 +1,6 @@
 from datetime import datetime, date as date_type
 from decimal import Decimal
+from typing import List, Optional
 
 from pydantic import BaseModel
 
@@ -18,3 +19,25 @@ class TransactionBaseResponse(BaseModel):
 
     class ConfigDict:
         frozen = True
+
+
+class TransactionListItemResponse(BaseModel):
+    id: int
+    name: str
+    value: Decimal
+    type: TransactionType
+    description: Optional[str] = None
+    date: date_type
+    created_at: datetime
+    updated_at: datetime
+
+    class ConfigDict:
+        frozen = True
+
+
+class TransactionPageResponse(BaseModel):
+    items: List[TransactionListItemResponse]
+    next_cursor: Optional[str]
+
+    class ConfigDict:
+        frozen = True
@@ -1,5 +1,6 @@
+from datetime import date
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, List
 
 from pydantic import BaseModel
 
@@ -32,3 +33,19 @@ class UserTransactionStatisticsResponse(BaseModel):
 
     class ConfigDict:
         frozen = True
+
+
+class BalancePointResponse(BaseModel):
+    date: date
+    balance: Decimal
+
+    class ConfigDict:
+        frozen = True
+
+
+class BalanceSeriesResponse(BaseModel):
+    opening_balance: Decimal
+    points: List[BalancePointResponse]
+
+    class ConfigDict:
+        frozen = True
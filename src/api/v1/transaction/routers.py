@@ -8,15 +8,15 @@ from backend.src.api.v1.transaction.requests.transaction import (
     TransactionUpdateRequest,
 )
 from backend.src.api.v1.transaction.responses.transaction import TransactionBaseResponse
-from backend.src.dependencies.category.permissions import CategoryOwnerPermission
 from backend.src.dependencies.common.enums import IdentifierSource
-from backend.src.dependencies.subject.permissions import SubjectOwnerPermission
 from backend.src.dependencies.transaction.creators import (
     get_transaction_service,
 )
-from backend.src.dependencies.transaction.permissions import (
-    TransactionOwnerPermission,
+from backend.src.dependencies.ownership.permissions import (
+    OwnedIdentifier,
+    OwnershipPermission,
 )
+from backend.src.core.modules.ownership.enum import OwnedResource
 from backend.src.core.modules.transaction.schemas.transaction import (
     TransactionUpdateDTO,
 )
@@ -39,9 +39,17 @@ router = APIRouter(prefix="/api/v1/transactions", tags=["APIv1 Transaction"])
     response_model=TransactionBaseResponse,
     status_code=status.HTTP_200_OK,
     dependencies=[
-        Depends(TransactionOwnerPermission()),
-        Depends(SubjectOwnerPermission(source=IdentifierSource.REQUEST_BODY)),
-        Depends(CategoryOwnerPermission(source=IdentifierSource.REQUEST_BODY)),
+        Depends(
+            OwnershipPermission(
+                OwnedIdentifier(OwnedResource.TRANSACTION, "transaction_id"),
+                OwnedIdentifier(
+                    OwnedResource.SUBJECT, "subject_id", IdentifierSource.REQUEST_BODY
+                ),
+                OwnedIdentifier(
+                    OwnedResource.CATEGORY, "category_id", IdentifierSource.REQUEST_BODY
+                ),
+            )
+        ),
     ],
 )
 async def update_transaction(
@@ -66,7 +74,13 @@ async def update_transaction(
     },
     response_model=TransactionBaseResponse,
     status_code=status.HTTP_200_OK,
-    dependencies=[Depends(TransactionOwnerPermission())],
+    dependencies=[
+        Depends(
+            OwnershipPermission(
+                OwnedIdentifier(OwnedResource.TRANSACTION, "transaction_id")
+            )
+        )
+    ],
 )
 async def get_transaction(
     transaction_id: Annotated[int, Path(gt=0)],
@@ -86,7 +100,13 @@ async def get_transaction(
         404: {"model": ErrorResponse},
     },
     status_code=status.HTTP_204_NO_CONTENT,
-    dependencies=[Depends(TransactionOwnerPermission())],
+    dependencies=[
+        Depends(
+            OwnershipPermission(
+                OwnedIdentifier(OwnedResource.TRANSACTION, "transaction_id")
+            )
+        )
+    ],
 )
 async def delete_transaction(
     transaction_id: Annotated[int, Path(gt=0)],
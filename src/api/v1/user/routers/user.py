@@ -6,6 +6,7 @@ from fastapi import status
 from backend.src.api.v1.common.responses import ErrorResponse
 from backend.src.api.v1.user.requests import UserCreateRequest, UserUpdateRequest
 from backend.src.api.v1.user.responses import UserBaseResponse
+from backend.src.dependencies.auth.admission import auth_admission
 from backend.src.dependencies.user.creators import get_user_service
 from backend.src.dependencies.user.permissions import admin_permission
 from backend.src.core.modules.user.schemas import UserCreateDTO, UserUpdateDTO
@@ -20,9 +21,11 @@ router = APIRouter(prefix="/api/v1/users", tags=["APIv1 User"])
         201: {"model": UserBaseResponse},
         409: {"model": ErrorResponse},
         422: {"model": ErrorResponse},
+        503: {"model": ErrorResponse},
     },
     response_model=UserBaseResponse,
     status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(auth_admission)],
 )
 async def create_user(
     request: UserCreateRequest,
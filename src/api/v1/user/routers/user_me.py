@@ -10,12 +10,16 @@ from backend.src.api.v1.subject.responses import SubjectBaseResponse
 from backend.src.api.v1.wallet.responses import WalletGetResponse
 from backend.src.dependencies.auth.permissions import get_current_user
 from backend.src.dependencies.category.creators import get_category_service
+from backend.src.dependencies.subject.creators import get_subject_service
 from backend.src.dependencies.user.creators import get_user_service
+from backend.src.dependencies.wallet.creators import get_wallet_service
 from backend.src.core.modules.auth.schemas import CurrentUserDTO
 from backend.src.core.modules.category.service import CategoryService
+from backend.src.core.modules.subject.service import SubjectService
 from backend.src.core.modules.transaction.enum import TransactionType
 from backend.src.core.modules.user.service import UserService
 from backend.src.core.modules.user.schemas import UserUpdateDTO
+from backend.src.core.modules.wallet.service import WalletService
 
 router = APIRouter(prefix="/api/v1/user/me", tags=["APIv1 User Me"])
 
@@ -70,10 +74,9 @@ async def get_user_categories(
 )
 async def get_user_subjects(
     current_user: Annotated[CurrentUserDTO, Depends(get_current_user)],
-    user_service: Annotated[UserService, Depends(get_user_service)],
+    subject_service: Annotated[SubjectService, Depends(get_subject_service)],
 ):
-    user = await user_service.get_by_id(current_user.id)
-    return user.subjects
+    return await subject_service.get_by_user_id(current_user.id)
 
 
 @router.get(
@@ -86,7 +89,6 @@ async def get_user_subjects(
 )
 async def get_user_wallets(
     current_user: Annotated[CurrentUserDTO, Depends(get_current_user)],
-    user_service: Annotated[UserService, Depends(get_user_service)],
+    wallet_service: Annotated[WalletService, Depends(get_wallet_service)],
 ):
-    user = await user_service.get_by_id(current_user.id)
-    return user.wallets
+    return await wallet_service.get_by_user_id(current_user.id)
@@ -1,18 +1,27 @@
 from datetime import datetime
-from typing import List, Annotated
+from typing import Annotated
 
 from dateutil.relativedelta import relativedelta
-from fastapi import APIRouter, status, Depends
+from fastapi import APIRouter, status, Depends, Query
+from fastapi.responses import StreamingResponse
 
 from backend.src.api.v1.common.query_parameters import DateRangeParameters
 from backend.src.api.v1.common.responses import ErrorResponse
-from backend.src.api.v1.transaction.responses.transaction import TransactionBaseResponse
+from backend.src.api.v1.transaction.query_parameters import get_transaction_list_query
+from backend.src.api.v1.transaction.responses.transaction import TransactionPageResponse
 from backend.src.api.v1.transaction.responses.transaction_statistics import (
     TransactionStatisticResponse,
     UserTransactionStatisticsResponse,
 )
 from backend.src.core.modules.auth.schemas import CurrentUserDTO
 from backend.src.core.modules.common.utils import get_first_day_of_month
+from backend.src.core.modules.transaction.enum import TransactionExportFormat
+from backend.src.core.modules.transaction.services.export_service import (
+    TransactionExportService,
+)
+from backend.src.core.modules.transaction.schemas.transaction import (
+    TransactionListQueryDTO,
+)
 from backend.src.core.modules.transaction.services.query_service import (
     TransactionQueryService,
 )
@@ -21,6 +30,7 @@ from backend.src.core.modules.transaction.services.statistics_service import (
 )
 from backend.src.dependencies.auth.permissions import get_current_user
 from backend.src.dependencies.transaction.creators import (
+    get_transaction_export_service,
     get_transaction_query_service,
     get_transaction_statistics_service,
 )
@@ -29,14 +39,19 @@ router = APIRouter(
     prefix="/api/v1/user/me/transactions", tags=["APIv1 User Me Transactions"]
 )
 
+EXPORT_MEDIA_TYPES = {
+    TransactionExportFormat.NDJSON: "application/x-ndjson",
+    TransactionExportFormat.CSV: "text/csv",
+}
+
 
 @router.get(
     "/",
     responses={
-        200: {"model": List[TransactionBaseResponse]},
+        200: {"model": TransactionPageResponse},
         401: {"model": ErrorResponse},
     },
-    response_model=List[TransactionBaseResponse],
+    response_model=TransactionPageResponse,
     status_code=status.HTTP_200_OK,
 )
 async def get_user_transactions(
@@ -44,10 +59,42 @@ async def get_user_transactions(
     transaction_query_service: Annotated[
         TransactionQueryService, Depends(get_transaction_query_service)
     ],
-    date_range: Annotated[DateRangeParameters, Depends()],
+    list_query: Annotated[TransactionListQueryDTO, Depends(get_transaction_list_query)],
 ):
     return await transaction_query_service.get_user_transactions(
-        current_user.id, date_range.start_date, date_range.end_date
+        current_user.id, list_query
+    )
+
+
+@router.get(
+    "/export",
+    responses={
+        200: {
+            "content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()}
+        },
+        401: {"model": ErrorResponse},
+    },
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def export_user_transactions(
+    current_user: Annotated[CurrentUserDTO, Depends(get_current_user)],
+    transaction_export_service: Annotated[
+        TransactionExportService, Depends(get_transaction_export_service)
+    ],
+    date_range: Annotated[DateRangeParameters, Depends()],
+    export_format: Annotated[
+        TransactionExportFormat, Query(alias="format")
+    ] = TransactionExportFormat.NDJSON,
+):
+    return StreamingResponse(
+        transaction_export_service.export_user_transactions(
+            current_user.id, export_format, date_range.start_date, date_range.end_date
+        ),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f"attachment; filename=transactions.{export_format}"
+        },
     )
 
 
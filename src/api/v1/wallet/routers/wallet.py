@@ -17,7 +17,11 @@ from backend.src.dependencies.auth.permissions import get_current_user
 from backend.src.dependencies.wallet.creators import (
     get_wallet_service,
 )
-from backend.src.dependencies.wallet.permissions import WalletOwnerPermission
+from backend.src.core.modules.ownership.enum import OwnedResource
+from backend.src.dependencies.ownership.permissions import (
+    OwnedIdentifier,
+    OwnershipPermission,
+)
 
 router = APIRouter(prefix="/api/v1/wallets", tags=["APIv1 Wallet"])
 
@@ -31,7 +35,9 @@ router = APIRouter(prefix="/api/v1/wallets", tags=["APIv1 Wallet"])
         404: {"model": ErrorResponse},
     },
     response_model=WalletGetResponse,
-    dependencies=[Depends(WalletOwnerPermission())],
+    dependencies=[
+        Depends(OwnershipPermission(OwnedIdentifier(OwnedResource.WALLET, "wallet_id")))
+    ],
 )
 async def get_wallet(
     wallet_id: Annotated[int, Path(gt=0)],
@@ -71,7 +77,9 @@ async def create_wallet(
     },
     status_code=status.HTTP_200_OK,
     response_model=WalletBaseResponse,
-    dependencies=[Depends(WalletOwnerPermission())],
+    dependencies=[
+        Depends(OwnershipPermission(OwnedIdentifier(OwnedResource.WALLET, "wallet_id")))
+    ],
 )
 async def update_wallet(
     wallet_id: Annotated[int, Path(gt=0)],
@@ -92,7 +100,9 @@ async def update_wallet(
         404: {"model": ErrorResponse},
     },
     status_code=status.HTTP_204_NO_CONTENT,
-    dependencies=[Depends(WalletOwnerPermission())],
+    dependencies=[
+        Depends(OwnershipPermission(OwnedIdentifier(OwnedResource.WALLET, "wallet_id")))
+    ],
 )
 async def delete_wallet(
     wallet_id: Annotated[int, Path(gt=0)],
@@ -1,22 +1,33 @@
-from datetime import datetime
-from typing import Annotated, List
+from datetime import date, datetime, timedelta
+from typing import Annotated, Optional
 
 from dateutil.relativedelta import relativedelta
-from fastapi import APIRouter, Depends, Path
+from fastapi import APIRouter, Depends, Path, Query
 from starlette import status
 
 from backend.src.api.v1.common.query_parameters import DateRangeParameters
 from backend.src.api.v1.common.responses import ErrorResponse
+from backend.src.api.v1.transaction.query_parameters import get_transaction_list_query
 from backend.src.api.v1.transaction.requests.transaction import TransactionCreateRequest
-from backend.src.api.v1.transaction.responses.transaction import TransactionBaseResponse
+from backend.src.api.v1.transaction.responses.transaction import (
+    TransactionBaseResponse,
+    TransactionPageResponse,
+)
 from backend.src.api.v1.transaction.responses.transaction_statistics import (
+    BalanceSeriesResponse,
     WalletTransactionStatisticsResponse,
     WalletTransactionStatisticResponse,
 )
 from backend.src.core.modules.auth.schemas import CurrentUserDTO
 from backend.src.core.modules.common.utils import get_first_day_of_month
+from backend.src.core.modules.ownership.enum import OwnedResource
+from backend.src.core.modules.transaction.enum import BalanceSeriesBucket
+from backend.src.core.modules.transaction.schemas.statistic import (
+    BalanceSeriesQueryDTO,
+)
 from backend.src.core.modules.transaction.schemas.transaction import (
     TransactionCreateDTO,
+    TransactionListQueryDTO,
 )
 from backend.src.core.modules.transaction.services.crud_service import (
     TransactionService,
@@ -28,15 +39,16 @@ from backend.src.core.modules.transaction.services.statistics_service import (
     TransactionStatisticsService,
 )
 from backend.src.dependencies.auth.permissions import get_current_user
-from backend.src.dependencies.category.permissions import CategoryOwnerPermission
 from backend.src.dependencies.common.enums import IdentifierSource
-from backend.src.dependencies.subject.permissions import SubjectOwnerPermission
+from backend.src.dependencies.ownership.permissions import (
+    OwnedIdentifier,
+    OwnershipPermission,
+)
 from backend.src.dependencies.transaction.creators import (
     get_transaction_service,
     get_transaction_query_service,
     get_transaction_statistics_service,
 )
-from backend.src.dependencies.wallet.permissions import WalletOwnerPermission
 
 router = APIRouter(
     prefix="/api/v1/wallets/{wallet_id}/transactions",
@@ -53,9 +65,17 @@ router = APIRouter(
     },
     status_code=status.HTTP_201_CREATED,
     dependencies=[
-        Depends(WalletOwnerPermission()),
-        Depends(SubjectOwnerPermission(source=IdentifierSource.REQUEST_BODY)),
-        Depends(CategoryOwnerPermission(source=IdentifierSource.REQUEST_BODY)),
+        Depends(
+            OwnershipPermission(
+                OwnedIdentifier(OwnedResource.WALLET, "wallet_id"),
+                OwnedIdentifier(
+                    OwnedResource.SUBJECT, "subject_id", IdentifierSource.REQUEST_BODY
+                ),
+                OwnedIdentifier(
+                    OwnedResource.CATEGORY, "category_id", IdentifierSource.REQUEST_BODY
+                ),
+            )
+        ),
     ],
 )
 async def create_wallet_transaction(
@@ -74,23 +94,25 @@ async def create_wallet_transaction(
 @router.get(
     "/",
     responses={
-        200: {"model": List[TransactionBaseResponse]},
+        200: {"model": TransactionPageResponse},
         401: {"model": ErrorResponse},
         403: {"model": ErrorResponse},
     },
-    response_model=List[TransactionBaseResponse],
+    response_model=TransactionPageResponse,
     status_code=status.HTTP_200_OK,
-    dependencies=[Depends(WalletOwnerPermission())],
+    dependencies=[
+        Depends(OwnershipPermission(OwnedIdentifier(OwnedResource.WALLET, "wallet_id")))
+    ],
 )
 async def get_wallet_transactions(
     wallet_id: Annotated[int, Path(gt=0)],
     transaction_query_service: Annotated[
         TransactionQueryService, Depends(get_transaction_query_service)
     ],
-    date_range: Annotated[DateRangeParameters, Depends()],
+    list_query: Annotated[TransactionListQueryDTO, Depends(get_transaction_list_query)],
 ):
     return await transaction_query_service.get_wallet_transactions(
-        wallet_id, date_range.start_date, date_range.end_date
+        wallet_id, list_query
     )
 
 
@@ -104,7 +126,9 @@ async def get_wallet_transactions(
     },
     response_model=WalletTransactionStatisticsResponse,
     status_code=status.HTTP_200_OK,
-    dependencies=[Depends(WalletOwnerPermission())],
+    dependencies=[
+        Depends(OwnershipPermission(OwnedIdentifier(OwnedResource.WALLET, "wallet_id")))
+    ],
 )
 async def get_wallet_statistics(
     wallet_id: Annotated[int, Path(gt=0)],
@@ -126,12 +150,55 @@ async def get_wallet_statistics(
         404: {"model": ErrorResponse},
     },
     response_model=WalletTransactionStatisticResponse,
-    dependencies=[Depends(WalletOwnerPermission())],
+    dependencies=[
+        Depends(OwnershipPermission(OwnedIdentifier(OwnedResource.WALLET, "wallet_id")))
+    ],
 )
 async def get_wallet_balance(
     wallet_id: Annotated[int, Path(gt=0)],
     transaction_statistics_service: Annotated[
         TransactionStatisticsService, Depends(get_transaction_statistics_service)
     ],
+    as_of: Annotated[Optional[date], Query()] = None,
+):
+    return await transaction_statistics_service.get_wallet_balance(wallet_id, as_of)
+
+
+@router.get(
+    "/balance-series",
+    responses={
+        200: {"model": BalanceSeriesResponse},
+        401: {"model": ErrorResponse},
+        403: {"model": ErrorResponse},
+        404: {"model": ErrorResponse},
+    },
+    response_model=BalanceSeriesResponse,
+    dependencies=[
+        Depends(OwnershipPermission(OwnedIdentifier(OwnedResource.WALLET, "wallet_id")))
+    ],
+)
+async def get_wallet_balance_series(
+    wallet_id: Annotated[int, Path(gt=0)],
+    transaction_statistics_service: Annotated[
+        TransactionStatisticsService, Depends(get_transaction_statistics_service)
+    ],
+    date_range: Annotated[DateRangeParameters, Depends()],
+    bucket: Annotated[BalanceSeriesBucket, Query()] = BalanceSeriesBucket.DAY,
 ):
-    return await transaction_statistics_service.get_wallet_balance(wallet_id)
+    """
+    Only buckets with transactions are listed, each dated by its first day within
+    the range and holding the balance at its end. The range defaults to the
+    current month and the twelve months before it. The start is clamped to the
+    second representable day, the opening balance is taken the day before it.
+    """
+    end_date = date_range.end_date or date.today()
+    start_date = max(
+        date_range.start_date
+        or get_first_day_of_month(datetime.now()).date() - relativedelta(years=1),
+        date.min + timedelta(days=1),
+    )
+
+    return await transaction_statistics_service.get_wallet_balance_series(
+        wallet_id,
+        BalanceSeriesQueryDTO(start_date=start_date, end_date=end_date, bucket=bucket),
+    )
@@ -20,7 +20,11 @@ from backend.src.dependencies.auth.permissions import get_current_user
 from backend.src.dependencies.transaction.creators import (
     get_transaction_transfer_service,
 )
-from backend.src.dependencies.wallet.permissions import WalletOwnerPermission
+from backend.src.core.modules.ownership.enum import OwnedResource
+from backend.src.dependencies.ownership.permissions import (
+    OwnedIdentifier,
+    OwnershipPermission,
+)
 
 router = APIRouter(
     prefix="/api/v1/wallets/{sender_id}/wallets/{receiver_id}/transfer",
@@ -37,8 +41,12 @@ router = APIRouter(
     },
     status_code=status.HTTP_201_CREATED,
     dependencies=[
-        Depends(WalletOwnerPermission(name="sender_id")),
-        Depends(WalletOwnerPermission(name="receiver_id")),
+        Depends(
+            OwnershipPermission(
+                OwnedIdentifier(OwnedResource.WALLET, "sender_id"),
+                OwnedIdentifier(OwnedResource.WALLET, "receiver_id"),
+            )
+        ),
     ],
 )
 async def transfer_transaction(
@@ -11,3 +11,18 @@ ACCESS_TOKEN_EXPIRE_MINUTES: float = float(
 LOGIN_URL: str = "/api/v1/auth/login"
 REFRESH_TOKEN_SECRET_KEY: str = os.getenv("REFRESH_TOKEN_SECRET_KEY")  # type: ignore
 SECRET_KEY: str = os.getenv("SECRET_KEY")  # type: ignore
+PASSWORD_HASHING_MAX_WORKERS: int = int(os.getenv("PASSWORD_HASHING_MAX_WORKERS", "4"))
+AUTH_ADMISSION_MAX_CONCURRENCY: int = int(
+    os.getenv("AUTH_ADMISSION_MAX_CONCURRENCY", str(PASSWORD_HASHING_MAX_WORKERS))
+)
+AUTH_ADMISSION_MAX_QUEUE_DEPTH: int = int(
+    os.getenv("AUTH_ADMISSION_MAX_QUEUE_DEPTH", "100")
+)
+AUTH_ADMISSION_WAIT_TIMEOUT: float = float(
+    os.getenv("AUTH_ADMISSION_WAIT_TIMEOUT", "5")
+)
+TOKEN_DECODE_CACHE_MAX_SIZE: int = int(
+    os.getenv("TOKEN_DECODE_CACHE_MAX_SIZE", "10000")
+)
+ADMIN_CLAIM_MAX_AGE_SECONDS: int = int(os.getenv("ADMIN_CLAIM_MAX_AGE_SECONDS", "300"))
+ADMIN_ROLE_CACHE_MAX_SIZE: int = int(os.getenv("ADMIN_ROLE_CACHE_MAX_SIZE", "10000"))
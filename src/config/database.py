@@ -14,3 +14,8 @@ DB_NAME: str | None = os.getenv("DB_NAME")
 DATABASE_URL: str = (
     f"mysql+aiomysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 )
+
+DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "50"))
+DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "100"))
+DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
@@ -0,0 +1,10 @@
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+STATISTICS_CACHE_MAX_SIZE: int = int(os.getenv("STATISTICS_CACHE_MAX_SIZE", "10000"))
+STATISTICS_CACHE_TTL_SECONDS: float = float(
+    os.getenv("STATISTICS_CACHE_TTL_SECONDS", "300")
+)
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Optional
 
 from pydantic import BaseModel
 
@@ -6,6 +7,7 @@ from pydantic import BaseModel
 class AuthenticatedUserDTO(BaseModel):
     id: int
     sub: str
+    is_admin: bool = False
 
     class ConfigDict:
         frozen = True
@@ -14,6 +16,8 @@ class AuthenticatedUserDTO(BaseModel):
 class CurrentUserDTO(BaseModel):
     id: int
     email: str
+    is_admin: bool = False
+    issued_at: Optional[int] = None
 
     class ConfigDict:
         frozen = True
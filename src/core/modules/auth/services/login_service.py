@@ -32,9 +32,11 @@ class LoginService:
         )
 
     async def _authenticate(self, username: str, password: str) -> AuthenticatedUserDTO:
-        user = await self._user_retrieval_use_case.get_by_username_or_email(username)
+        user = await self._user_retrieval_use_case.get_credentials_by_username_or_email(
+            username
+        )
 
-        if not self._verify_service.verify(password, user.password):
+        if not await self._verify_service.verify_async(password, user.password):
             raise InvalidCredentials()
 
-        return AuthenticatedUserDTO(id=user.id, sub=user.email)
+        return AuthenticatedUserDTO(id=user.id, sub=user.email, is_admin=user.is_admin)
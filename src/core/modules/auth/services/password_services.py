@@ -1,5 +1,10 @@
+import asyncio
+from concurrent.futures import Executor
+from typing import Optional
+
 from passlib.context import CryptContext
 
+from backend.src.database.unit_of_work import UnitOfWorkInterface
 from backend.src.core.modules.user.use_case import UserRetrievalUseCase
 from backend.src.core.modules.auth.exceptions import InvalidCredentials
 from backend.src.core.modules.auth.schemas import ChangePasswordDTO
@@ -8,20 +13,35 @@ from backend.src.core.modules.user.model import User
 
 
 class PasswordHashService:
-    def __init__(self, crypt: CryptContext):
+    def __init__(self, crypt: CryptContext, executor: Optional[Executor] = None):
         self._crypt = crypt
+        self._executor = executor
 
     def hash(self, password: str) -> str:
         return self._crypt.hash(password)  # type: ignore
 
+    async def hash_async(self, password: str) -> str:
+        """
+        Runs bcrypt in the executor, so hashing does not block the event loop.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self.hash, password
+        )
+
 
 class PasswordVerifyService:
-    def __init__(self, crypt: CryptContext):
+    def __init__(self, crypt: CryptContext, executor: Optional[Executor] = None):
         self._crypt = crypt
+        self._executor = executor
 
     def verify(self, password: str, password_hash: str) -> bool:
         return self._crypt.verify(password, password_hash)  # type: ignore
 
+    async def verify_async(self, password: str, password_hash: str) -> bool:
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self.verify, password, password_hash
+        )
+
 
 class PasswordChangeService:
     def __init__(
@@ -30,19 +50,24 @@ class PasswordChangeService:
         retrieval_use_case: UserRetrievalUseCase,
         hash_service: PasswordHashService,
         verify_service: PasswordVerifyService,
+        unit_of_work: UnitOfWorkInterface,
     ):
         self._user_repository = user_repository
         self._retrieval_use_case = retrieval_use_case
         self._hash_service = hash_service
         self._verify_service = verify_service
+        self._unit_of_work = unit_of_work
 
     async def change_password(self, user_id: int, request: ChangePasswordDTO) -> User:
         user = await self._retrieval_use_case.get_by_id(user_id)
 
-        if not self._verify_service.verify(request.current_password, user.password):
+        if not await self._verify_service.verify_async(
+            request.current_password, user.password
+        ):
             raise InvalidCredentials()
 
-        user.password = self._hash_service.hash(request.password)
+        user.password = await self._hash_service.hash_async(request.password)
         user = await self._user_repository.update(user)
+        await self._unit_of_work.commit()
 
         return user
@@ -3,15 +3,25 @@ from backend.src.core.modules.auth.schemas import (
     SuccessAuthenticationDTO,
 )
 from backend.src.core.modules.auth.services.token_service import TokenService
+from backend.src.core.modules.user.use_case import UserRetrievalUseCase
 
 
 class RefreshTokenService:
-    def __init__(self, token_service: TokenService):
+    def __init__(
+        self,
+        token_service: TokenService,
+        user_retrieval_use_case: UserRetrievalUseCase,
+    ):
         self._token_service = token_service
+        self._user_retrieval_use_case = user_retrieval_use_case
 
-    def refresh(self, token: str) -> SuccessAuthenticationDTO:
-        decoded_data = self._token_service.decode(token)
-        token_data = AuthenticatedUserDTO(id=decoded_data.id, sub=decoded_data.email)
+    async def refresh(self, token: str) -> SuccessAuthenticationDTO:
+        decoded_data = self._token_service.decode_refresh_token(token)
+        token_data = AuthenticatedUserDTO(
+            id=decoded_data.id,
+            sub=decoded_data.email,
+            is_admin=await self._user_retrieval_use_case.is_admin(decoded_data.id),
+        )
 
         return SuccessAuthenticationDTO(
             token_type="Bearer",
@@ -1,9 +1,13 @@
+import hashlib
+import time
 from datetime import datetime, timedelta
+from typing import Optional, Tuple
 
 from jose import jwt, JWTError
 
 from backend.src.core.modules.auth.exceptions import InvalidCredentials
 from backend.src.core.modules.auth.schemas import AuthenticatedUserDTO, CurrentUserDTO
+from backend.src.core.modules.common.cache import TTLCache
 
 
 class TokenService:
@@ -13,15 +17,19 @@ class TokenService:
         refresh_token_secret_key: str,
         secret_key: str,
         token_expire_minutes: float,
+        decode_cache: Optional[TTLCache[CurrentUserDTO]] = None,
     ):
         self.algorithm = algorithm
         self.refresh_token_secret_key = refresh_token_secret_key
         self.secret_key = secret_key
         self.token_expire_minutes = token_expire_minutes
+        self._decode_cache = decode_cache
 
     def create_access_token(self, data: AuthenticatedUserDTO) -> str:
         to_encode = data.model_copy().model_dump()
-        to_encode.update({"exp": self.get_expire_token_datetime()})
+        to_encode.update(
+            {"exp": self.get_expire_token_datetime(), "iat": int(time.time())}
+        )
 
         return jwt.encode(  # type: ignore
             claims=to_encode, key=self.secret_key, algorithm=self.algorithm
@@ -38,17 +46,42 @@ class TokenService:
         )
 
     def decode(self, token: str) -> CurrentUserDTO:
+        """
+        Verified tokens are cached by digest until their exp claim, so the
+        signature is only checked once per token.
+        """
+        if self._decode_cache is None:
+            return self._decode(token, self.secret_key)[0]
+
+        cache_key = hashlib.sha256(token.encode()).hexdigest()
+        current_user = self._decode_cache.get(cache_key)
+
+        if current_user is None:
+            current_user, expires_at = self._decode(token, self.secret_key)
+            self._decode_cache.set(cache_key, current_user, expires_at)
+
+        return current_user
+
+    def decode_refresh_token(self, token: str) -> CurrentUserDTO:
+        return self._decode(token, self.refresh_token_secret_key)[0]
+
+    def _decode(self, token: str, key: str) -> Tuple[CurrentUserDTO, float]:
         try:
-            payload = jwt.decode(
-                token=token, key=self.secret_key, algorithms=[self.algorithm]
-            )
+            payload = jwt.decode(token=token, key=key, algorithms=[self.algorithm])
             email = payload.get("sub")
             user_id = payload.get("id")
 
             if email is None or user_id is None:
                 raise InvalidCredentials()
 
-            return CurrentUserDTO(id=user_id, email=email)
+            current_user = CurrentUserDTO(
+                id=user_id,
+                email=email,
+                is_admin=payload.get("is_admin", False),
+                issued_at=payload.get("iat"),
+            )
+
+            return current_user, float(payload.get("exp", 0))
         except JWTError as exc:
             raise InvalidCredentials() from exc
 
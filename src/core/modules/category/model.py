@@ -1,6 +1,6 @@
 from typing import List
 
-from sqlalchemy import String, Enum, Integer, ForeignKey, UniqueConstraint
+from sqlalchemy import String, Enum, Integer, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.orm import MappedColumn, mapped_column, relationship
 
 from backend.src.database.base import BaseModel
@@ -9,7 +9,10 @@ from backend.src.core.modules.transaction.enum import TransactionType
 
 class Category(BaseModel):
     __tablename__ = "categories"
-    __table_args__ = (UniqueConstraint("name", "user_id", name="unique_user_name"),)
+    __table_args__ = (
+        UniqueConstraint("name", "user_id", name="unique_user_name"),
+        Index("ix_categories_user_id_transaction_type", "user_id", "transaction_type"),
+    )
 
     name: MappedColumn[str] = mapped_column(String(50))
     transaction_type: MappedColumn[TransactionType] = mapped_column(
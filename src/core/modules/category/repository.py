@@ -4,6 +4,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from backend.src.database.integrity import unique_constraint_guard
 from backend.src.core.modules.category.repository_interface import (
     CategoryRepositoryInterface,
 )
@@ -17,19 +18,21 @@ class CategoryRepository(CategoryRepositoryInterface):
 
     async def save(self, category: Category) -> Category:
         self._session.add(category)
-        await self._session.commit()
+
+        async with unique_constraint_guard(self._session):
+            await self._session.flush()
 
         return category
 
     async def update(self, category: Category) -> Category:
-        await self._session.commit()
-        await self._session.refresh(category)
+        async with unique_constraint_guard(self._session):
+            await self._session.flush()
 
         return category
 
     async def delete(self, category: Category) -> None:
         await self._session.delete(category)
-        await self._session.commit()
+        await self._session.flush()
 
     async def get_by_user_id(self, user_id: int) -> Sequence[Category]:
         result = await self._session.execute(
@@ -62,12 +65,3 @@ class CategoryRepository(CategoryRepositoryInterface):
         )
 
         return result.scalars().first()
-
-    async def get_by_name_and_user_id(self, name: str, user_id: int) -> Category | None:
-        result = await self._session.execute(
-            select(Category)
-            .where((Category.name == name) & (Category.user_id == user_id))
-            .options(selectinload(Category.user))
-        )
-
-        return result.scalars().first()
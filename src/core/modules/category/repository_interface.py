@@ -31,7 +31,3 @@ class CategoryRepositoryInterface(ABC):
     @abstractmethod
     async def get_by_id(self, category_id: int) -> Category | None:
         pass
-
-    @abstractmethod
-    async def get_by_name_and_user_id(self, name: str, user_id: int) -> Category | None:
-        pass
@@ -1,5 +1,6 @@
 from typing import Sequence, Optional
 
+from backend.src.database.unit_of_work import UnitOfWorkInterface
 from backend.src.core.modules.category.model import Category
 from backend.src.core.modules.category.repository_interface import (
     CategoryRepositoryInterface,
@@ -9,9 +10,6 @@ from backend.src.core.modules.category.schemas import (
     CategoryUpdateDTO,
 )
 from backend.src.core.modules.category.use_case import CategoryRetrievalUseCase
-from backend.src.core.modules.common.exceptions import (
-    ObjectAlreadyExists,
-)
 from backend.src.core.modules.transaction.enum import TransactionType
 
 
@@ -20,38 +18,37 @@ class CategoryService:
         self,
         repository: CategoryRepositoryInterface,
         retrieval_use_case: CategoryRetrievalUseCase,
+        unit_of_work: UnitOfWorkInterface,
     ):
         self._repository = repository
         self._retrieval_use_case = retrieval_use_case
+        self._unit_of_work = unit_of_work
 
     async def create(self, user_id: int, request_dto: CategoryCreateDTO) -> Category:
-        if await self._check_category_with_name_and_user_id_exists(
-            request_dto.name, user_id
-        ):
-            raise ObjectAlreadyExists()
-
         category = Category(**request_dto.model_dump(), user_id=user_id)
 
-        return await self._repository.save(category)
+        category = await self._repository.save(category)
+        await self._unit_of_work.commit()
+
+        return category
 
     async def update(
         self, category_id: int, request_dto: CategoryUpdateDTO
     ) -> Category:
         category = await self.get_by_id(category_id)
 
-        if await self._check_category_with_name_and_user_id_exists(
-            request_dto.name, category.user_id, category.id
-        ):
-            raise ObjectAlreadyExists()
-
         category.name = request_dto.name
 
-        return await self._repository.update(category)
+        category = await self._repository.update(category)
+        await self._unit_of_work.commit()
+
+        return category
 
     async def delete(self, category_id: int) -> None:
         category = await self.get_by_id(category_id)
 
-        return await self._repository.delete(category)
+        await self._repository.delete(category)
+        await self._unit_of_work.commit()
 
     async def get_by_id(self, category_id: int) -> Category:
         return await self._retrieval_use_case.get_by_id(category_id)
@@ -65,16 +62,3 @@ class CategoryService:
             )
 
         return await self._repository.get_by_user_id(user_id)
-
-    async def _check_category_with_name_and_user_id_exists(
-        self, name: str, user_id: int, exclude_id: Optional[int] = None
-    ) -> bool:
-        category = await self._repository.get_by_name_and_user_id(name, user_id)
-
-        if category is None:
-            return False
-
-        if category.id == exclude_id:
-            return False
-
-        return True
@@ -1,3 +1,5 @@
+from typing import Dict
+
 from backend.src.core.modules.category.repository_interface import (
     CategoryRepositoryInterface,
 )
@@ -8,11 +10,17 @@ from backend.src.core.modules.common.exceptions import ObjectDoesNotExist
 class CategoryRetrievalUseCase:
     def __init__(self, repository: CategoryRepositoryInterface):
         self._repository = repository
+        self._loaded: Dict[int, Category] = {}
 
     async def get_by_id(self, category_id: int) -> Category:
+        if category_id in self._loaded:
+            return self._loaded[category_id]
+
         category = await self._repository.get_by_id(category_id)
 
         if category is None:
             raise ObjectDoesNotExist()
 
+        self._loaded[category_id] = category
+
         return category
@@ -0,0 +1,104 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from pydantic import BaseModel
+
+from backend.src.core.modules.common.exceptions import ServiceOverloaded
+
+
+class AdmissionMetricsDTO(BaseModel):
+    max_concurrency: int
+    max_queue_depth: int
+    in_flight: int
+    queue_depth: int
+    admitted: int
+    rejected: int
+    timed_out: int
+    average_wait_seconds: float
+    max_wait_seconds: float
+
+    class ConfigDict:
+        frozen = True
+
+
+class _AdmissionCounters(BaseModel):
+    in_flight: int = 0
+    queue_depth: int = 0
+    admitted: int = 0
+    rejected: int = 0
+    timed_out: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+
+class AdmissionController:
+    """
+    Lets at most max_concurrency callers in at once and keeps at most
+    max_queue_depth callers waiting. Anything above that, or waiting longer
+    than wait_timeout seconds, is rejected with ServiceOverloaded.
+    """
+
+    def __init__(self, max_concurrency: int, max_queue_depth: int, wait_timeout: float):
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_concurrency = max_concurrency
+        self._max_queue_depth = max_queue_depth
+        self._wait_timeout = wait_timeout
+        self._counters = _AdmissionCounters()
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        await self._acquire()
+        self._counters.in_flight += 1
+
+        try:
+            yield
+        finally:
+            self._counters.in_flight -= 1
+            self._semaphore.release()
+
+    def get_metrics(self) -> AdmissionMetricsDTO:
+        return AdmissionMetricsDTO(
+            max_concurrency=self._max_concurrency,
+            max_queue_depth=self._max_queue_depth,
+            in_flight=self._counters.in_flight,
+            queue_depth=self._counters.queue_depth,
+            admitted=self._counters.admitted,
+            rejected=self._counters.rejected,
+            timed_out=self._counters.timed_out,
+            average_wait_seconds=(
+                self._counters.total_wait_seconds / self._counters.admitted
+                if self._counters.admitted
+                else 0.0
+            ),
+            max_wait_seconds=self._counters.max_wait_seconds,
+        )
+
+    async def _acquire(self) -> None:
+        if not self._semaphore.locked():
+            await self._semaphore.acquire()
+            self._counters.admitted += 1
+            return
+
+        if self._counters.queue_depth >= self._max_queue_depth:
+            self._counters.rejected += 1
+            raise ServiceOverloaded()
+
+        self._counters.queue_depth += 1
+        started_at = time.monotonic()
+
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), self._wait_timeout)
+        except asyncio.TimeoutError as exception:
+            self._counters.timed_out += 1
+            raise ServiceOverloaded() from exception
+        finally:
+            self._counters.queue_depth -= 1
+
+        wait_seconds = time.monotonic() - started_at
+        self._counters.admitted += 1
+        self._counters.total_wait_seconds += wait_seconds
+        self._counters.max_wait_seconds = max(
+            self._counters.max_wait_seconds, wait_seconds
+        )
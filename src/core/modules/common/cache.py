@@ -0,0 +1,95 @@
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+from pydantic import BaseModel
+
+ValueT = TypeVar("ValueT")
+
+
+class CacheMetricsDTO(BaseModel):
+    max_size: int
+    size: int
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+
+    class ConfigDict:
+        frozen = True
+
+
+class TTLCache(Generic[ValueT]):
+    """
+    Bounded LRU cache whose entries also expire at an absolute unix timestamp.
+    on_evict is called with the key of every entry dropped by the size bound or
+    by expiry, so callers can keep side indexes over the keys in step.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        on_evict: Optional[Callable[[Hashable], None]] = None,
+    ):
+        self._max_size = max_size
+        self._on_evict = on_evict
+        self._entries: OrderedDict[Hashable, Tuple[ValueT, float]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get(self, key: Hashable) -> Optional[ValueT]:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self._misses += 1
+            return None
+
+        value, expires_at = entry
+
+        if expires_at <= time.time():
+            del self._entries[key]
+            self._misses += 1
+            self._notify_evicted(key)
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+
+        return value
+
+    def set(self, key: Hashable, value: ValueT, expires_at: float) -> bool:
+        if self._max_size <= 0 or expires_at <= time.time():
+            return False
+
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            evicted_key, _ = self._entries.popitem(last=False)
+            self._evictions += 1
+            self._notify_evicted(evicted_key)
+
+        return True
+
+    def invalidate(self, key: Hashable) -> None:
+        if self._entries.pop(key, None) is not None:
+            self._invalidations += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _notify_evicted(self, key: Hashable) -> None:
+        if self._on_evict is not None:
+            self._on_evict(key)
+
+    def get_metrics(self) -> CacheMetricsDTO:
+        return CacheMetricsDTO(
+            max_size=self._max_size,
+            size=len(self._entries),
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            invalidations=self._invalidations,
+        )
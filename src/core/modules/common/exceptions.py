@@ -19,3 +19,8 @@ class ObjectAlreadyExists(BaseHttpException):
 class PermissionDenied(BaseHttpException):
     status_code = HTTPStatus.FORBIDDEN
     detail = "Permission denied"
+
+
+class ServiceOverloaded(BaseHttpException):
+    status_code = HTTPStatus.SERVICE_UNAVAILABLE
+    detail = "Service is overloaded, try again later"
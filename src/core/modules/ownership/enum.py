@@ -0,0 +1,8 @@
+from enum import StrEnum
+
+
+class OwnedResource(StrEnum):
+    WALLET = "wallet"
+    SUBJECT = "subject"
+    CATEGORY = "category"
+    TRANSACTION = "transaction"
@@ -0,0 +1,45 @@
+from collections import defaultdict
+from typing import Dict, List, Sequence, Tuple, Type
+
+from sqlalchemy import Select, CompoundSelect, literal, select, union_all
+
+from backend.src.core.modules.category.model import Category
+from backend.src.core.modules.ownership.enum import OwnedResource
+from backend.src.core.modules.subject.model import Subject
+from backend.src.core.modules.transaction.model import Transaction
+from backend.src.core.modules.wallet.model import Wallet
+from backend.src.database.base import BaseModel
+
+OWNED_MODELS: Dict[OwnedResource, Type[BaseModel]] = {
+    OwnedResource.WALLET: Wallet,
+    OwnedResource.SUBJECT: Subject,
+    OwnedResource.CATEGORY: Category,
+    OwnedResource.TRANSACTION: Transaction,
+}
+
+
+def build_owner_query(
+    identifiers: Sequence[Tuple[OwnedResource, int]],
+) -> Select | CompoundSelect:
+    """
+    Returns resource, id and user_id of every requested object, one SELECT
+    per resource type glued together with UNION ALL.
+    """
+    ids_by_resource: Dict[OwnedResource, List[int]] = defaultdict(list)
+
+    for resource, object_id in identifiers:
+        ids_by_resource[resource].append(object_id)
+
+    queries = [
+        select(
+            literal(resource.value).label("resource"),
+            OWNED_MODELS[resource].id.label("id"),
+            OWNED_MODELS[resource].user_id.label("user_id"),
+        ).where(OWNED_MODELS[resource].id.in_(object_ids))
+        for resource, object_ids in ids_by_resource.items()
+    ]
+
+    if len(queries) == 1:
+        return queries[0]
+
+    return union_all(*queries)
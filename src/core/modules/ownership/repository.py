@@ -0,0 +1,24 @@
+from typing import Dict, Sequence, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.src.core.modules.ownership.enum import OwnedResource
+from backend.src.core.modules.ownership.queries import build_owner_query
+from backend.src.core.modules.ownership.repository_interface import (
+    OwnershipRepositoryInterface,
+)
+
+
+class OwnershipRepository(OwnershipRepositoryInterface):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def get_owner_ids(
+        self, identifiers: Sequence[Tuple[OwnedResource, int]]
+    ) -> Dict[Tuple[OwnedResource, int], int]:
+        if not identifiers:
+            return {}
+
+        result = await self._session.execute(build_owner_query(identifiers))
+
+        return {(OwnedResource(row.resource), row.id): row.user_id for row in result}
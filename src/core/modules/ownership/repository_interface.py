@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Sequence, Tuple
+
+from backend.src.core.modules.ownership.enum import OwnedResource
+
+
+class OwnershipRepositoryInterface(ABC):
+    @abstractmethod
+    async def get_owner_ids(
+        self, identifiers: Sequence[Tuple[OwnedResource, int]]
+    ) -> Dict[Tuple[OwnedResource, int], int]:
+        pass
@@ -0,0 +1,35 @@
+from typing import Sequence, Tuple
+
+from backend.src.core.modules.common.exceptions import (
+    ObjectDoesNotExist,
+    PermissionDenied,
+)
+from backend.src.core.modules.ownership.enum import OwnedResource
+from backend.src.core.modules.ownership.repository_interface import (
+    OwnershipRepositoryInterface,
+)
+
+
+class OwnershipValidator:
+    def __init__(self, repository: OwnershipRepositoryInterface):
+        self._repository = repository
+
+    async def user_is_owner(
+        self,
+        user_id: int,
+        identifiers: Sequence[Tuple[OwnedResource, int]],
+    ) -> None:
+        """
+        Identifiers are checked in the given order, so the first missing or
+        foreign object decides between 404 and 403.
+        """
+        owner_ids = await self._repository.get_owner_ids(identifiers)
+
+        for identifier in identifiers:
+            owner_id = owner_ids.get(identifier)
+
+            if owner_id is None:
+                raise ObjectDoesNotExist()
+
+            if owner_id != user_id:
+                raise PermissionDenied()
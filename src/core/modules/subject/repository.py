@@ -4,6 +4,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from backend.src.database.integrity import unique_constraint_guard
 from backend.src.core.modules.subject.repository_interface import (
     SubjectRepositoryInterface,
 )
@@ -16,19 +17,21 @@ class SubjectRepository(SubjectRepositoryInterface):
 
     async def save(self, subject: Subject) -> Subject:
         self._session.add(subject)
-        await self._session.commit()
+
+        async with unique_constraint_guard(self._session):
+            await self._session.flush()
 
         return subject
 
     async def update(self, subject: Subject) -> Subject:
-        await self._session.commit()
-        await self._session.refresh(subject)
+        async with unique_constraint_guard(self._session):
+            await self._session.flush()
 
         return subject
 
     async def delete(self, subject: Subject) -> None:
         await self._session.delete(subject)
-        await self._session.commit()
+        await self._session.flush()
 
     async def get_by_user_id(self, user_id: int) -> Sequence[Subject]:
         result = await self._session.execute(
@@ -47,12 +50,3 @@ class SubjectRepository(SubjectRepositoryInterface):
         )
 
         return result.scalars().first()
-
-    async def get_by_name_and_user_id(self, name: str, user_id: int) -> Subject | None:
-        result = await self._session.execute(
-            select(Subject)
-            .where((Subject.name == name) & (Subject.user_id == user_id))
-            .options(selectinload(Subject.user))
-        )
-
-        return result.scalars().first()
@@ -24,7 +24,3 @@ class SubjectRepositoryInterface(ABC):
     @abstractmethod
     async def get_by_id(self, subject_id: int) -> Subject | None:
         pass
-
-    @abstractmethod
-    async def get_by_name_and_user_id(self, name: str, user_id: int) -> Subject | None:
-        pass
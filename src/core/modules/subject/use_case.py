@@ -1,3 +1,5 @@
+from typing import Dict
+
 from backend.src.core.modules.subject.repository_interface import (
     SubjectRepositoryInterface,
 )
@@ -8,11 +10,17 @@ from backend.src.core.modules.subject.model import Subject
 class SubjectRetrievalUseCase:
     def __init__(self, repository: SubjectRepositoryInterface):
         self._repository = repository
+        self._loaded: Dict[int, Subject] = {}
 
     async def get_by_id(self, subject_id: int) -> Subject:
+        if subject_id in self._loaded:
+            return self._loaded[subject_id]
+
         subject = await self._repository.get_by_id(subject_id)
 
         if subject is None:
             raise ObjectDoesNotExist()
 
+        self._loaded[subject_id] = subject
+
         return subject
@@ -1,11 +1,60 @@
-from sqlalchemy import select
+from typing import Optional
+
+from sqlalchemy import select, or_, and_
 
 from backend.src.core.modules.transaction.builders.base import (
     TransactionBaseQueryBuilder,
 )
 from backend.src.core.modules.transaction.model import Transaction
+from backend.src.core.modules.transaction.schemas.transaction import (
+    TransactionCursorDTO,
+)
 
 
 class TransactionFetchQueryBuilder(TransactionBaseQueryBuilder):
     def _set_base_query(self):
         return select(Transaction)
+
+    def apply_list_item_projection(
+        self, include_description: bool
+    ) -> "TransactionFetchQueryBuilder":
+        columns = [
+            Transaction.id,
+            Transaction.name,
+            Transaction.value,
+            Transaction.type,
+            Transaction.date,
+            Transaction.created_at,
+            Transaction.updated_at,
+        ]
+
+        if include_description:
+            columns.append(Transaction.description)
+
+        self.query = self.query.with_only_columns(*columns)
+
+        return self
+
+    def apply_cursor_filter(
+        self, cursor: Optional[TransactionCursorDTO]
+    ) -> "TransactionFetchQueryBuilder":
+        if cursor is not None:
+            self._apply_filter(
+                or_(
+                    Transaction.date < cursor.date,
+                    and_(Transaction.date == cursor.date, Transaction.id < cursor.id),
+                )
+            )
+
+        return self
+
+    def apply_keyset_pagination(self, limit: int) -> "TransactionFetchQueryBuilder":
+        """
+        Orders newest first and fetches one extra row, which tells whether
+        a next page exists without a separate count query.
+        """
+        self.query = self.query.order_by(
+            Transaction.date.desc(), Transaction.id.desc()
+        ).limit(limit + 1)
+
+        return self
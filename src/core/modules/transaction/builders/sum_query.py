@@ -1,11 +1,47 @@
-from sqlalchemy import select, func
+from sqlalchemy import select, func, case, and_, Select, ColumnElement
 
 from backend.src.core.modules.transaction.builders.base import (
     TransactionBaseQueryBuilder,
 )
+from backend.src.core.modules.transaction.enum import TransactionType
 from backend.src.core.modules.transaction.model import Transaction
 
 
 class TransactionValueSumQueryBuilder(TransactionBaseQueryBuilder):
-    def _set_base_query(self):
-        return select(func.sum(Transaction.value))  # pylint: disable=E1102
+    """
+    Builds one statement which returns incomes, expenses, transfer incomes and
+    transfer expenses as separate conditional sums.
+    """
+
+    def _set_base_query(self) -> Select:
+        return select(
+            self._conditional_sum(TransactionType.INCOME, False).label("incomes"),
+            self._conditional_sum(TransactionType.EXPENSE, False).label("expenses"),
+            self._conditional_sum(TransactionType.INCOME, True).label(
+                "transfer_incomes"
+            ),
+            self._conditional_sum(TransactionType.EXPENSE, True).label(
+                "transfer_expenses"
+            ),
+        )
+
+    @staticmethod
+    def _conditional_sum(
+        transaction_type: TransactionType, is_transfer: bool
+    ) -> ColumnElement:
+        # pylint: disable=E1102
+        return func.coalesce(
+            func.sum(
+                case(
+                    (
+                        and_(
+                            Transaction.type == transaction_type,
+                            Transaction.is_transfer == is_transfer,
+                        ),
+                        Transaction.value,
+                    ),
+                    else_=0,
+                )
+            ),
+            0,
+        )
@@ -0,0 +1,24 @@
+import binascii
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import date
+
+from backend.src.core.modules.transaction.exceptions import InvalidCursor
+from backend.src.core.modules.transaction.schemas.transaction import (
+    TransactionCursorDTO,
+    TransactionListItemDTO,
+)
+
+
+def encode_cursor(transaction: TransactionListItemDTO) -> str:
+    raw_cursor = f"{transaction.date.isoformat()}:{transaction.id}"
+
+    return urlsafe_b64encode(raw_cursor.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> TransactionCursorDTO:
+    try:
+        raw_date, raw_id = urlsafe_b64decode(cursor.encode()).decode().split(":")
+
+        return TransactionCursorDTO(date=date.fromisoformat(raw_date), id=int(raw_id))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exception:
+        raise InvalidCursor() from exception
@@ -4,3 +4,19 @@ from enum import StrEnum
 class TransactionType(StrEnum):
     INCOME = "income"
     EXPENSE = "expense"
+
+
+class TransactionExportFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class BalanceSeriesBucket(StrEnum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
+class StatisticsScope(StrEnum):
+    USER = "user"
+    WALLET = "wallet"
@@ -0,0 +1,8 @@
+from http import HTTPStatus
+
+from backend.src.core.modules.common.exceptions import BaseHttpException
+
+
+class InvalidCursor(BaseHttpException):
+    status_code = HTTPStatus.UNPROCESSABLE_ENTITY
+    detail = "Invalid pagination cursor"
@@ -11,6 +11,7 @@ from sqlalchemy import (
     Integer,
     UniqueConstraint,
     Boolean,
+    Index,
 )
 from sqlalchemy.orm import MappedColumn, mapped_column, relationship
 
@@ -27,6 +28,23 @@ class Transaction(BaseModel):
             "date",
             name="unique_name_wallet_date",
         ),
+        Index(
+            "ix_transactions_wallet_id_date",
+            "wallet_id",
+            "date",
+            "is_transfer",
+            "type",
+            "value",
+        ),
+        Index(
+            "ix_transactions_user_id_date",
+            "user_id",
+            "date",
+            "is_transfer",
+            "type",
+            "value",
+        ),
+        Index("ix_transactions_subject_id_date", "subject_id", "date"),
     )
 
     name: MappedColumn[str] = mapped_column(String(50))
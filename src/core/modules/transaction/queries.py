@@ -1,23 +1,39 @@
-from datetime import datetime
-from typing import Optional
+from datetime import date
+from decimal import Decimal
+from typing import Optional, Union
 
-from sqlalchemy import Select
+from sqlalchemy import (
+    DECIMAL,
+    ColumnElement,
+    Date,
+    Select,
+    case,
+    cast,
+    func,
+    literal,
+    literal_column,
+    select,
+)
+from sqlalchemy.orm import InstrumentedAttribute
 
-from backend.src.core.modules.transaction.builders.sum_query import TransactionValueSumQueryBuilder
-from backend.src.core.modules.transaction.enum import TransactionType
+from backend.src.core.modules.transaction.builders.sum_query import (
+    TransactionValueSumQueryBuilder,
+)
+from backend.src.core.modules.transaction.enum import (
+    BalanceSeriesBucket,
+    TransactionType,
+)
+from backend.src.core.modules.transaction.model import Transaction
+from backend.src.core.modules.transaction.schemas.statistic import BalanceSeriesQueryDTO
 
 
 def build_sum_query_with_wallet_id(
     wallet_id: int,
-    transaction_type: TransactionType,
-    is_transfer: bool,
-    start_date: Optional[datetime] = None,
-    end_date: Optional[datetime] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
 ) -> Select:
     return (
         TransactionValueSumQueryBuilder()
-        .apply_transaction_type_filter(transaction_type)
-        .apply_is_transfer_filter(is_transfer)
         .apply_wallet_id_filter(wallet_id)
         .apply_start_date_filter(start_date)
         .apply_end_date_filter(end_date)
@@ -27,17 +43,63 @@ def build_sum_query_with_wallet_id(
 
 def build_sum_query_with_user_id(
     user_id: int,
-    transaction_type: TransactionType,
-    is_transfer: bool,
-    start_date: Optional[datetime] = None,
-    end_date: Optional[datetime] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
 ) -> Select:
     return (
         TransactionValueSumQueryBuilder()
-        .apply_transaction_type_filter(transaction_type)
-        .apply_is_transfer_filter(is_transfer)
         .apply_user_id_filter(user_id)
         .apply_start_date_filter(start_date)
         .apply_end_date_filter(end_date)
         .build()
     )
+
+
+def build_balance_series_query(
+    wallet_id: int, query_dto: BalanceSeriesQueryDTO, opening_balance: Decimal
+) -> Select:
+    """
+    Sums signed values per bucket over one range scan of the (wallet_id, date)
+    index, then turns the bucket deltas into running balances with a window sum
+    seeded by the balance before start_date. Points are dated by the start of
+    their bucket, clamped to start_date for a bucket that began before it.
+    """
+    bucket = _get_bucket_expression(query_dto.bucket).label("date")
+    signed_value = case(
+        (Transaction.type == TransactionType.INCOME, Transaction.value),
+        else_=-Transaction.value,
+    )
+    deltas = (
+        select(bucket, func.sum(signed_value).label("delta"))
+        .where(
+            Transaction.wallet_id == wallet_id,
+            Transaction.date >= query_dto.start_date,
+            Transaction.date <= query_dto.end_date,
+        )
+        .group_by(bucket)
+        .subquery()
+    )
+
+    return select(
+        func.greatest(deltas.c.date, cast(query_dto.start_date, Date)).label("date"),
+        (
+            literal(opening_balance, DECIMAL(14, 2))
+            + func.sum(deltas.c.delta).over(order_by=deltas.c.date)
+        ).label("balance"),
+    ).order_by(deltas.c.date)
+
+
+def _get_bucket_expression(
+    bucket: BalanceSeriesBucket,
+) -> Union[ColumnElement, InstrumentedAttribute]:
+    if bucket == BalanceSeriesBucket.WEEK:
+        return func.subdate(Transaction.date, func.weekday(Transaction.date))
+
+    if bucket == BalanceSeriesBucket.MONTH:
+        # The offset is inlined, a bound parameter would make the SELECT and
+        # GROUP BY expressions differ under ONLY_FULL_GROUP_BY.
+        return func.subdate(
+            Transaction.date, func.dayofmonth(Transaction.date) - literal_column("1")
+        )
+
+    return Transaction.date
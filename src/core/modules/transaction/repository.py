@@ -1,27 +1,36 @@
-import asyncio
-from datetime import date, datetime
+from datetime import date
 from decimal import Decimal
-from typing import Sequence, Optional
+from typing import AsyncIterator, Sequence, Optional
 
 from sqlalchemy import select, Select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from backend.src.database.integrity import unique_constraint_guard
 from backend.src.core.modules.transaction.builders.fetch_query import (
     TransactionFetchQueryBuilder,
 )
-from backend.src.core.modules.transaction.enum import TransactionType
 from backend.src.core.modules.transaction.model import Transaction
 from backend.src.core.modules.transaction.repository_interface import (
     TransactionRepositoryInterface,
 )
+from backend.src.core.modules.transaction.schemas.statistic import (
+    BalancePointDTO,
+    BalanceSeriesQueryDTO,
+)
 from backend.src.core.modules.transaction.schemas.transaction import (
+    TransactionListItemDTO,
+    TransactionListQueryDTO,
     TransactionValueSumDTO,
 )
 from backend.src.core.modules.transaction.queries import (
-    build_sum_query_with_wallet_id, build_sum_query_with_user_id
+    build_balance_series_query,
+    build_sum_query_with_wallet_id,
+    build_sum_query_with_user_id,
 )
 
+STREAM_BATCH_SIZE = 1000
+
 
 class TransactionRepository(TransactionRepositoryInterface):
     def __init__(self, session: AsyncSession):
@@ -29,19 +38,21 @@ class TransactionRepository(TransactionRepositoryInterface):
 
     async def save(self, transaction: Transaction) -> Transaction:
         self._session.add(transaction)
-        await self._session.commit()
+
+        async with unique_constraint_guard(self._session):
+            await self._session.flush()
 
         return transaction
 
     async def update(self, transaction: Transaction) -> Transaction:
-        await self._session.commit()
-        await self._session.refresh(transaction)
+        async with unique_constraint_guard(self._session):
+            await self._session.flush()
 
         return transaction
 
     async def delete(self, transaction: Transaction) -> None:
         await self._session.delete(transaction)
-        await self._session.commit()
+        await self._session.flush()
 
     async def get_all(self) -> Sequence[Transaction]:
         result = await self._session.execute(
@@ -59,125 +70,141 @@ class TransactionRepository(TransactionRepositoryInterface):
 
         return result.scalars().first()
 
-    async def get_by_name_and_wallet_and_type(
-        self, name: str, wallet_id: int, transaction_date: date
-    ) -> Transaction | None:
-        query = (
-            TransactionFetchQueryBuilder()
-            .apply_name_filter(name)
-            .apply_wallet_id_filter(wallet_id)
-            .apply_date_filter(transaction_date)
-            .build()
+    async def get_by_id_for_update(self, transaction_id: int) -> Transaction | None:
+        """
+        A locking read sees the latest committed row rather than the request
+        snapshot; populate_existing refreshes an instance loaded earlier.
+        """
+        result = await self._session.execute(
+            self._load_related_models(
+                select(Transaction).where(Transaction.id == transaction_id)
+            )
+            .with_for_update()
+            .execution_options(populate_existing=True)
         )
 
-        result = await self._session.execute(self._load_related_models(query))
-
         return result.scalars().first()
 
     async def get_by_user_id(
         self,
         user_id: int,
-        start_date: Optional[date] = None,
-        end_date: Optional[date] = None,
-    ) -> Sequence[Transaction]:
+        list_query: TransactionListQueryDTO,
+    ) -> Sequence[TransactionListItemDTO]:
         query = (
             TransactionFetchQueryBuilder()
+            .apply_list_item_projection(list_query.include_description)
+            .apply_keyset_pagination(list_query.limit)
+            .apply_cursor_filter(list_query.cursor)
             .apply_user_id_filter(user_id)
-            .apply_start_date_filter(start_date)
-            .apply_end_date_filter(end_date)
+            .apply_start_date_filter(list_query.start_date)
+            .apply_end_date_filter(list_query.end_date)
             .build()
         )
 
-        result = await self._session.execute(self._load_related_models(query))
+        result = await self._session.execute(query)
 
-        return result.scalars().all()
+        return [TransactionListItemDTO(**row._asdict()) for row in result]
 
     async def get_by_wallet_id(
-        self, wallet_id: int, start_date: Optional[date], end_date: Optional[date]
-    ) -> Sequence[Transaction]:
+        self,
+        wallet_id: int,
+        list_query: TransactionListQueryDTO,
+    ) -> Sequence[TransactionListItemDTO]:
         query = (
             TransactionFetchQueryBuilder()
+            .apply_list_item_projection(list_query.include_description)
+            .apply_keyset_pagination(list_query.limit)
+            .apply_cursor_filter(list_query.cursor)
             .apply_wallet_id_filter(wallet_id)
-            .apply_start_date_filter(start_date)
-            .apply_end_date_filter(end_date)
+            .apply_start_date_filter(list_query.start_date)
+            .apply_end_date_filter(list_query.end_date)
             .build()
         )
 
-        result = await self._session.execute(self._load_related_models(query))
+        result = await self._session.execute(query)
 
-        return result.scalars().all()
+        return [TransactionListItemDTO(**row._asdict()) for row in result]
 
     async def get_by_subject_id(
-        self, subject_id: int, start_date: Optional[date], end_date: Optional[date]
-    ) -> Sequence[Transaction]:
+        self,
+        subject_id: int,
+        list_query: TransactionListQueryDTO,
+    ) -> Sequence[TransactionListItemDTO]:
         query = (
             TransactionFetchQueryBuilder()
+            .apply_list_item_projection(list_query.include_description)
+            .apply_keyset_pagination(list_query.limit)
+            .apply_cursor_filter(list_query.cursor)
             .apply_subject_id_filter(subject_id)
+            .apply_start_date_filter(list_query.start_date)
+            .apply_end_date_filter(list_query.end_date)
+            .build()
+        )
+
+        result = await self._session.execute(query)
+
+        return [TransactionListItemDTO(**row._asdict()) for row in result]
+
+    def stream_by_user_id(
+        self,
+        user_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> AsyncIterator[Transaction]:
+        query = (
+            TransactionFetchQueryBuilder()
+            .apply_user_id_filter(user_id)
             .apply_start_date_filter(start_date)
             .apply_end_date_filter(end_date)
             .build()
+            .order_by(Transaction.date, Transaction.id)
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
         )
 
-        result = await self._session.execute(self._load_related_models(query))
-
-        return result.scalars().all()
+        return self._stream(query)
 
     async def get_sum_values_by_user_id(
         self,
         user_id: int,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
     ) -> TransactionValueSumDTO:
-        income_query = build_sum_query_with_user_id(
-            user_id, TransactionType.INCOME, False, start_date, end_date
-        )
-        expense_query = build_sum_query_with_user_id(
-            user_id, TransactionType.EXPENSE, False, start_date, end_date
+        result = await self._execute_sum_query(
+            build_sum_query_with_user_id(user_id, start_date, end_date)
         )
 
-        incomes, expenses = await asyncio.gather(
-            self._execute_sum_query(income_query),
-            self._execute_sum_query(expense_query),
-        )
-
-        return TransactionValueSumDTO(incomes=incomes, expenses=expenses)
+        return TransactionValueSumDTO(incomes=result.incomes, expenses=result.expenses)
 
     async def get_sum_values_by_wallet_id(
         self,
         wallet_id: int,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
     ) -> TransactionValueSumDTO:
-        income_query = build_sum_query_with_wallet_id(
-            wallet_id, TransactionType.INCOME, False, start_date, end_date
-        )
-        expense_query = build_sum_query_with_wallet_id(
-            wallet_id, TransactionType.EXPENSE, False, start_date, end_date
-        )
-        transfer_income_query = build_sum_query_with_wallet_id(
-            wallet_id, TransactionType.INCOME, True, start_date, end_date
-        )
-        transfer_expense_query = build_sum_query_with_wallet_id(
-            wallet_id, TransactionType.EXPENSE, True, start_date, end_date
+        return await self._execute_sum_query(
+            build_sum_query_with_wallet_id(wallet_id, start_date, end_date)
         )
 
-        incomes, expenses, transfer_income, transfer_expense = await asyncio.gather(
-            self._execute_sum_query(income_query),
-            self._execute_sum_query(expense_query),
-            self._execute_sum_query(transfer_income_query),
-            self._execute_sum_query(transfer_expense_query),
+    async def get_balance_series_by_wallet_id(
+        self,
+        wallet_id: int,
+        query_dto: BalanceSeriesQueryDTO,
+        opening_balance: Decimal,
+    ) -> Sequence[BalancePointDTO]:
+        result = await self._session.execute(
+            build_balance_series_query(wallet_id, query_dto, opening_balance)
         )
 
-        return TransactionValueSumDTO(
-            incomes=incomes,
-            expenses=expenses,
-            transfer_incomes=transfer_income,
-            transfer_expenses=transfer_expense,
-        )
+        return [BalancePointDTO(**row._asdict()) for row in result]
+
+    async def _stream(self, query: Select) -> AsyncIterator[Transaction]:
+        async for transaction in await self._session.stream_scalars(query):
+            yield transaction
 
-    async def _execute_sum_query(self, query: Select) -> Decimal:
+    async def _execute_sum_query(self, query: Select) -> TransactionValueSumDTO:
         result = await self._session.execute(query)
-        return result.scalar() or Decimal("0.0")
+
+        return TransactionValueSumDTO(**result.one()._asdict())
 
     def _load_related_models(self, query: Select) -> Select:
         return query.options(
@@ -1,9 +1,16 @@
 from abc import abstractmethod, ABC
-from datetime import datetime, date
-from typing import Optional, Sequence
+from datetime import date
+from decimal import Decimal
+from typing import AsyncIterator, Optional, Sequence
 
 from backend.src.core.modules.transaction.model import Transaction
+from backend.src.core.modules.transaction.schemas.statistic import (
+    BalancePointDTO,
+    BalanceSeriesQueryDTO,
+)
 from backend.src.core.modules.transaction.schemas.transaction import (
+    TransactionListItemDTO,
+    TransactionListQueryDTO,
     TransactionValueSumDTO,
 )
 
@@ -30,38 +37,48 @@ class TransactionRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    async def get_by_name_and_wallet_and_type(
-        self, name: str, wallet_id: int, transaction_date: date
-    ) -> Transaction | None:
+    async def get_by_id_for_update(self, transaction_id: int) -> Transaction | None:
         pass
 
     @abstractmethod
     async def get_by_user_id(
         self,
         user_id: int,
-        start_date: Optional[date] = None,
-        end_date: Optional[date] = None,
-    ) -> Sequence[Transaction]:
+        list_query: TransactionListQueryDTO,
+    ) -> Sequence[TransactionListItemDTO]:
         pass
 
     @abstractmethod
     async def get_by_wallet_id(
-        self, wallet_id: int, start_date: Optional[date], end_date: Optional[date]
-    ) -> Sequence[Transaction]:
+        self,
+        wallet_id: int,
+        list_query: TransactionListQueryDTO,
+    ) -> Sequence[TransactionListItemDTO]:
         pass
 
     @abstractmethod
     async def get_by_subject_id(
-        self, subject_id: int, start_date: Optional[date], end_date: Optional[date]
-    ) -> Sequence[Transaction]:
+        self,
+        subject_id: int,
+        list_query: TransactionListQueryDTO,
+    ) -> Sequence[TransactionListItemDTO]:
+        pass
+
+    @abstractmethod
+    def stream_by_user_id(
+        self,
+        user_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> AsyncIterator[Transaction]:
         pass
 
     @abstractmethod
     async def get_sum_values_by_user_id(
         self,
         user_id: int,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
     ) -> TransactionValueSumDTO:
         pass
 
@@ -69,7 +86,16 @@ class TransactionRepositoryInterface(ABC):
     async def get_sum_values_by_wallet_id(
         self,
         wallet_id: int,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
     ) -> TransactionValueSumDTO:
         pass
+
+    @abstractmethod
+    async def get_balance_series_by_wallet_id(
+        self,
+        wallet_id: int,
+        query_dto: BalanceSeriesQueryDTO,
+        opening_balance: Decimal,
+    ) -> Sequence[BalancePointDTO]:
+        pass
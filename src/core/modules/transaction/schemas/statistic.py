@@ -1,8 +1,11 @@
+from datetime import date
 from decimal import Decimal
-from typing import Optional, Dict
+from typing import Optional, Dict, Sequence
 
 from pydantic import BaseModel
 
+from backend.src.core.modules.transaction.enum import BalanceSeriesBucket
+
 
 class TransactionStatisticDTO(BaseModel):
     balance: Decimal = Decimal(0)
@@ -14,3 +17,22 @@ class TransactionStatisticDTO(BaseModel):
 class TransactionStatisticsDTO(BaseModel):
     total: TransactionStatisticDTO
     monthly: Dict[str, TransactionStatisticDTO]
+
+
+class BalanceSeriesQueryDTO(BaseModel):
+    start_date: date
+    end_date: date
+    bucket: BalanceSeriesBucket
+
+    class ConfigDict:
+        frozen = True
+
+
+class BalancePointDTO(BaseModel):
+    date: date
+    balance: Decimal
+
+
+class BalanceSeriesDTO(BaseModel):
+    opening_balance: Decimal
+    points: Sequence[BalancePointDTO]
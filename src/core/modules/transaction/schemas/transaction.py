@@ -1,6 +1,6 @@
-from datetime import date
+from datetime import date, datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Optional, Sequence
 
 from pydantic import BaseModel
 
@@ -37,3 +37,49 @@ class TransactionValueSumDTO(BaseModel):
     expenses: Decimal
     transfer_incomes: Optional[Decimal] = None
     transfer_expenses: Optional[Decimal] = None
+
+
+class TransactionMonthlyValueSumDTO(TransactionValueSumDTO):
+    year: int
+    month: int
+
+
+class TransactionCursorDTO(BaseModel):
+    date: date
+    id: int
+
+    class ConfigDict:
+        frozen = True
+
+
+class TransactionListQueryDTO(BaseModel):
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    limit: int
+    cursor: Optional[TransactionCursorDTO] = None
+    include_description: bool = False
+
+    class ConfigDict:
+        frozen = True
+
+
+class TransactionListItemDTO(BaseModel):
+    id: int
+    name: str
+    value: Decimal
+    type: TransactionType
+    description: Optional[str] = None
+    date: date
+    created_at: datetime
+    updated_at: datetime
+
+    class ConfigDict:
+        frozen = True
+
+
+class TransactionPageDTO(BaseModel):
+    items: Sequence[TransactionListItemDTO]
+    next_cursor: Optional[str] = None
+
+    class ConfigDict:
+        frozen = True
@@ -1,9 +1,4 @@
-from datetime import date
-from typing import Optional
-
-from backend.src.core.modules.common.exceptions import (
-    ObjectAlreadyExists,
-)
+from backend.src.database.unit_of_work import UnitOfWorkInterface
 from backend.src.core.modules.transaction.model import Transaction
 from backend.src.core.modules.transaction.repository import TransactionRepository
 from backend.src.core.modules.transaction.schemas.transaction import (
@@ -11,6 +6,7 @@ from backend.src.core.modules.transaction.schemas.transaction import (
     TransactionUpdateDTO,
 )
 from backend.src.core.modules.transaction.use_case import TransactionRetrievalUseCase
+from backend.src.core.modules.wallet_summary.use_case import WalletSummaryUseCase
 
 
 class TransactionService:
@@ -18,62 +14,60 @@ class TransactionService:
         self,
         repository: TransactionRepository,
         retrieval_use_case: TransactionRetrievalUseCase,
+        unit_of_work: UnitOfWorkInterface,
+        wallet_summary_use_case: WalletSummaryUseCase,
     ):
         self._repository = repository
         self._retrieval_use_case = retrieval_use_case
+        self._unit_of_work = unit_of_work
+        self._wallet_summary_use_case = wallet_summary_use_case
 
     async def create(
         self, wallet_id: int, user_id: int, request_dto: TransactionCreateDTO
     ) -> Transaction:
-        if await self._check_constraint_blockade(
-            request_dto.name, request_dto.date, wallet_id
-        ):
-            raise ObjectAlreadyExists()
-
         transaction = Transaction(
             **request_dto.model_dump(), wallet_id=wallet_id, user_id=user_id
         )
 
-        return await self._repository.save(transaction)
+        await self._wallet_summary_use_case.lock_wallets(wallet_id)
+        transaction = await self._repository.save(transaction)
+        await self._wallet_summary_use_case.record_created(transaction)
+        await self._unit_of_work.commit()
+
+        return transaction
 
     async def update(
         self, transaction_id: int, request_dto: TransactionUpdateDTO
     ) -> Transaction:
-        transaction = await self.get_by_id(transaction_id)
-
-        if await self._check_constraint_blockade(
-            request_dto.name, request_dto.date, transaction.wallet_id, transaction_id
-        ):
-            raise ObjectAlreadyExists()
+        transaction = await self._lock(transaction_id)
+        previous_delta = self._wallet_summary_use_case.to_delta(transaction, sign=-1)
 
         for key, value in request_dto.model_dump().items():
             setattr(transaction, key, value)
 
-        return await self._repository.update(transaction)
+        transaction = await self._repository.update(transaction)
+        await self._wallet_summary_use_case.record_updated(previous_delta, transaction)
+        await self._unit_of_work.commit()
+
+        return transaction
 
     async def delete(self, transaction_id: int) -> None:
-        transaction = await self.get_by_id(transaction_id)
+        transaction = await self._lock(transaction_id)
 
-        return await self._repository.delete(transaction)
+        await self._repository.delete(transaction)
+        await self._wallet_summary_use_case.record_deleted(transaction)
+        await self._unit_of_work.commit()
 
     async def get_by_id(self, transaction_id: int) -> Transaction:
         return await self._retrieval_use_case.get_by_id(transaction_id)
 
-    async def _check_constraint_blockade(
-        self,
-        name: str,
-        transaction_date: date,
-        wallet_id: int,
-        excluded_id: Optional[int] = None,
-    ) -> bool:
-        transaction = await self._repository.get_by_name_and_wallet_and_type(
-            name, wallet_id, transaction_date
-        )
-
-        if transaction is None:
-            return False
-
-        if transaction.id == excluded_id:
-            return False
+    async def _lock(self, transaction_id: int) -> Transaction:
+        """
+        Locks the wallet before the transaction row, the order inserts use too,
+        and re-reads the row under its lock so the summary and totals deltas
+        start from its committed values; a row deleted meanwhile is a 404.
+        """
+        transaction = await self.get_by_id(transaction_id)
+        await self._wallet_summary_use_case.lock_wallets(transaction.wallet_id)
 
-        return True
+        return await self._retrieval_use_case.get_by_id_for_update(transaction_id)
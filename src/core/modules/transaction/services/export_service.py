@@ -0,0 +1,87 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, AsyncIterator, Dict, Optional
+
+from backend.src.core.modules.transaction.enum import TransactionExportFormat
+from backend.src.core.modules.transaction.model import Transaction
+from backend.src.core.modules.transaction.repository import TransactionRepository
+
+EXPORT_FIELDS = (
+    "id",
+    "name",
+    "value",
+    "type",
+    "description",
+    "date",
+    "is_transfer",
+    "wallet_id",
+    "subject_id",
+    "category_id",
+    "created_at",
+    "updated_at",
+)
+
+
+class TransactionExportService:
+    """
+    Serializes transactions row by row while they are streamed from the
+    database, so memory use does not depend on the size of the export.
+    """
+
+    def __init__(self, repository: TransactionRepository):
+        self._repository = repository
+
+    def export_user_transactions(
+        self,
+        user_id: int,
+        export_format: TransactionExportFormat,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> AsyncIterator[str]:
+        transactions = self._repository.stream_by_user_id(user_id, start_date, end_date)
+
+        if export_format == TransactionExportFormat.CSV:
+            return self._to_csv(transactions)
+
+        return self._to_ndjson(transactions)
+
+    async def _to_ndjson(
+        self, transactions: AsyncIterator[Transaction]
+    ) -> AsyncIterator[str]:
+        async for transaction in transactions:
+            yield json.dumps(self._serialize(transaction)) + "\n"
+
+    async def _to_csv(
+        self, transactions: AsyncIterator[Transaction]
+    ) -> AsyncIterator[str]:
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+        writer.writeheader()
+
+        async for transaction in transactions:
+            writer.writerow(self._serialize(transaction))
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+
+        if buffer.tell():
+            yield buffer.getvalue()
+
+    @staticmethod
+    def _serialize(transaction: Transaction) -> Dict[str, Any]:
+        row = {}
+
+        for field in EXPORT_FIELDS:
+            value = getattr(transaction, field)
+
+            if isinstance(value, (date, datetime)):
+                value = value.isoformat()
+            elif isinstance(value, Decimal):
+                value = str(value)
+
+            row[field] = value
+
+        return row
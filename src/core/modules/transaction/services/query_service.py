@@ -1,8 +1,12 @@
-from datetime import date
-from typing import Optional, Sequence
+from typing import Sequence
 
-from backend.src.core.modules.transaction.model import Transaction
+from backend.src.core.modules.transaction.cursor import encode_cursor
 from backend.src.core.modules.transaction.repository import TransactionRepository
+from backend.src.core.modules.transaction.schemas.transaction import (
+    TransactionListItemDTO,
+    TransactionListQueryDTO,
+    TransactionPageDTO,
+)
 
 
 class TransactionQueryService:
@@ -10,27 +14,33 @@ class TransactionQueryService:
         self._repository = repository
 
     async def get_user_transactions(
-        self,
-        user_id: int,
-        start_date: Optional[date] = None,
-        end_date: Optional[date] = None,
-    ) -> Sequence[Transaction]:
-        return await self._repository.get_by_user_id(user_id, start_date, end_date)
+        self, user_id: int, list_query: TransactionListQueryDTO
+    ) -> TransactionPageDTO:
+        transactions = await self._repository.get_by_user_id(user_id, list_query)
+
+        return self._create_page(transactions, list_query.limit)
 
     async def get_wallet_transactions(
-        self,
-        wallet_id: int,
-        start_date: Optional[date] = None,
-        end_date: Optional[date] = None,
-    ) -> Sequence[Transaction]:
-        return await self._repository.get_by_wallet_id(wallet_id, start_date, end_date)
+        self, wallet_id: int, list_query: TransactionListQueryDTO
+    ) -> TransactionPageDTO:
+        transactions = await self._repository.get_by_wallet_id(wallet_id, list_query)
+
+        return self._create_page(transactions, list_query.limit)
 
     async def get_subject_transactions(
-        self,
-        subject_id: int,
-        start_date: Optional[date] = None,
-        end_date: Optional[date] = None,
-    ) -> Sequence[Transaction]:
-        return await self._repository.get_by_subject_id(
-            subject_id, start_date, end_date
-        )
+        self, subject_id: int, list_query: TransactionListQueryDTO
+    ) -> TransactionPageDTO:
+        transactions = await self._repository.get_by_subject_id(subject_id, list_query)
+
+        return self._create_page(transactions, list_query.limit)
+
+    @staticmethod
+    def _create_page(
+        transactions: Sequence[TransactionListItemDTO], limit: int
+    ) -> TransactionPageDTO:
+        if len(transactions) <= limit:
+            return TransactionPageDTO(items=transactions)
+
+        items = transactions[:limit]
+
+        return TransactionPageDTO(items=items, next_cursor=encode_cursor(items[-1]))
@@ -1,33 +1,118 @@
-from datetime import datetime
+from datetime import datetime, date, timedelta
 from decimal import Decimal
+from typing import List, Optional, Sequence
 
 from dateutil.relativedelta import relativedelta
 
-from backend.src.core.modules.common.utils import get_last_day_of_month
-from backend.src.core.modules.transaction.repository import TransactionRepository
+from backend.src.database.unit_of_work import UnitOfWorkInterface
+from backend.src.core.modules.common.exceptions import ObjectDoesNotExist
+from backend.src.core.modules.common.utils import (
+    get_first_day_of_month,
+    get_last_day_of_month,
+)
+from backend.src.core.modules.transaction.enum import StatisticsScope
+from backend.src.core.modules.transaction.repository_interface import (
+    TransactionRepositoryInterface,
+)
 from backend.src.core.modules.transaction.schemas.statistic import (
+    BalanceSeriesDTO,
+    BalanceSeriesQueryDTO,
     TransactionStatisticsDTO,
     TransactionStatisticDTO,
 )
+from backend.src.core.modules.transaction.statistics_cache import (
+    StatisticsOwner,
+    TransactionStatisticsCache,
+)
 from backend.src.core.modules.transaction.schemas.transaction import (
+    TransactionMonthlyValueSumDTO,
     TransactionValueSumDTO,
 )
+from backend.src.core.modules.wallet.repository_interface import (
+    WalletRepositoryInterface,
+)
+from backend.src.core.modules.wallet_summary.repository_interface import (
+    WalletSummaryRepositoryInterface,
+)
 
 
 class TransactionStatisticsService:
-    def __init__(self, repository: TransactionRepository):
+    """
+    Reads precomputed sums only: balances come from the running totals kept on
+    wallets and statistics from wallet_monthly_summary, so a request touches at
+    most four rows per month instead of every transaction in the range.
+    """
+
+    def __init__(  # pylint: disable=R0913
+        self,
+        repository: WalletSummaryRepositoryInterface,
+        wallet_repository: WalletRepositoryInterface,
+        transaction_repository: TransactionRepositoryInterface,
+        statistics_cache: TransactionStatisticsCache,
+        unit_of_work: UnitOfWorkInterface,
+    ):
         self._repository = repository
+        self._wallet_repository = wallet_repository
+        self._transaction_repository = transaction_repository
+        self._statistics_cache = statistics_cache
+        self._unit_of_work = unit_of_work
 
-    async def get_wallet_balance(self, wallet_id: int) -> TransactionStatisticDTO:
-        result = await self._repository.get_sum_values_by_wallet_id(wallet_id)
+    async def get_wallet_balance(
+        self, wallet_id: int, as_of: Optional[date] = None
+    ) -> TransactionStatisticDTO:
+        if as_of is not None:
+            return await self._get_wallet_balance_as_of(wallet_id, as_of)
 
-        return self._update_transaction_statistic_dto(
-            statistic_dto=TransactionStatisticDTO(transfers=Decimal("0.0")),
-            update_data=result,
+        wallet = await self._wallet_repository.get_by_id(wallet_id)
+
+        if wallet is None:
+            raise ObjectDoesNotExist()
+
+        return TransactionStatisticDTO(
+            balance=wallet.balance,
+            incomes=wallet.incomes,
+            expenses=wallet.expenses,
+            transfers=wallet.transfers,
+        )
+
+    async def get_wallet_balance_series(
+        self, wallet_id: int, query_dto: BalanceSeriesQueryDTO
+    ) -> BalanceSeriesDTO:
+        opening = await self._get_wallet_balance_as_of(
+            wallet_id, query_dto.start_date - timedelta(days=1)
+        )
+        points = await self._transaction_repository.get_balance_series_by_wallet_id(
+            wallet_id, query_dto, opening.balance
         )
 
+        return BalanceSeriesDTO(opening_balance=opening.balance, points=points)
+
+    async def _get_wallet_balance_as_of(
+        self, wallet_id: int, as_of: date
+    ) -> TransactionStatisticDTO:
+        """
+        Months closed before as_of are taken from wallet_monthly_summary, so only
+        the transactions of the as_of month itself are summed row by row.
+        """
+        month_start = as_of.replace(day=1)
+        closed_months = await self._repository.get_sum_values_by_wallet_id(
+            wallet_id, month_start
+        )
+        current_month = await self._transaction_repository.get_sum_values_by_wallet_id(
+            wallet_id, month_start, as_of
+        )
+
+        statistic_dto = TransactionStatisticDTO(transfers=Decimal("0.0"))
+
+        for result in (closed_months, current_month):
+            self._update_transaction_statistic_dto(
+                statistic_dto=statistic_dto, update_data=result
+            )
+
+        return statistic_dto
+
     async def get_user_balance(self, user_id: int) -> TransactionStatisticDTO:
-        result = await self._repository.get_sum_values_by_user_id(user_id)
+        result = await self._wallet_repository.get_sum_values_by_user_id(user_id)
 
         return self._update_transaction_statistic_dto(
             statistic_dto=TransactionStatisticDTO(), update_data=result
@@ -36,55 +121,98 @@ class TransactionStatisticsService:
     async def get_statistics_for_user(
         self, user_id: int, start_date: datetime
     ) -> TransactionStatisticsDTO:
-        statistics = TransactionStatisticsDTO(
-            total=TransactionStatisticDTO(),
-            monthly={},
-        )
+        return await self._get_statistics((StatisticsScope.USER, user_id), start_date)
 
-        while start_date <= datetime.now():
-            end_date = get_last_day_of_month(start_date)
-            result = await self._repository.get_sum_values_by_user_id(
-                user_id, start_date, end_date
-            )
+    async def get_statistics_for_wallet(
+        self, wallet_id: int, start_date: datetime
+    ) -> TransactionStatisticsDTO:
+        return await self._get_statistics(
+            (StatisticsScope.WALLET, wallet_id), start_date
+        )
 
-            statistics.monthly[
-                start_date.strftime("%Y-%m")
-            ] = self._update_transaction_statistic_dto(
-                statistic_dto=TransactionStatisticDTO(), update_data=result
+    async def _get_statistics(
+        self, owner: StatisticsOwner, start_date: datetime
+    ) -> TransactionStatisticsDTO:
+        """
+        The request transaction is ended after the write epoch was captured: its
+        snapshot was opened by earlier reads and may predate a write that bumped
+        the epoch since, so the sums are read from a fresh one.
+        """
+        window = (start_date.date(), self._get_end_date())
+        statistics = self._statistics_cache.get(owner, window)
+
+        if statistics is not None:
+            return statistics
+
+        write_epoch = self._statistics_cache.write_epoch
+        await self._unit_of_work.rollback()
+        scope, owner_id = owner
+
+        if scope == StatisticsScope.WALLET:
+            results = await self._repository.get_monthly_sum_values_by_wallet_id(
+                owner_id, *window
             )
-            self._update_transaction_statistic_dto(
-                statistic_dto=statistics.total, update_data=result
+        else:
+            results = await self._repository.get_monthly_sum_values_by_user_id(
+                owner_id, *window
             )
 
-            start_date += relativedelta(months=1)
+        statistics = self._build_statistics(
+            start_date, results, with_transfers=scope == StatisticsScope.WALLET
+        )
+        self._statistics_cache.set(owner, window, statistics, write_epoch)
 
         return statistics
 
-    async def get_statistics_for_wallet(
-        self, wallet_id: int, start_date: datetime
+    def _build_statistics(
+        self,
+        start_date: datetime,
+        results: Sequence[TransactionMonthlyValueSumDTO],
+        with_transfers: bool,
     ) -> TransactionStatisticsDTO:
+        """
+        Folds monthly sums into statistics. Months without transactions stay zeroed.
+        """
         statistics = TransactionStatisticsDTO(
-            total=TransactionStatisticDTO(transfers=Decimal("0.0")),
-            monthly={},
+            total=self._create_statistic_dto(with_transfers),
+            monthly={
+                month.strftime("%Y-%m"): self._create_statistic_dto(with_transfers)
+                for month in self._get_months(start_date)
+            },
         )
 
-        while start_date <= datetime.now():
-            end_date = get_last_day_of_month(start_date)
-            result = await self._repository.get_sum_values_by_wallet_id(
-                wallet_id, start_date, end_date
-            )
+        for result in results:
+            month = f"{result.year:04d}-{result.month:02d}"
 
-            statistics.monthly[
-                start_date.strftime("%Y-%m")
-            ] = self._update_transaction_statistic_dto(
-                statistic_dto=TransactionStatisticDTO(transfers=Decimal("0.0")),
-                update_data=result,
+            self._update_transaction_statistic_dto(
+                statistic_dto=statistics.monthly[month], update_data=result
             )
-            self._update_transaction_statistic_dto(statistics.total, result)
+            self._update_transaction_statistic_dto(
+                statistic_dto=statistics.total, update_data=result
+            )
+
+        return statistics
 
+    @staticmethod
+    def _create_statistic_dto(with_transfers: bool) -> TransactionStatisticDTO:
+        if with_transfers:
+            return TransactionStatisticDTO(transfers=Decimal("0.0"))
+
+        return TransactionStatisticDTO()
+
+    @staticmethod
+    def _get_end_date() -> date:
+        return get_last_day_of_month(get_first_day_of_month(datetime.now())).date()
+
+    @staticmethod
+    def _get_months(start_date: datetime) -> List[datetime]:
+        months = []
+
+        while start_date <= datetime.now():
+            months.append(start_date)
             start_date += relativedelta(months=1)
 
-        return statistics
+        return months
 
     def _update_transaction_statistic_dto(
         self,
@@ -1,3 +1,4 @@
+from backend.src.database.unit_of_work import UnitOfWorkInterface
 from backend.src.core.modules.transaction.enum import TransactionType
 from backend.src.core.modules.transaction.repository_interface import (
     TransactionRepositoryInterface,
@@ -6,11 +7,19 @@ from backend.src.core.modules.transaction.model import Transaction
 from backend.src.core.modules.transaction.schemas.transaction import (
     TransactionTransferDTO,
 )
+from backend.src.core.modules.wallet_summary.use_case import WalletSummaryUseCase
 
 
 class TransactionTransferService:
-    def __init__(self, repository: TransactionRepositoryInterface):
+    def __init__(
+        self,
+        repository: TransactionRepositoryInterface,
+        unit_of_work: UnitOfWorkInterface,
+        wallet_summary_use_case: WalletSummaryUseCase,
+    ):
         self._repository = repository
+        self._unit_of_work = unit_of_work
+        self._wallet_summary_use_case = wallet_summary_use_case
 
     async def transfer(
         self,
@@ -19,12 +28,15 @@ class TransactionTransferService:
         user_id: int,
         request_dto: TransactionTransferDTO,
     ) -> TransactionTransferDTO:
-        await self._make_transaction(
+        await self._wallet_summary_use_case.lock_wallets(sender_id, receiver_id)
+        expense = await self._make_transaction(
             sender_id, user_id, TransactionType.EXPENSE, request_dto
         )
-        await self._make_transaction(
+        income = await self._make_transaction(
             receiver_id, user_id, TransactionType.INCOME, request_dto
         )
+        await self._wallet_summary_use_case.record_created(expense, income)
+        await self._unit_of_work.commit()
 
         return request_dto
 
@@ -0,0 +1,76 @@
+import time
+from datetime import date
+from typing import Dict, Hashable, Optional, Set, Tuple, cast
+
+from backend.src.core.modules.common.cache import CacheMetricsDTO, TTLCache
+from backend.src.core.modules.transaction.enum import StatisticsScope
+from backend.src.core.modules.transaction.schemas.statistic import (
+    TransactionStatisticsDTO,
+)
+
+StatisticsOwner = Tuple[StatisticsScope, int]
+StatisticsWindow = Tuple[date, date]
+StatisticsKey = Tuple[StatisticsScope, int, date, date]
+
+
+class TransactionStatisticsCache:
+    """
+    Statistics keyed by (scope, owner id, window). Windows are tracked per owner,
+    so a write drops exactly the entries of the wallet and user it touched; the
+    index only ever holds windows that are still in the bounded cache.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self._cache: TTLCache[TransactionStatisticsDTO] = TTLCache(
+            max_size, on_evict=self._forget
+        )
+        self._ttl_seconds = ttl_seconds
+        self._windows: Dict[StatisticsOwner, Set[StatisticsWindow]] = {}
+        self._write_epoch = 0
+
+    @property
+    def write_epoch(self) -> int:
+        return self._write_epoch
+
+    def get(
+        self, owner: StatisticsOwner, window: StatisticsWindow
+    ) -> Optional[TransactionStatisticsDTO]:
+        return self._cache.get((*owner, *window))
+
+    def set(
+        self,
+        owner: StatisticsOwner,
+        window: StatisticsWindow,
+        value: TransactionStatisticsDTO,
+        write_epoch: int,
+    ) -> None:
+        """
+        Skips values computed while a write was committed, they may predate it.
+        Callers capture write_epoch before the snapshot their sums are read from.
+        """
+        if write_epoch != self._write_epoch:
+            return
+
+        key = (*owner, *window)
+
+        if self._cache.set(key, value, time.time() + self._ttl_seconds):
+            self._windows.setdefault(owner, set()).add(window)
+
+    def invalidate(self, *owners: StatisticsOwner) -> None:
+        self._write_epoch += 1
+
+        for owner in owners:
+            for window in self._windows.pop(owner, set()):
+                self._cache.invalidate((*owner, *window))
+
+    def _forget(self, key: Hashable) -> None:
+        scope, owner_id, start_date, end_date = cast(StatisticsKey, key)
+        owner = (scope, owner_id)
+        windows = self._windows.get(owner, set())
+        windows.discard((start_date, end_date))
+
+        if not windows:
+            self._windows.pop(owner, None)
+
+    def get_metrics(self) -> CacheMetricsDTO:
+        return self._cache.get_metrics()
@@ -1,3 +1,5 @@
+from typing import Dict
+
 from backend.src.core.modules.common.exceptions import ObjectDoesNotExist
 from backend.src.core.modules.transaction.model import Transaction
 from backend.src.core.modules.transaction.repository import TransactionRepository
@@ -6,11 +8,28 @@ from backend.src.core.modules.transaction.repository import TransactionRepositor
 class TransactionRetrievalUseCase:
     def __init__(self, repository: TransactionRepository):
         self._repository = repository
+        self._loaded: Dict[int, Transaction] = {}
 
     async def get_by_id(self, transaction_id: int) -> Transaction:
+        if transaction_id in self._loaded:
+            return self._loaded[transaction_id]
+
         transaction = await self._repository.get_by_id(transaction_id)
 
         if transaction is None:
             raise ObjectDoesNotExist()
 
+        self._loaded[transaction_id] = transaction
+
+        return transaction
+
+    async def get_by_id_for_update(self, transaction_id: int) -> Transaction:
+        transaction = await self._repository.get_by_id_for_update(transaction_id)
+
+        if transaction is None:
+            self._loaded.pop(transaction_id, None)
+            raise ObjectDoesNotExist()
+
+        self._loaded[transaction_id] = transaction
+
         return transaction
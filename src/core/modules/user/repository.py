@@ -1,11 +1,12 @@
 from typing import Sequence
 
-from sqlalchemy import select
+from sqlalchemy import select, or_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from backend.src.database.integrity import unique_constraint_guard
 from backend.src.core.modules.user.repository_interface import UserRepositoryInterface
 from backend.src.core.modules.user.model import User
+from backend.src.core.modules.user.schemas import UserCredentialsDTO
 
 
 class UserRepository(UserRepositoryInterface):
@@ -14,63 +15,57 @@ class UserRepository(UserRepositoryInterface):
 
     async def save(self, user: User) -> User:
         self._session.add(user)
-        await self._session.commit()
+
+        async with unique_constraint_guard(self._session):
+            await self._session.flush()
 
         return user
 
     async def update(self, user: User) -> User:
-        await self._session.commit()
-        await self._session.refresh(user)
+        async with unique_constraint_guard(self._session):
+            await self._session.flush()
 
         return user
 
     async def delete(self, user: User) -> None:
         await self._session.delete(user)
-        await self._session.commit()
+        await self._session.flush()
 
     async def get_all(self) -> Sequence[User]:
-        result = await self._session.execute(
-            select(User).options(
-                selectinload(User.wallets),
-                selectinload(User.subjects),
-                selectinload(User.transactions),
-            )
-        )
+        result = await self._session.execute(select(User))
 
         return result.scalars().all()
 
     async def get_by_id(self, user_id: int) -> User | None:
-        result = await self._session.execute(
-            select(User)
-            .where(User.id == user_id)
-            .options(
-                selectinload(User.wallets),
-                selectinload(User.subjects),
-                selectinload(User.transactions),
-            )
-        )
+        result = await self._session.execute(select(User).where(User.id == user_id))
         return result.scalars().first()
 
     async def get_by_email(self, email: str) -> User | None:
-        result = await self._session.execute(
-            select(User)
-            .where(User.email == email)
-            .options(
-                selectinload(User.wallets),
-                selectinload(User.subjects),
-                selectinload(User.transactions),
-            )
-        )
+        result = await self._session.execute(select(User).where(User.email == email))
         return result.scalars().first()
 
     async def get_by_username(self, username: str) -> User | None:
         result = await self._session.execute(
-            select(User)
-            .where(User.username == username)
-            .options(
-                selectinload(User.wallets),
-                selectinload(User.subjects),
-                selectinload(User.transactions),
-            )
+            select(User).where(User.username == username)
         )
         return result.scalars().first()
+
+    async def get_credentials_by_username_or_email(
+        self, value: str
+    ) -> UserCredentialsDTO | None:
+        result = await self._session.execute(
+            select(User.id, User.email, User.password, User.is_admin)
+            .where(or_(User.email == value, User.username == value))
+            .order_by((User.email == value).desc())
+            .limit(1)
+        )
+        row = result.first()
+
+        return UserCredentialsDTO(**row._asdict()) if row is not None else None
+
+    async def get_is_admin(self, user_id: int) -> bool | None:
+        result = await self._session.execute(
+            select(User.is_admin).where(User.id == user_id)
+        )
+
+        return result.scalar()
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Sequence
 
 from backend.src.core.modules.user.model import User
+from backend.src.core.modules.user.schemas import UserCredentialsDTO
 
 
 class UserRepositoryInterface(ABC):
@@ -32,3 +33,13 @@ class UserRepositoryInterface(ABC):
     @abstractmethod
     async def get_by_username(self, username: str) -> User | None:
         pass
+
+    @abstractmethod
+    async def get_credentials_by_username_or_email(
+        self, value: str
+    ) -> UserCredentialsDTO | None:
+        pass
+
+    @abstractmethod
+    async def get_is_admin(self, user_id: int) -> bool | None:
+        pass
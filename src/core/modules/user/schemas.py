@@ -20,3 +20,13 @@ class UserCreateDTO(UserBaseDTO):
 
 class UserUpdateDTO(UserBaseDTO):
     pass
+
+
+class UserCredentialsDTO(BaseModel):
+    id: int
+    email: str
+    password: str
+    is_admin: bool
+
+    class ConfigDict:
+        frozen = True
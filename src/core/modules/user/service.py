@@ -1,9 +1,7 @@
-from typing import Sequence, Optional
+from typing import Sequence
 
+from backend.src.database.unit_of_work import UnitOfWorkInterface
 from backend.src.core.modules.auth.services.password_services import PasswordHashService
-from backend.src.core.modules.common.exceptions import (
-    ObjectAlreadyExists,
-)
 from backend.src.core.modules.user.repository_interface import UserRepositoryInterface
 from backend.src.core.modules.user.model import User
 from backend.src.core.modules.user.schemas import UserCreateDTO, UserUpdateDTO
@@ -16,38 +14,40 @@ class UserService:
         repository: UserRepositoryInterface,
         retrieval_use_case: UserRetrievalUseCase,
         password_hash_service: PasswordHashService,
+        unit_of_work: UnitOfWorkInterface,
     ):
         self._repository = repository
         self._retrieval_use_case = retrieval_use_case
         self._password_hash_service = password_hash_service
+        self._unit_of_work = unit_of_work
 
     async def create(self, request_dto: UserCreateDTO) -> User:
-        if await self._check_user_with_username_exists(request_dto.username):
-            raise ObjectAlreadyExists()
-
-        if await self._check_user_with_email_exists(request_dto.email):
-            raise ObjectAlreadyExists()
-
-        password_hash = self._password_hash_service.hash(request_dto.password)
+        password_hash = await self._password_hash_service.hash_async(
+            request_dto.password
+        )
         user = User(**request_dto.model_dump() | {"password": password_hash})
 
-        return await self._repository.save(user)
+        user = await self._repository.save(user)
+        await self._unit_of_work.commit()
+
+        return user
 
     async def update(self, user_id: int, request_dto: UserUpdateDTO) -> User:
         user = await self.get_by_id(user_id)
 
-        if await self._check_user_with_username_exists(request_dto.username, user_id):
-            raise ObjectAlreadyExists()
-
         for key, value in request_dto.model_dump().items():
             setattr(user, key, value)
 
-        return await self._repository.update(user)
+        user = await self._repository.update(user)
+        await self._unit_of_work.commit()
+
+        return user
 
     async def delete(self, user_id: int):
         user = await self.get_by_id(user_id)
 
-        return await self._repository.delete(user)
+        await self._repository.delete(user)
+        await self._unit_of_work.commit()
 
     async def get_all(self) -> Sequence[User]:
         return await self._repository.get_all()
@@ -55,28 +55,5 @@ class UserService:
     async def get_by_id(self, user_id: int) -> User:
         return await self._retrieval_use_case.get_by_id(user_id)
 
-    async def _check_user_with_username_exists(
-        self, username: str, excluded_id: Optional[int] = None
-    ) -> bool:
-        user = await self._repository.get_by_username(username)
-
-        if user is None:
-            return False
-
-        if user.id == excluded_id:
-            return False
-
-        return True
-
-    async def _check_user_with_email_exists(
-        self, email: str, excluded_id: Optional[int] = None
-    ) -> bool:
-        user = await self._repository.get_by_email(email)
-
-        if user is None:
-            return False
-
-        if user.id == excluded_id:
-            return False
-
-        return True
+    async def is_admin(self, user_id: int) -> bool:
+        return await self._retrieval_use_case.is_admin(user_id)
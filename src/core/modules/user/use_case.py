@@ -1,6 +1,7 @@
 from backend.src.core.modules.common.exceptions import ObjectDoesNotExist
 from backend.src.core.modules.user.repository_interface import UserRepositoryInterface
 from backend.src.core.modules.user.model import User
+from backend.src.core.modules.user.schemas import UserCredentialsDTO
 
 
 class UserRetrievalUseCase:
@@ -15,13 +16,20 @@ class UserRetrievalUseCase:
 
         return user
 
-    async def get_by_username_or_email(self, field: str) -> User:
-        user = await self._repository.get_by_email(field)
-        if user is not None:
-            return user
+    async def get_credentials_by_username_or_email(
+        self, field: str
+    ) -> UserCredentialsDTO:
+        credentials = await self._repository.get_credentials_by_username_or_email(field)
 
-        user = await self._repository.get_by_username(field)
-        if user is not None:
-            return user
+        if credentials is None:
+            raise ObjectDoesNotExist()
+
+        return credentials
+
+    async def is_admin(self, user_id: int) -> bool:
+        is_admin = await self._repository.get_is_admin(user_id)
+
+        if is_admin is None:
+            raise ObjectDoesNotExist()
 
-        raise ObjectDoesNotExist()
+        return is_admin
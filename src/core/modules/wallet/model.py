@@ -1,6 +1,7 @@
+from decimal import Decimal
 from typing import List
 
-from sqlalchemy import String, Text, Integer, ForeignKey, UniqueConstraint
+from sqlalchemy import DECIMAL, String, Text, Integer, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import MappedColumn, mapped_column, relationship
 
 from backend.src.database.base import BaseModel
@@ -13,7 +14,19 @@ class Wallet(BaseModel):
     name: MappedColumn[str] = mapped_column(String(50))
     description: MappedColumn[str] = mapped_column(Text(2000), default="")
     user_id: MappedColumn[int] = mapped_column(Integer, ForeignKey("users.id"))
+    balance: MappedColumn[Decimal] = mapped_column(
+        DECIMAL(14, 2), nullable=False, default=Decimal("0.00")
+    )
+    incomes: MappedColumn[Decimal] = mapped_column(
+        DECIMAL(14, 2), nullable=False, default=Decimal("0.00")
+    )
+    expenses: MappedColumn[Decimal] = mapped_column(
+        DECIMAL(14, 2), nullable=False, default=Decimal("0.00")
+    )
+    transfers: MappedColumn[Decimal] = mapped_column(
+        DECIMAL(14, 2), nullable=False, default=Decimal("0.00")
+    )
     user: MappedColumn["User"] = relationship(back_populates="wallets")  # type: ignore
     transactions: MappedColumn[List["Transaction"]] = relationship(  # type: ignore
-        back_populates="wallet"
+        back_populates="wallet", passive_deletes=True
     )
@@ -0,0 +1,94 @@
+from typing import Dict, Sequence, Union
+
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    Update,
+    and_,
+    case,
+    func,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.orm import InstrumentedAttribute
+
+from backend.src.core.modules.transaction.enum import TransactionType
+from backend.src.core.modules.transaction.model import Transaction
+from backend.src.core.modules.wallet.model import Wallet
+
+
+def build_totals_drift_query() -> Select:
+    """
+    Lists wallets whose stored totals differ from the sums of their transactions,
+    with both versions side by side. The correlated sums are answered from the
+    covering (wallet_id, date, is_transfer, type, value) index.
+    """
+    expected = _build_expected_totals()
+
+    return select(
+        Wallet.id.label("wallet_id"),
+        Wallet.balance,
+        Wallet.incomes,
+        Wallet.expenses,
+        Wallet.transfers,
+        *(value.label(f"expected_{name}") for name, value in expected.items()),
+    ).where(
+        or_(
+            Wallet.balance != expected["balance"],
+            Wallet.incomes != expected["incomes"],
+            Wallet.expenses != expected["expenses"],
+            Wallet.transfers != expected["transfers"],
+        )
+    )
+
+
+def build_reconcile_totals_query(wallet_ids: Sequence[int]) -> Update:
+    return (
+        update(Wallet)
+        .where(Wallet.id.in_(wallet_ids))
+        .values(**_build_expected_totals())
+    )
+
+
+def _build_expected_totals() -> Dict[str, ColumnElement]:
+    incomes = _transaction_sum(
+        and_(
+            Transaction.type == TransactionType.INCOME,
+            Transaction.is_transfer.is_(False),
+        ),
+        Transaction.value,
+    )
+    expenses = _transaction_sum(
+        and_(
+            Transaction.type == TransactionType.EXPENSE,
+            Transaction.is_transfer.is_(False),
+        ),
+        Transaction.value,
+    )
+    transfers = _transaction_sum(
+        Transaction.is_transfer.is_(True),
+        case(
+            (Transaction.type == TransactionType.INCOME, Transaction.value),
+            else_=-Transaction.value,
+        ),
+    )
+
+    return {
+        "balance": incomes - expenses + transfers,
+        "incomes": incomes,
+        "expenses": expenses,
+        "transfers": transfers,
+    }
+
+
+def _transaction_sum(
+    condition: ColumnElement, value: Union[ColumnElement, InstrumentedAttribute]
+) -> ColumnElement:
+    # pylint: disable=E1102
+    return func.coalesce(
+        select(func.sum(value))
+        .where(Transaction.wallet_id == Wallet.id, condition)
+        .scalar_subquery(),
+        0,
+    )
@@ -1,13 +1,27 @@
-from typing import Sequence
+from typing import List, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, raiseload
+from sqlalchemy.orm.interfaces import LoaderOption
 
+from backend.src.database.integrity import unique_constraint_guard
 from backend.src.core.modules.wallet.repository_interface import (
     WalletRepositoryInterface,
 )
+from backend.src.core.modules.transaction.schemas.transaction import (
+    TransactionValueSumDTO,
+)
 from backend.src.core.modules.wallet.model import Wallet
+from backend.src.core.modules.wallet.queries import (
+    build_reconcile_totals_query,
+    build_totals_drift_query,
+)
+from backend.src.core.modules.wallet.schemas import (
+    WalletTotalsDeltaDTO,
+    WalletTotalsDriftDTO,
+    WalletTotalsDTO,
+)
 
 
 class WalletRepository(WalletRepositoryInterface):
@@ -16,42 +30,124 @@ class WalletRepository(WalletRepositoryInterface):
 
     async def save(self, wallet: Wallet) -> Wallet:
         self._session.add(wallet)
-        await self._session.commit()
+
+        async with unique_constraint_guard(self._session):
+            await self._session.flush()
 
         return wallet
 
     async def update(self, wallet: Wallet) -> Wallet:
-        await self._session.commit()
-        await self._session.refresh(wallet)
+        async with unique_constraint_guard(self._session):
+            await self._session.flush()
 
         return wallet
 
     async def delete(self, wallet: Wallet) -> None:
         await self._session.delete(wallet)
-        await self._session.commit()
+        await self._session.flush()
 
-    async def get_by_user_id(self, user_id: int) -> Sequence[Wallet]:
+    async def get_by_user_id(
+        self, user_id: int, with_transactions: bool = False
+    ) -> Sequence[Wallet]:
         result = await self._session.execute(
             select(Wallet)
             .where(Wallet.user_id == user_id)
-            .options(selectinload(Wallet.user), selectinload(Wallet.transactions))
+            .options(*self._get_load_options(with_transactions))
         )
 
         return result.scalars().all()
 
-    async def get_by_id(self, wallet_id: int) -> Wallet | None:
+    async def get_by_id(
+        self, wallet_id: int, with_transactions: bool = False
+    ) -> Wallet | None:
         result = await self._session.execute(
             select(Wallet)
             .where(Wallet.id == wallet_id)
-            .options(selectinload(Wallet.user), selectinload(Wallet.transactions))
+            .options(*self._get_load_options(with_transactions))
         )
         return result.scalars().first()
 
-    async def get_by_user_id_and_name(self, user_id: int, name: str) -> Wallet | None:
+    async def lock_by_ids(self, wallet_ids: Sequence[int]) -> None:
+        """
+        Row locks are taken in ascending id order, so writers touching several
+        wallets always queue up behind each other instead of deadlocking.
+        """
+        await self._session.execute(
+            select(Wallet.id)
+            .where(Wallet.id.in_(wallet_ids))
+            .order_by(Wallet.id)
+            .with_for_update()
+        )
+
+    async def adjust_totals(self, delta: WalletTotalsDeltaDTO) -> None:
+        """
+        Totals are moved relative to their current value inside the UPDATE, so
+        concurrent writers never overwrite each other's totals. The deltas are
+        only correct when built from rows read under lock, which
+        TransactionService does for updates and deletes.
+        """
+        await self._session.execute(
+            update(Wallet)
+            .where(Wallet.id == delta.wallet_id)
+            .values(
+                balance=Wallet.balance
+                + delta.incomes
+                - delta.expenses
+                + delta.transfers,
+                incomes=Wallet.incomes + delta.incomes,
+                expenses=Wallet.expenses + delta.expenses,
+                transfers=Wallet.transfers + delta.transfers,
+            )
+            .execution_options(synchronize_session="evaluate")
+        )
+
+    async def get_sum_values_by_user_id(self, user_id: int) -> TransactionValueSumDTO:
+        # pylint: disable=E1102
         result = await self._session.execute(
-            select(Wallet)
-            .where((Wallet.user_id == user_id) & (Wallet.name == name))
-            .options(selectinload(Wallet.user), selectinload(Wallet.transactions))
+            select(
+                func.coalesce(func.sum(Wallet.incomes), 0).label("incomes"),
+                func.coalesce(func.sum(Wallet.expenses), 0).label("expenses"),
+            ).where(Wallet.user_id == user_id)
         )
 
-        return result.scalars().first()
+        return TransactionValueSumDTO(**result.one()._asdict())
+
+    async def get_totals_drift(self) -> Sequence[WalletTotalsDriftDTO]:
+        result = await self._session.execute(build_totals_drift_query())
+
+        return [
+            WalletTotalsDriftDTO(
+                wallet_id=row.wallet_id,
+                stored=WalletTotalsDTO(
+                    balance=row.balance,
+                    incomes=row.incomes,
+                    expenses=row.expenses,
+                    transfers=row.transfers,
+                ),
+                expected=WalletTotalsDTO(
+                    balance=row.expected_balance,
+                    incomes=row.expected_incomes,
+                    expenses=row.expected_expenses,
+                    transfers=row.expected_transfers,
+                ),
+            )
+            for row in result
+        ]
+
+    async def reconcile_totals(self, wallet_ids: Sequence[int]) -> None:
+        await self._session.execute(
+            build_reconcile_totals_query(wallet_ids).execution_options(
+                synchronize_session=False
+            )
+        )
+
+    @staticmethod
+    def _get_load_options(with_transactions: bool) -> List[LoaderOption]:
+        """
+        Transactions of a wallet can be a very large collection, so touching
+        them raises unless the caller explicitly asked for them.
+        """
+        if with_transactions:
+            return [selectinload(Wallet.user), selectinload(Wallet.transactions)]
+
+        return [selectinload(Wallet.user), raiseload(Wallet.transactions)]
@@ -2,7 +2,14 @@
 from abc import ABC, abstractmethod
 from typing import Sequence
 
+from backend.src.core.modules.transaction.schemas.transaction import (
+    TransactionValueSumDTO,
+)
 from backend.src.core.modules.wallet.model import Wallet
+from backend.src.core.modules.wallet.schemas import (
+    WalletTotalsDeltaDTO,
+    WalletTotalsDriftDTO,
+)
 
 
 class WalletRepositoryInterface(ABC):
@@ -19,13 +26,33 @@ class WalletRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    async def get_by_user_id(self, user_id: int) -> Sequence[Wallet]:
+    async def get_by_user_id(
+        self, user_id: int, with_transactions: bool = False
+    ) -> Sequence[Wallet]:
         pass
 
     @abstractmethod
-    async def get_by_id(self, wallet_id: int) -> Wallet | None:
+    async def get_by_id(
+        self, wallet_id: int, with_transactions: bool = False
+    ) -> Wallet | None:
         pass
 
     @abstractmethod
-    async def get_by_user_id_and_name(self, user_id: int, name: str) -> Wallet | None:
+    async def lock_by_ids(self, wallet_ids: Sequence[int]) -> None:
+        pass
+
+    @abstractmethod
+    async def adjust_totals(self, delta: WalletTotalsDeltaDTO) -> None:
+        pass
+
+    @abstractmethod
+    async def get_sum_values_by_user_id(self, user_id: int) -> TransactionValueSumDTO:
+        pass
+
+    @abstractmethod
+    async def get_totals_drift(self) -> Sequence[WalletTotalsDriftDTO]:
+        pass
+
+    @abstractmethod
+    async def reconcile_totals(self, wallet_ids: Sequence[int]) -> None:
         pass
@@ -1,3 +1,5 @@
+from decimal import Decimal
+
 from pydantic import BaseModel
 
 
@@ -7,3 +9,26 @@ class WalletPayloadDTO(BaseModel):
 
     class ConfigDict:
         frozen = True
+
+
+class WalletTotalsDeltaDTO(BaseModel):
+    wallet_id: int
+    incomes: Decimal = Decimal(0)
+    expenses: Decimal = Decimal(0)
+    transfers: Decimal = Decimal(0)
+
+    class ConfigDict:
+        frozen = True
+
+
+class WalletTotalsDTO(BaseModel):
+    balance: Decimal
+    incomes: Decimal
+    expenses: Decimal
+    transfers: Decimal
+
+
+class WalletTotalsDriftDTO(BaseModel):
+    wallet_id: int
+    stored: WalletTotalsDTO
+    expected: WalletTotalsDTO
@@ -1,7 +1,10 @@
-from typing import Optional
+import functools
+from typing import Sequence
 
-from backend.src.core.modules.common.exceptions import (
-    ObjectAlreadyExists,
+from backend.src.database.unit_of_work import UnitOfWorkInterface
+from backend.src.core.modules.transaction.enum import StatisticsScope
+from backend.src.core.modules.transaction.statistics_cache import (
+    TransactionStatisticsCache,
 )
 from backend.src.core.modules.wallet.model import Wallet
 from backend.src.core.modules.wallet.repository_interface import (
@@ -16,49 +19,48 @@ class WalletService:
         self,
         repository: WalletRepositoryInterface,
         retrieval_use_case: WalletRetrievalUseCase,
+        unit_of_work: UnitOfWorkInterface,
+        statistics_cache: TransactionStatisticsCache,
     ):
         self._repository = repository
         self._retrieval_use_case = retrieval_use_case
+        self._unit_of_work = unit_of_work
+        self._statistics_cache = statistics_cache
 
     async def create(self, user_id: int, request_dto: WalletPayloadDTO) -> Wallet:
-        if await self._wallet_with_user_id_and_name_exists(user_id, request_dto.name):
-            raise ObjectAlreadyExists()
-
         wallet = Wallet(**request_dto.model_dump(), user_id=user_id)
 
-        return await self._repository.save(wallet)
+        wallet = await self._repository.save(wallet)
+        await self._unit_of_work.commit()
+
+        return wallet
 
     async def update(self, wallet_id: int, request_dto: WalletPayloadDTO) -> Wallet:
         wallet = await self.get_by_id(wallet_id)
 
-        if await self._wallet_with_user_id_and_name_exists(
-            wallet.user_id, request_dto.name, wallet.id
-        ):
-            raise ObjectAlreadyExists()
-
         for key, value in request_dto.model_dump().items():
             setattr(wallet, key, value)
 
-        return await self._repository.update(wallet)
+        wallet = await self._repository.update(wallet)
+        await self._unit_of_work.commit()
+
+        return wallet
 
     async def delete(self, wallet_id: int):
         wallet = await self.get_by_id(wallet_id)
 
-        return await self._repository.delete(wallet)
+        await self._repository.delete(wallet)
+        self._unit_of_work.add_after_commit_hook(
+            functools.partial(
+                self._statistics_cache.invalidate,
+                (StatisticsScope.WALLET, wallet.id),
+                (StatisticsScope.USER, wallet.user_id),
+            )
+        )
+        await self._unit_of_work.commit()
 
     async def get_by_id(self, wallet_id: int) -> Wallet:
         return await self._retrieval_use_case.get_by_id(wallet_id)
 
-    async def _wallet_with_user_id_and_name_exists(
-        self, user_id: int, name: str, exclude_wallet_id: Optional[int] = None
-    ) -> bool:
-        """
-        Method checks if object with user_id and name already exists and if this object
-        is not excluded.
-        """
-        wallet = await self._repository.get_by_user_id_and_name(user_id, name)
-
-        if wallet is None or wallet.id == exclude_wallet_id:
-            return False
-
-        return True
+    async def get_by_user_id(self, user_id: int) -> Sequence[Wallet]:
+        return await self._repository.get_by_user_id(user_id)
@@ -1,3 +1,5 @@
+from typing import Dict
+
 from backend.src.core.modules.wallet.repository_interface import (
     WalletRepositoryInterface,
 )
@@ -8,11 +10,17 @@ from backend.src.core.modules.wallet.model import Wallet
 class WalletRetrievalUseCase:
     def __init__(self, repository: WalletRepositoryInterface):
         self._repository = repository
+        self._loaded: Dict[int, Wallet] = {}
 
     async def get_by_id(self, wallet_id: int) -> Wallet:
+        if wallet_id in self._loaded:
+            return self._loaded[wallet_id]
+
         wallet = await self._repository.get_by_id(wallet_id)
 
         if wallet is None:
             raise ObjectDoesNotExist()
 
+        self._loaded[wallet_id] = wallet
+
         return wallet
@@ -0,0 +1,52 @@
+from decimal import Decimal
+
+from sqlalchemy import (
+    DECIMAL,
+    Boolean,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    UniqueConstraint,
+)
+from sqlalchemy.orm import MappedColumn, mapped_column
+
+from backend.src.database.base import BaseModel
+from backend.src.core.modules.transaction.enum import TransactionType
+
+
+class WalletMonthlySummary(BaseModel):
+    __tablename__ = "wallet_monthly_summary"
+    __table_args__ = (
+        UniqueConstraint(
+            "wallet_id",
+            "year_month",
+            "type",
+            "is_transfer",
+            name="unique_wallet_month_type_transfer",
+        ),
+        Index("ix_wallet_monthly_summary_user_id_year_month", "user_id", "year_month"),
+    )
+
+    wallet_id: MappedColumn[int] = mapped_column(
+        Integer, ForeignKey("wallets.id", ondelete="CASCADE"), nullable=False
+    )
+    user_id: MappedColumn[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    year_month: MappedColumn[int] = mapped_column(Integer, nullable=False)
+    type: MappedColumn[TransactionType] = mapped_column(
+        Enum(
+            TransactionType,
+            create_constraint=True,
+            validate_strings=True,
+        ),
+        nullable=False,
+    )
+    is_transfer: MappedColumn[bool] = mapped_column(Boolean, nullable=False)
+    value: MappedColumn[Decimal] = mapped_column(
+        DECIMAL(14, 2), nullable=False, default=Decimal("0.00")
+    )
+    transaction_count: MappedColumn[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )
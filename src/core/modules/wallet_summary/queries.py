@@ -0,0 +1,140 @@
+from typing import Optional, Sequence
+
+from sqlalchemy import (
+    ColumnElement,
+    DateTime,
+    Delete,
+    Insert,
+    Select,
+    and_,
+    case,
+    delete,
+    extract,
+    func,
+    insert,
+    literal,
+    select,
+)
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+from backend.src.database.base import utc_now
+from backend.src.core.modules.transaction.enum import TransactionType
+from backend.src.core.modules.transaction.model import Transaction
+from backend.src.core.modules.wallet_summary.model import WalletMonthlySummary
+from backend.src.core.modules.wallet_summary.schemas import WalletSummaryDeltaDTO
+
+
+def build_sum_query(
+    start_year_month: Optional[int] = None, end_year_month: Optional[int] = None
+) -> Select:
+    """
+    Same columns as TransactionValueSumQueryBuilder, computed from the monthly
+    summary rows instead of raw transactions.
+    """
+    query = select(
+        _conditional_sum(TransactionType.INCOME, False).label("incomes"),
+        _conditional_sum(TransactionType.EXPENSE, False).label("expenses"),
+        _conditional_sum(TransactionType.INCOME, True).label("transfer_incomes"),
+        _conditional_sum(TransactionType.EXPENSE, True).label("transfer_expenses"),
+    )
+
+    if start_year_month is not None:
+        query = query.where(WalletMonthlySummary.year_month >= start_year_month)
+
+    if end_year_month is not None:
+        query = query.where(WalletMonthlySummary.year_month <= end_year_month)
+
+    return query
+
+
+def build_monthly_sum_query(start_year_month: int, end_year_month: int) -> Select:
+    return (
+        build_sum_query(start_year_month, end_year_month)
+        .add_columns(WalletMonthlySummary.year_month)
+        .group_by(WalletMonthlySummary.year_month)
+    )
+
+
+def build_upsert_query(deltas: Sequence[WalletSummaryDeltaDTO]) -> Insert:
+    """
+    One multi-row INSERT which adds the deltas onto existing rows instead of
+    overwriting them, so concurrent writers never lose each other's changes.
+    """
+    now = utc_now()
+    query = mysql_insert(WalletMonthlySummary).values(
+        [
+            delta.model_dump() | {"created_at": now, "updated_at": now}
+            for delta in deltas
+        ]
+    )
+
+    return query.on_duplicate_key_update(
+        value=WalletMonthlySummary.value + query.inserted.value,
+        transaction_count=WalletMonthlySummary.transaction_count
+        + query.inserted.transaction_count,
+        updated_at=query.inserted.updated_at,
+    )
+
+
+def build_clear_query() -> Delete:
+    return delete(WalletMonthlySummary)
+
+
+def build_rebuild_query() -> Insert:
+    # pylint: disable=E1102
+    year_month = (
+        extract("year", Transaction.date) * 100 + extract("month", Transaction.date)
+    ).label("year_month")
+    now = utc_now()
+
+    return insert(WalletMonthlySummary).from_select(
+        [
+            "wallet_id",
+            "user_id",
+            "year_month",
+            "type",
+            "is_transfer",
+            "value",
+            "transaction_count",
+            "created_at",
+            "updated_at",
+        ],
+        select(
+            Transaction.wallet_id,
+            Transaction.user_id,
+            year_month,
+            Transaction.type,
+            Transaction.is_transfer,
+            func.sum(Transaction.value),
+            func.count(Transaction.id),
+            literal(now, DateTime),
+            literal(now, DateTime),
+        ).group_by(
+            Transaction.wallet_id,
+            Transaction.user_id,
+            year_month,
+            Transaction.type,
+            Transaction.is_transfer,
+        ),
+    )
+
+
+def _conditional_sum(
+    transaction_type: TransactionType, is_transfer: bool
+) -> ColumnElement:
+    # pylint: disable=E1102
+    return func.coalesce(
+        func.sum(
+            case(
+                (
+                    and_(
+                        WalletMonthlySummary.type == transaction_type,
+                        WalletMonthlySummary.is_transfer == is_transfer,
+                    ),
+                    WalletMonthlySummary.value,
+                ),
+                else_=0,
+            )
+        ),
+        0,
+    )
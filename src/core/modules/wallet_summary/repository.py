@@ -0,0 +1,84 @@
+from datetime import date
+from typing import Sequence
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.src.core.modules.transaction.schemas.transaction import (
+    TransactionMonthlyValueSumDTO,
+    TransactionValueSumDTO,
+)
+from backend.src.core.modules.wallet_summary.model import WalletMonthlySummary
+from backend.src.core.modules.wallet_summary.queries import (
+    build_clear_query,
+    build_monthly_sum_query,
+    build_rebuild_query,
+    build_sum_query,
+    build_upsert_query,
+)
+from backend.src.core.modules.wallet_summary.repository_interface import (
+    WalletSummaryRepositoryInterface,
+)
+from backend.src.core.modules.wallet_summary.schemas import (
+    WalletSummaryDeltaDTO,
+    to_year_month,
+)
+
+
+class WalletSummaryRepository(WalletSummaryRepositoryInterface):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def apply_deltas(self, deltas: Sequence[WalletSummaryDeltaDTO]) -> None:
+        await self._session.execute(build_upsert_query(deltas))
+
+    async def rebuild(self) -> None:
+        await self._session.execute(build_clear_query())
+        await self._session.execute(build_rebuild_query())
+
+    async def get_sum_values_by_wallet_id(
+        self, wallet_id: int, before_month: date
+    ) -> TransactionValueSumDTO:
+        result = await self._session.execute(
+            build_sum_query().where(
+                WalletMonthlySummary.wallet_id == wallet_id,
+                WalletMonthlySummary.year_month < to_year_month(before_month),
+            )
+        )
+
+        return TransactionValueSumDTO(**result.one()._asdict())
+
+    async def get_monthly_sum_values_by_user_id(
+        self, user_id: int, start_date: date, end_date: date
+    ) -> Sequence[TransactionMonthlyValueSumDTO]:
+        return await self._execute_monthly_sum_query(
+            build_monthly_sum_query(
+                to_year_month(start_date), to_year_month(end_date)
+            ).where(WalletMonthlySummary.user_id == user_id)
+        )
+
+    async def get_monthly_sum_values_by_wallet_id(
+        self, wallet_id: int, start_date: date, end_date: date
+    ) -> Sequence[TransactionMonthlyValueSumDTO]:
+        return await self._execute_monthly_sum_query(
+            build_monthly_sum_query(
+                to_year_month(start_date), to_year_month(end_date)
+            ).where(WalletMonthlySummary.wallet_id == wallet_id)
+        )
+
+    async def _execute_monthly_sum_query(
+        self, query: Select
+    ) -> Sequence[TransactionMonthlyValueSumDTO]:
+        result = await self._session.execute(query)
+
+        return [
+            TransactionMonthlyValueSumDTO(
+                year=row.year_month // 100,
+                month=row.year_month % 100,
+                incomes=row.incomes,
+                expenses=row.expenses,
+                transfer_incomes=row.transfer_incomes,
+                transfer_expenses=row.transfer_expenses,
+            )
+            for row in result
+        ]
@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Sequence
+
+from backend.src.core.modules.transaction.schemas.transaction import (
+    TransactionMonthlyValueSumDTO,
+    TransactionValueSumDTO,
+)
+from backend.src.core.modules.wallet_summary.schemas import WalletSummaryDeltaDTO
+
+
+class WalletSummaryRepositoryInterface(ABC):
+    @abstractmethod
+    async def apply_deltas(self, deltas: Sequence[WalletSummaryDeltaDTO]) -> None:
+        pass
+
+    @abstractmethod
+    async def rebuild(self) -> None:
+        pass
+
+    @abstractmethod
+    async def get_sum_values_by_wallet_id(
+        self, wallet_id: int, before_month: date
+    ) -> TransactionValueSumDTO:
+        pass
+
+    @abstractmethod
+    async def get_monthly_sum_values_by_user_id(
+        self, user_id: int, start_date: date, end_date: date
+    ) -> Sequence[TransactionMonthlyValueSumDTO]:
+        pass
+
+    @abstractmethod
+    async def get_monthly_sum_values_by_wallet_id(
+        self, wallet_id: int, start_date: date, end_date: date
+    ) -> Sequence[TransactionMonthlyValueSumDTO]:
+        pass
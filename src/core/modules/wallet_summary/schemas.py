@@ -0,0 +1,23 @@
+from datetime import date
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+from backend.src.core.modules.transaction.enum import TransactionType
+
+
+class WalletSummaryDeltaDTO(BaseModel):
+    wallet_id: int
+    user_id: int
+    year_month: int
+    type: TransactionType
+    is_transfer: bool
+    value: Decimal
+    transaction_count: int
+
+    class ConfigDict:
+        frozen = True
+
+
+def to_year_month(value: date) -> int:
+    return value.year * 100 + value.month
@@ -0,0 +1,147 @@
+import functools
+from decimal import Decimal
+from typing import Dict, Sequence, Tuple
+
+from backend.src.database.unit_of_work import UnitOfWorkInterface
+from backend.src.core.modules.transaction.enum import StatisticsScope, TransactionType
+from backend.src.core.modules.transaction.model import Transaction
+from backend.src.core.modules.transaction.statistics_cache import (
+    TransactionStatisticsCache,
+)
+from backend.src.core.modules.wallet.repository_interface import (
+    WalletRepositoryInterface,
+)
+from backend.src.core.modules.wallet.schemas import WalletTotalsDeltaDTO
+from backend.src.core.modules.wallet_summary.repository_interface import (
+    WalletSummaryRepositoryInterface,
+)
+from backend.src.core.modules.wallet_summary.schemas import (
+    WalletSummaryDeltaDTO,
+    to_year_month,
+)
+
+
+class WalletSummaryUseCase:
+    """
+    Keeps wallet_monthly_summary and the wallet totals in step with transaction
+    writes. Deltas go through the request session, so they are committed
+    together with the transactions that caused them; cached statistics of the
+    touched wallets and users are dropped once that commit succeeded.
+
+    Writers must call lock_wallets before inserting or changing transactions:
+    the foreign-key checks of those inserts take shared locks on the wallet
+    rows, and upgrading them for the totals update later would deadlock two
+    concurrent writes to the same wallet. Updated and deleted transactions must
+    also be read under that lock: a delta built from a snapshot read would
+    subtract a value another request already replaced or removed.
+    """
+
+    def __init__(
+        self,
+        repository: WalletSummaryRepositoryInterface,
+        wallet_repository: WalletRepositoryInterface,
+        unit_of_work: UnitOfWorkInterface,
+        statistics_cache: TransactionStatisticsCache,
+    ):
+        self._repository = repository
+        self._wallet_repository = wallet_repository
+        self._unit_of_work = unit_of_work
+        self._statistics_cache = statistics_cache
+
+    async def lock_wallets(self, *wallet_ids: int) -> None:
+        await self._wallet_repository.lock_by_ids(sorted(set(wallet_ids)))
+
+    async def record_created(self, *transactions: Transaction) -> None:
+        await self._apply([self.to_delta(transaction) for transaction in transactions])
+
+    async def record_updated(
+        self, previous_delta: WalletSummaryDeltaDTO, transaction: Transaction
+    ) -> None:
+        await self._apply([previous_delta, self.to_delta(transaction)])
+
+    async def record_deleted(self, transaction: Transaction) -> None:
+        await self._apply([self.to_delta(transaction, sign=-1)])
+
+    @staticmethod
+    def to_delta(transaction: Transaction, sign: int = 1) -> WalletSummaryDeltaDTO:
+        return WalletSummaryDeltaDTO(
+            wallet_id=transaction.wallet_id,
+            user_id=transaction.user_id,
+            year_month=to_year_month(transaction.date),
+            type=transaction.type,
+            is_transfer=bool(transaction.is_transfer),
+            value=sign * Decimal(transaction.value),
+            transaction_count=sign,
+        )
+
+    async def _apply(self, deltas: Sequence[WalletSummaryDeltaDTO]) -> None:
+        merged: Dict[Tuple[int, int, TransactionType, bool], WalletSummaryDeltaDTO] = {}
+
+        for delta in deltas:
+            key = (delta.wallet_id, delta.year_month, delta.type, delta.is_transfer)
+            previous = merged.get(key)
+
+            if previous is not None:
+                delta = delta.model_copy(
+                    update={
+                        "value": previous.value + delta.value,
+                        "transaction_count": previous.transaction_count
+                        + delta.transaction_count,
+                    }
+                )
+
+            merged[key] = delta
+
+        changed = [
+            delta
+            for delta in merged.values()
+            if delta.value != 0 or delta.transaction_count != 0
+        ]
+
+        if not changed:
+            return
+
+        await self._repository.apply_deltas(changed)
+
+        for totals_delta in self._to_totals_deltas(changed):
+            await self._wallet_repository.adjust_totals(totals_delta)
+
+        owners = {(StatisticsScope.WALLET, delta.wallet_id) for delta in changed} | {
+            (StatisticsScope.USER, delta.user_id) for delta in changed
+        }
+        self._unit_of_work.add_after_commit_hook(
+            functools.partial(self._statistics_cache.invalidate, *owners)
+        )
+
+    @staticmethod
+    def _to_totals_deltas(
+        deltas: Sequence[WalletSummaryDeltaDTO],
+    ) -> Sequence[WalletTotalsDeltaDTO]:
+        totals: Dict[int, Dict[str, Decimal]] = {}
+
+        for delta in deltas:
+            wallet_totals = totals.setdefault(
+                delta.wallet_id,
+                {
+                    "incomes": Decimal(0),
+                    "expenses": Decimal(0),
+                    "transfers": Decimal(0),
+                },
+            )
+
+            if delta.is_transfer:
+                wallet_totals["transfers"] += (
+                    delta.value
+                    if delta.type == TransactionType.INCOME
+                    else -delta.value
+                )
+            elif delta.type == TransactionType.INCOME:
+                wallet_totals["incomes"] += delta.value
+            else:
+                wallet_totals["expenses"] += delta.value
+
+        return [
+            WalletTotalsDeltaDTO(wallet_id=wallet_id, **wallet_totals)
+            for wallet_id, wallet_totals in sorted(totals.items())
+            if any(wallet_totals.values())
+        ]
@@ -1,16 +1,23 @@
-from datetime import datetime
+from datetime import datetime, timezone
 
-from sqlalchemy import Integer, DateTime, func
+from sqlalchemy import Integer, DateTime
 from sqlalchemy.orm import MappedColumn, mapped_column
 from sqlalchemy.orm import declarative_base
 
 
-# pylint: disable=not-callable
+def utc_now() -> datetime:
+    """
+    Timestamps are computed in Python rather than with NOW() so SQLAlchemy knows
+    their values after a flush and does not have to read the row back.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class Base:
     id: MappedColumn[int] = mapped_column(Integer, primary_key=True, index=True)
-    created_at: MappedColumn[datetime] = mapped_column(DateTime, default=func.now())
+    created_at: MappedColumn[datetime] = mapped_column(DateTime, default=utc_now)
     updated_at: MappedColumn[datetime] = mapped_column(
-        DateTime, default=func.now(), onupdate=func.now()
+        DateTime, default=utc_now, onupdate=utc_now
     )
 
 
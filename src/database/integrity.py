@@ -0,0 +1,34 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.src.core.modules.common.exceptions import ObjectAlreadyExists
+
+MYSQL_DUPLICATE_ENTRY_ERROR_CODE = 1062
+
+
+def is_unique_violation(exception: IntegrityError) -> bool:
+    if exception.orig is None or not exception.orig.args:
+        return False
+
+    return bool(exception.orig.args[0] == MYSQL_DUPLICATE_ENTRY_ERROR_CODE)
+
+
+@asynccontextmanager
+async def unique_constraint_guard(session: AsyncSession) -> AsyncIterator[None]:
+    """
+    Duplicate-key violations raised inside the block are rolled back and turned
+    into ObjectAlreadyExists, so services can rely on the unique constraints of
+    the tables instead of checking for duplicates with a SELECT first.
+    """
+    try:
+        yield
+    except IntegrityError as exception:
+        await session.rollback()
+
+        if is_unique_violation(exception):
+            raise ObjectAlreadyExists() from exception
+
+        raise
@@ -36,6 +36,7 @@ from backend.src.core.modules.wallet.model import Wallet
 from backend.src.core.modules.transaction.model import Transaction
 from backend.src.core.modules.category.model import Category
 from backend.src.core.modules.subject.model import Subject
+from backend.src.core.modules.wallet_summary.model import WalletMonthlySummary
 
 target_metadata = BaseModel.metadata
 
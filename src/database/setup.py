@@ -1,45 +1,63 @@
-from asyncio import current_task
-from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Annotated, AsyncIterator
+from typing import AsyncGenerator, Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     create_async_engine,
     async_sessionmaker,
-    async_scoped_session,
 )
 
-from backend.src.config.database import DATABASE_URL
+from backend.src.config.database import (
+    DATABASE_URL,
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+)
+from backend.src.database.unit_of_work import UnitOfWork, UnitOfWorkInterface
 
 SessionLocal = async_sessionmaker[AsyncSession]
 
 
-def async_engine_factory() -> AsyncEngine:
-    return create_async_engine(url=DATABASE_URL, pool_size=50, max_overflow=100)
+def create_engine() -> AsyncEngine:
+    return create_async_engine(
+        url=DATABASE_URL,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+    )
 
 
-@asynccontextmanager
-async def _get_session_context(
-    async_engine: Annotated[AsyncEngine, Depends(async_engine_factory)]
-) -> AsyncIterator[async_scoped_session[AsyncSession]]:
-    session_local = async_sessionmaker(
+def create_session_factory(async_engine: AsyncEngine) -> SessionLocal:
+    return async_sessionmaker(
         autocommit=False, autoflush=False, bind=async_engine, expire_on_commit=False
     )
-    session = async_scoped_session(session_local, scopefunc=current_task)
 
-    try:
-        yield session
-    except Exception:
-        await session.rollback()
-        raise
-    finally:
-        await session.close()
+
+def get_session_factory(request: Request) -> SessionLocal:
+    """
+    Session factory is created once in the application lifespan and shared by all
+    requests, so every session checks its connection out of the same pool.
+    """
+    session_factory: SessionLocal = request.app.state.session_factory
+
+    return session_factory
 
 
 async def get_session(
-    session_context: Annotated[AsyncSession, Depends(_get_session_context)]
+    session_factory: Annotated[SessionLocal, Depends(get_session_factory)]
 ) -> AsyncGenerator[AsyncSession, None]:
-    async with session_context as session:
-        yield session
+    async with session_factory() as session:
+        try:
+            yield session
+        except Exception:
+            await session.rollback()
+            raise
+
+
+def get_unit_of_work(
+    session: Annotated[AsyncSession, Depends(get_session)]
+) -> UnitOfWorkInterface:
+    return UnitOfWork(session)
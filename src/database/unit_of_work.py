@@ -0,0 +1,50 @@
+from abc import ABC, abstractmethod
+from typing import Callable, List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.src.database.integrity import unique_constraint_guard
+
+
+class UnitOfWorkInterface(ABC):
+    def __init__(self) -> None:
+        self._after_commit_hooks: List[Callable[[], None]] = []
+
+    @abstractmethod
+    async def commit(self) -> None:
+        pass
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        pass
+
+    def add_after_commit_hook(self, hook: Callable[[], None]) -> None:
+        self._after_commit_hooks.append(hook)
+
+    def _run_after_commit_hooks(self) -> None:
+        hooks, self._after_commit_hooks = self._after_commit_hooks, []
+
+        for hook in hooks:
+            hook()
+
+
+class UnitOfWork(UnitOfWorkInterface):
+    """
+    Repositories only stage and flush their changes in the request session;
+    services call commit once when the whole operation has been applied.
+    Hooks run only once the commit succeeded and are dropped on rollback.
+    """
+
+    def __init__(self, session: AsyncSession):
+        super().__init__()
+        self._session = session
+
+    async def commit(self) -> None:
+        async with unique_constraint_guard(self._session):
+            await self._session.commit()
+
+        self._run_after_commit_hooks()
+
+    async def rollback(self) -> None:
+        self._after_commit_hooks = []
+        await self._session.rollback()
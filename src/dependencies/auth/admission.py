@@ -0,0 +1,15 @@
+from typing import Annotated, AsyncIterator
+
+from fastapi import Depends
+
+from backend.src.core.modules.common.admission import AdmissionController
+from backend.src.dependencies.auth.creators import get_auth_admission_controller
+
+
+async def auth_admission(
+    admission_controller: Annotated[
+        AdmissionController, Depends(get_auth_admission_controller)
+    ],
+) -> AsyncIterator[None]:
+    async with admission_controller.admit():
+        yield
@@ -1,3 +1,5 @@
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from typing import Annotated
 
 from fastapi import Depends
@@ -8,43 +10,77 @@ from backend.src.config.auth import (
     ALGORITHM,
     SECRET_KEY,
     REFRESH_TOKEN_SECRET_KEY,
+    PASSWORD_HASHING_MAX_WORKERS,
+    AUTH_ADMISSION_MAX_CONCURRENCY,
+    AUTH_ADMISSION_MAX_QUEUE_DEPTH,
+    AUTH_ADMISSION_WAIT_TIMEOUT,
+    TOKEN_DECODE_CACHE_MAX_SIZE,
 )
+from backend.src.core.modules.auth.schemas import CurrentUserDTO
+from backend.src.core.modules.common.admission import AdmissionController
+from backend.src.core.modules.common.cache import TTLCache
 from backend.src.core.modules.auth.services.password_services import (
     PasswordHashService,
     PasswordVerifyService,
 )
 from backend.src.core.modules.auth.services.token_service import TokenService
-from backend.src.core.modules.auth.services.refresh_token_service import (
-    RefreshTokenService,
-)
 
 
+@functools.cache
 def get_crypt_context() -> CryptContext:
     return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
+@functools.cache
+def get_password_hashing_executor() -> ThreadPoolExecutor:
+    """
+    One bounded pool per process, so a burst of logins can not occupy more
+    than PASSWORD_HASHING_MAX_WORKERS threads with bcrypt.
+    """
+    return ThreadPoolExecutor(
+        max_workers=PASSWORD_HASHING_MAX_WORKERS,
+        thread_name_prefix="password-hashing",
+    )
+
+
+@functools.cache
+def get_auth_admission_controller() -> AdmissionController:
+    """
+    Shared by every CPU-heavy auth endpoint, sized to the hashing pool so
+    requests wait here instead of piling up behind bcrypt.
+    """
+    return AdmissionController(
+        max_concurrency=AUTH_ADMISSION_MAX_CONCURRENCY,
+        max_queue_depth=AUTH_ADMISSION_MAX_QUEUE_DEPTH,
+        wait_timeout=AUTH_ADMISSION_WAIT_TIMEOUT,
+    )
+
+
 def get_password_hash_service(
-    crypt_context: Annotated[CryptContext, Depends(get_crypt_context)]
+    crypt_context: Annotated[CryptContext, Depends(get_crypt_context)],
+    executor: Annotated[ThreadPoolExecutor, Depends(get_password_hashing_executor)],
 ) -> PasswordHashService:
-    return PasswordHashService(crypt_context)
+    return PasswordHashService(crypt_context, executor)
 
 
 def get_password_verify_service(
-    crypt_context: Annotated[CryptContext, Depends(get_crypt_context)]
+    crypt_context: Annotated[CryptContext, Depends(get_crypt_context)],
+    executor: Annotated[ThreadPoolExecutor, Depends(get_password_hashing_executor)],
 ) -> PasswordVerifyService:
-    return PasswordVerifyService(crypt_context)
+    return PasswordVerifyService(crypt_context, executor)
+
+
+@functools.cache
+def get_token_decode_cache() -> TTLCache[CurrentUserDTO]:
+    return TTLCache(max_size=TOKEN_DECODE_CACHE_MAX_SIZE)
 
 
+@functools.cache
 def get_token_service() -> TokenService:
     return TokenService(
         algorithm=ALGORITHM,
         secret_key=SECRET_KEY,
         refresh_token_secret_key=REFRESH_TOKEN_SECRET_KEY,
         token_expire_minutes=ACCESS_TOKEN_EXPIRE_MINUTES,
+        decode_cache=get_token_decode_cache(),
     )
-
-
-def get_refresh_token_service(
-    token_service: Annotated[TokenService, Depends(get_token_service)]
-) -> RefreshTokenService:
-    return RefreshTokenService(token_service)
@@ -10,7 +10,7 @@ from backend.src.core.modules.auth.services.token_service import (
 )
 
 
-def get_current_user(
+async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
     token_service: Annotated[TokenService, Depends(get_token_service)],
 ) -> CurrentUserDTO:
@@ -1,10 +1,13 @@
 """
 This content cannot be in creators.py because of circular imports
 """
+
 from typing import Annotated
 
 from fastapi import Depends
 
+from backend.src.database.setup import get_unit_of_work
+from backend.src.database.unit_of_work import UnitOfWorkInterface
 from backend.src.core.modules.auth.services.login_service import LoginService
 from backend.src.core.modules.auth.services.password_services import (
     PasswordChangeService,
@@ -13,6 +16,9 @@ from backend.src.core.modules.auth.services.password_services import (
     PasswordHashService,
     PasswordVerifyService,
 )
+from backend.src.core.modules.auth.services.refresh_token_service import (
+    RefreshTokenService,
+)
 from backend.src.core.modules.auth.services.token_service import TokenService
 from backend.src.core.modules.user.repository_interface import UserRepositoryInterface
 from backend.src.core.modules.user.use_case import UserRetrievalUseCase
@@ -36,12 +42,14 @@ def get_password_change_service(
     verify_service: Annotated[
         PasswordVerifyService, Depends(get_password_verify_service)
     ],
+    unit_of_work: Annotated[UnitOfWorkInterface, Depends(get_unit_of_work)],
 ) -> PasswordChangeService:
     return PasswordChangeService(
         user_repository=user_repository,
         retrieval_use_case=retrieval_use_case,
         hash_service=hash_service,
         verify_service=verify_service,
+        unit_of_work=unit_of_work,
     )
 
 
@@ -59,3 +67,15 @@ def get_login_service(
         token_service=token_service,
         user_retrieval_use_case=retrieval_use_case,
     )
+
+
+def get_refresh_token_service(
+    retrieval_use_case: Annotated[
+        UserRetrievalUseCase, Depends(get_user_retrieval_use_case)
+    ],
+    token_service: Annotated[TokenService, Depends(get_token_service)],
+) -> RefreshTokenService:
+    return RefreshTokenService(
+        token_service=token_service,
+        user_retrieval_use_case=retrieval_use_case,
+    )
@@ -3,7 +3,8 @@ from typing import Annotated
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.src.database.setup import get_session
+from backend.src.database.setup import get_session, get_unit_of_work
+from backend.src.database.unit_of_work import UnitOfWorkInterface
 from backend.src.core.modules.category.repository_interface import (
     CategoryRepositoryInterface,
 )
@@ -32,13 +33,18 @@ def get_category_service(
     retrieval_use_case: Annotated[
         CategoryRetrievalUseCase, Depends(get_category_retrieval_use_case)
     ],
+    unit_of_work: Annotated[UnitOfWorkInterface, Depends(get_unit_of_work)],
 ) -> CategoryService:
-    return CategoryService(repository=repository, retrieval_use_case=retrieval_use_case)
+    return CategoryService(
+        repository=repository,
+        retrieval_use_case=retrieval_use_case,
+        unit_of_work=unit_of_work,
+    )
 
 
 def get_category_validator(
     retrieval_use_case: Annotated[
-        CategoryRetrievalUseCase, Depends(get_category_service)
+        CategoryRetrievalUseCase, Depends(get_category_retrieval_use_case)
     ]
 ) -> CategoryValidator:
     return CategoryValidator(retrieval_use_case)
@@ -1,3 +1,5 @@
+from typing import Any, Dict
+
 from fastapi import Request, HTTPException
 
 from backend.src.dependencies.common.enums import IdentifierSource
@@ -12,9 +14,28 @@ def get_id_from_url_path(request: Request, name: str) -> int:
     return int(value)
 
 
+async def get_request_body(request: Request) -> Dict[str, Any]:
+    """
+    Starlette memoises the decoded JSON on the Request and FastAPI passes the
+    same Request to the route and to every dependency, so the body is decoded
+    at most once per request however many permissions read from it.
+    """
+    try:
+        json_data = await request.json()
+    except ValueError as exception:
+        raise HTTPException(
+            status_code=400, detail="Invalid request body"
+        ) from exception
+
+    if not isinstance(json_data, dict):
+        raise HTTPException(status_code=400, detail="Invalid request body")
+
+    return json_data
+
+
 async def get_id_from_request(request: Request, name: str) -> int:
-    json_data = await request.json()
-    value = json_data[name]
+    json_data = await get_request_body(request)
+    value = json_data.get(name)
 
     if value is None:
         raise HTTPException(status_code=400, detail="Request argument not found")
@@ -0,0 +1,25 @@
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.src.database.setup import get_session
+from backend.src.core.modules.ownership.repository_interface import (
+    OwnershipRepositoryInterface,
+)
+from backend.src.core.modules.ownership.repository import OwnershipRepository
+from backend.src.core.modules.ownership.validator import OwnershipValidator
+
+
+def get_ownership_repository(
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> OwnershipRepositoryInterface:
+    return OwnershipRepository(session)
+
+
+def get_ownership_validator(
+    repository: Annotated[
+        OwnershipRepositoryInterface, Depends(get_ownership_repository)
+    ],
+) -> OwnershipValidator:
+    return OwnershipValidator(repository)
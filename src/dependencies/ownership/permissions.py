@@ -0,0 +1,46 @@
+from typing import Annotated, NamedTuple
+
+from fastapi import Depends, Request
+
+from backend.src.dependencies.auth.permissions import get_current_user
+from backend.src.dependencies.common.enums import IdentifierSource
+from backend.src.dependencies.common.helpers import get_object_id
+from backend.src.dependencies.ownership.creators import get_ownership_validator
+from backend.src.core.modules.auth.schemas import CurrentUserDTO
+from backend.src.core.modules.ownership.enum import OwnedResource
+from backend.src.core.modules.ownership.validator import OwnershipValidator
+
+
+class OwnedIdentifier(NamedTuple):
+    resource: OwnedResource
+    name: str
+    source: IdentifierSource = IdentifierSource.PATH_PARAMETER
+
+
+class OwnershipPermission:
+    def __init__(self, *identifiers: OwnedIdentifier):
+        """
+        :param identifiers - Objects which have to belong to the current user,
+        checked together with a single query:
+        """
+        self._identifiers = identifiers
+
+    async def __call__(
+        self,
+        request: Request,
+        current_user: Annotated[CurrentUserDTO, Depends(get_current_user)],
+        ownership_validator: Annotated[
+            OwnershipValidator, Depends(get_ownership_validator)
+        ],
+    ) -> None:
+        identifiers = [
+            (
+                identifier.resource,
+                await get_object_id(
+                    scope=identifier.source, request=request, name=identifier.name
+                ),
+            )
+            for identifier in self._identifiers
+        ]
+
+        await ownership_validator.user_is_owner(current_user.id, identifiers)
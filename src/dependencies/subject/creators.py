@@ -3,7 +3,8 @@ from typing import Annotated
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.src.database.setup import get_session
+from backend.src.database.setup import get_session, get_unit_of_work
+from backend.src.database.unit_of_work import UnitOfWorkInterface
 from backend.src.core.modules.subject.repository_interface import (
     SubjectRepositoryInterface,
 )
@@ -30,8 +31,13 @@ def get_subject_service(
     retrieval_use_case: Annotated[
         SubjectRetrievalUseCase, Depends(get_subject_retrieval_use_case)
     ],
+    unit_of_work: Annotated[UnitOfWorkInterface, Depends(get_unit_of_work)],
 ) -> SubjectService:
-    return SubjectService(repository=repository, retrieval_use_case=retrieval_use_case)
+    return SubjectService(
+        repository=repository,
+        retrieval_use_case=retrieval_use_case,
+        unit_of_work=unit_of_work,
+    )
 
 
 def get_subject_validator(
@@ -0,0 +1,16 @@
+import functools
+
+from backend.src.config.statistics import (
+    STATISTICS_CACHE_MAX_SIZE,
+    STATISTICS_CACHE_TTL_SECONDS,
+)
+from backend.src.core.modules.transaction.statistics_cache import (
+    TransactionStatisticsCache,
+)
+
+
+@functools.cache
+def get_transaction_statistics_cache() -> TransactionStatisticsCache:
+    return TransactionStatisticsCache(
+        max_size=STATISTICS_CACHE_MAX_SIZE, ttl_seconds=STATISTICS_CACHE_TTL_SECONDS
+    )
@@ -3,7 +3,8 @@ from typing import Annotated
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.src.database.setup import get_session
+from backend.src.database.setup import get_session, get_unit_of_work
+from backend.src.database.unit_of_work import UnitOfWorkInterface
 from backend.src.core.modules.transaction.repository_interface import (
     TransactionRepositoryInterface,
 )
@@ -11,6 +12,9 @@ from backend.src.core.modules.transaction.repository import TransactionRepositor
 from backend.src.core.modules.transaction.services.crud_service import (
     TransactionService,
 )
+from backend.src.core.modules.transaction.services.export_service import (
+    TransactionExportService,
+)
 from backend.src.core.modules.transaction.services.query_service import (
     TransactionQueryService,
 )
@@ -20,8 +24,25 @@ from backend.src.core.modules.transaction.services.statistics_service import (
 from backend.src.core.modules.transaction.services.transfer_service import (
     TransactionTransferService,
 )
-from backend.src.core.modules.transaction.validator import TransactionValidator
+from backend.src.core.modules.transaction.statistics_cache import (
+    TransactionStatisticsCache,
+)
 from backend.src.core.modules.transaction.use_case import TransactionRetrievalUseCase
+from backend.src.core.modules.wallet.repository_interface import (
+    WalletRepositoryInterface,
+)
+from backend.src.core.modules.wallet_summary.repository_interface import (
+    WalletSummaryRepositoryInterface,
+)
+from backend.src.core.modules.wallet_summary.use_case import WalletSummaryUseCase
+from backend.src.dependencies.transaction.cache import (
+    get_transaction_statistics_cache,
+)
+from backend.src.dependencies.wallet.creators import get_wallet_repository
+from backend.src.dependencies.wallet_summary.creators import (
+    get_wallet_summary_repository,
+    get_wallet_summary_use_case,
+)
 
 
 def get_transaction_repository(
@@ -41,9 +62,16 @@ def get_transaction_service(
     retrieval_use_case: Annotated[
         TransactionRetrievalUseCase, Depends(get_transaction_retrieval_use_case)
     ],
+    unit_of_work: Annotated[UnitOfWorkInterface, Depends(get_unit_of_work)],
+    wallet_summary_use_case: Annotated[
+        WalletSummaryUseCase, Depends(get_wallet_summary_use_case)
+    ],
 ) -> TransactionService:
     return TransactionService(
-        repository=repository, retrieval_use_case=retrieval_use_case
+        repository=repository,
+        retrieval_use_case=retrieval_use_case,
+        unit_of_work=unit_of_work,
+        wallet_summary_use_case=wallet_summary_use_case,
     )
 
 
@@ -53,21 +81,45 @@ def get_transaction_query_service(
     return TransactionQueryService(repository)
 
 
-def get_transaction_statistics_service(
+def get_transaction_export_service(
     repository: Annotated[TransactionRepository, Depends(get_transaction_repository)]
+) -> TransactionExportService:
+    return TransactionExportService(repository)
+
+
+def get_transaction_statistics_service(
+    repository: Annotated[
+        WalletSummaryRepositoryInterface, Depends(get_wallet_summary_repository)
+    ],
+    wallet_repository: Annotated[
+        WalletRepositoryInterface, Depends(get_wallet_repository)
+    ],
+    transaction_repository: Annotated[
+        TransactionRepositoryInterface, Depends(get_transaction_repository)
+    ],
+    statistics_cache: Annotated[
+        TransactionStatisticsCache, Depends(get_transaction_statistics_cache)
+    ],
+    unit_of_work: Annotated[UnitOfWorkInterface, Depends(get_unit_of_work)],
 ) -> TransactionStatisticsService:
-    return TransactionStatisticsService(repository)
+    return TransactionStatisticsService(
+        repository=repository,
+        wallet_repository=wallet_repository,
+        transaction_repository=transaction_repository,
+        statistics_cache=statistics_cache,
+        unit_of_work=unit_of_work,
+    )
 
 
 def get_transaction_transfer_service(
-    repository: Annotated[TransactionRepository, Depends(get_transaction_repository)]
+    repository: Annotated[TransactionRepository, Depends(get_transaction_repository)],
+    unit_of_work: Annotated[UnitOfWorkInterface, Depends(get_unit_of_work)],
+    wallet_summary_use_case: Annotated[
+        WalletSummaryUseCase, Depends(get_wallet_summary_use_case)
+    ],
 ) -> TransactionTransferService:
-    return TransactionTransferService(repository)
-
-
-def get_transaction_validator(
-    retrieval_use_case: Annotated[
-        TransactionRetrievalUseCase, Depends(get_transaction_retrieval_use_case)
-    ]
-) -> TransactionValidator:
-    return TransactionValidator(retrieval_use_case)
+    return TransactionTransferService(
+        repository=repository,
+        unit_of_work=unit_of_work,
+        wallet_summary_use_case=wallet_summary_use_case,
+    )
@@ -1,11 +1,15 @@
+import functools
 from typing import Annotated
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.src.database.setup import get_session
+from backend.src.config.auth import ADMIN_ROLE_CACHE_MAX_SIZE
+from backend.src.database.setup import get_session, get_unit_of_work
+from backend.src.database.unit_of_work import UnitOfWorkInterface
 from backend.src.dependencies.auth.creators import get_password_hash_service
 from backend.src.core.modules.auth.services.password_services import PasswordHashService
+from backend.src.core.modules.common.cache import TTLCache
 from backend.src.core.modules.user.repository_interface import UserRepositoryInterface
 from backend.src.core.modules.user.repository import UserRepository
 from backend.src.core.modules.user.service import UserService
@@ -13,13 +17,13 @@ from backend.src.core.modules.user.use_case import UserRetrievalUseCase
 
 
 def get_user_repository(
-    session: Annotated[AsyncSession, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_session)],
 ) -> UserRepositoryInterface:
     return UserRepository(session)
 
 
 def get_user_retrieval_use_case(
-    repository: Annotated[UserRepositoryInterface, Depends(get_user_repository)]
+    repository: Annotated[UserRepositoryInterface, Depends(get_user_repository)],
 ) -> UserRetrievalUseCase:
     return UserRetrievalUseCase(repository)
 
@@ -30,9 +34,16 @@ def get_user_service(
         UserRetrievalUseCase, Depends(get_user_retrieval_use_case)
     ],
     hash_service: Annotated[PasswordHashService, Depends(get_password_hash_service)],
+    unit_of_work: Annotated[UnitOfWorkInterface, Depends(get_unit_of_work)],
 ) -> UserService:
     return UserService(
         repository=repository,
         retrieval_use_case=retrieval_use_case,
         password_hash_service=hash_service,
+        unit_of_work=unit_of_work,
     )
+
+
+@functools.cache
+def get_admin_role_cache() -> TTLCache[bool]:
+    return TTLCache(max_size=ADMIN_ROLE_CACHE_MAX_SIZE)
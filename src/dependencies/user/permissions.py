@@ -1,10 +1,16 @@
+import time
 from typing import Annotated
 
 from fastapi import Depends
 
+from backend.src.config.auth import ADMIN_CLAIM_MAX_AGE_SECONDS
 from backend.src.dependencies.auth.permissions import get_current_user
-from backend.src.dependencies.user.creators import get_user_service
+from backend.src.dependencies.user.creators import (
+    get_admin_role_cache,
+    get_user_service,
+)
 from backend.src.core.modules.auth.schemas import CurrentUserDTO
+from backend.src.core.modules.common.cache import TTLCache
 from backend.src.core.modules.common.exceptions import PermissionDenied
 from backend.src.core.modules.user.service import UserService
 
@@ -12,8 +18,44 @@ from backend.src.core.modules.user.service import UserService
 async def admin_permission(
     current_user: Annotated[CurrentUserDTO, Depends(get_current_user)],
     user_service: Annotated[UserService, Depends(get_user_service)],
+    admin_role_cache: Annotated[TTLCache[bool], Depends(get_admin_role_cache)],
 ) -> None:
-    user = await user_service.get_by_id(current_user.id)
+    if _has_fresh_role_claim(current_user):
+        is_admin = current_user.is_admin
+    else:
+        is_admin = await _get_admin_role(
+            current_user.id, user_service, admin_role_cache
+        )
 
-    if not user.is_admin:
+    if not is_admin:
         raise PermissionDenied()
+
+
+def _has_fresh_role_claim(current_user: CurrentUserDTO) -> bool:
+    """
+    The is_admin claim is trusted for ADMIN_CLAIM_MAX_AGE_SECONDS after the
+    token was issued; older tokens re-check the role in the database, so a
+    demotion takes effect within that window.
+    """
+    if current_user.issued_at is None:
+        return False
+
+    return time.time() - current_user.issued_at <= ADMIN_CLAIM_MAX_AGE_SECONDS
+
+
+async def _get_admin_role(
+    user_id: int, user_service: UserService, admin_role_cache: TTLCache[bool]
+) -> bool:
+    """
+    Roles read from the database are kept for ADMIN_CLAIM_MAX_AGE_SECONDS, so
+    a token past its claim window costs at most one lookup per user per window.
+    """
+    is_admin = admin_role_cache.get(user_id)
+
+    if is_admin is None:
+        is_admin = await user_service.is_admin(user_id)
+        admin_role_cache.set(
+            user_id, is_admin, time.time() + ADMIN_CLAIM_MAX_AGE_SECONDS
+        )
+
+    return is_admin
@@ -3,24 +3,30 @@ from typing import Annotated
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.src.database.setup import get_session
+from backend.src.database.setup import get_session, get_unit_of_work
+from backend.src.database.unit_of_work import UnitOfWorkInterface
+from backend.src.core.modules.transaction.statistics_cache import (
+    TransactionStatisticsCache,
+)
 from backend.src.core.modules.wallet.repository_interface import (
     WalletRepositoryInterface,
 )
 from backend.src.core.modules.wallet.repository import WalletRepository
 from backend.src.core.modules.wallet.service import WalletService
-from backend.src.core.modules.wallet.validator import WalletValidator
 from backend.src.core.modules.wallet.use_case import WalletRetrievalUseCase
+from backend.src.dependencies.transaction.cache import (
+    get_transaction_statistics_cache,
+)
 
 
 def get_wallet_repository(
-    session: Annotated[AsyncSession, Depends(get_session)]
+    session: Annotated[AsyncSession, Depends(get_session)],
 ) -> WalletRepositoryInterface:
     return WalletRepository(session)
 
 
 def get_wallet_retrieval_use_case(
-    repository: Annotated[WalletRepositoryInterface, Depends(get_wallet_repository)]
+    repository: Annotated[WalletRepositoryInterface, Depends(get_wallet_repository)],
 ) -> WalletRetrievalUseCase:
     return WalletRetrievalUseCase(repository)
 
@@ -30,13 +36,14 @@ def get_wallet_service(
     retrieval_use_case: Annotated[
         WalletRetrievalUseCase, Depends(get_wallet_retrieval_use_case)
     ],
+    unit_of_work: Annotated[UnitOfWorkInterface, Depends(get_unit_of_work)],
+    statistics_cache: Annotated[
+        TransactionStatisticsCache, Depends(get_transaction_statistics_cache)
+    ],
 ) -> WalletService:
-    return WalletService(repository=repository, retrieval_use_case=retrieval_use_case)
-
-
-def get_wallet_validator(
-    retrieval_use_case: Annotated[
-        WalletRetrievalUseCase, Depends(get_wallet_retrieval_use_case)
-    ]
-) -> WalletValidator:
-    return WalletValidator(retrieval_use_case)
+    return WalletService(
+        repository=repository,
+        retrieval_use_case=retrieval_use_case,
+        unit_of_work=unit_of_work,
+        statistics_cache=statistics_cache,
+    )
@@ -0,0 +1,48 @@
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.src.database.setup import get_session, get_unit_of_work
+from backend.src.database.unit_of_work import UnitOfWorkInterface
+from backend.src.core.modules.transaction.statistics_cache import (
+    TransactionStatisticsCache,
+)
+from backend.src.core.modules.wallet_summary.repository import WalletSummaryRepository
+from backend.src.core.modules.wallet_summary.repository_interface import (
+    WalletSummaryRepositoryInterface,
+)
+from backend.src.core.modules.wallet.repository_interface import (
+    WalletRepositoryInterface,
+)
+from backend.src.core.modules.wallet_summary.use_case import WalletSummaryUseCase
+from backend.src.dependencies.transaction.cache import (
+    get_transaction_statistics_cache,
+)
+from backend.src.dependencies.wallet.creators import get_wallet_repository
+
+
+def get_wallet_summary_repository(
+    session: Annotated[AsyncSession, Depends(get_session)]
+) -> WalletSummaryRepositoryInterface:
+    return WalletSummaryRepository(session)
+
+
+def get_wallet_summary_use_case(
+    repository: Annotated[
+        WalletSummaryRepositoryInterface, Depends(get_wallet_summary_repository)
+    ],
+    wallet_repository: Annotated[
+        WalletRepositoryInterface, Depends(get_wallet_repository)
+    ],
+    unit_of_work: Annotated[UnitOfWorkInterface, Depends(get_unit_of_work)],
+    statistics_cache: Annotated[
+        TransactionStatisticsCache, Depends(get_transaction_statistics_cache)
+    ],
+) -> WalletSummaryUseCase:
+    return WalletSummaryUseCase(
+        repository=repository,
+        wallet_repository=wallet_repository,
+        unit_of_work=unit_of_work,
+        statistics_cache=statistics_cache,
+    )
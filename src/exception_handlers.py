@@ -9,7 +9,9 @@ from backend.src.core.modules.common.exceptions import (
     ObjectDoesNotExist,
     ObjectAlreadyExists,
     PermissionDenied,
+    ServiceOverloaded,
 )
+from backend.src.core.modules.transaction.exceptions import InvalidCursor
 from backend.src.core.modules.user.exceptions import PasswordDoesNotMatch
 
 
@@ -42,6 +44,18 @@ async def http_exception_handler(request: Request, exception: BaseHttpException)
             status_code=status.HTTP_403_FORBIDDEN, content={"detail": exception.detail}
         )
 
+    if isinstance(exception, InvalidCursor):
+        return JSONResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            content={"detail": exception.detail},
+        )
+
+    if isinstance(exception, ServiceOverloaded):
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": exception.detail},
+        )
+
     if isinstance(exception, DateRangeConflict):
         return JSONResponse(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, content=exception.detail
@@ -1,8 +1,12 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 import uvicorn
 from fastapi import FastAPI
 
 from backend.src.api.v1.auth.routers import router as auth_router
 from backend.src.api.v1.category.routers import router as category_router
+from backend.src.api.v1.metrics.routers import router as metrics_router
 from backend.src.api.v1.subject.routers.subject import router as subject_router
 from backend.src.api.v1.subject.routers.subject_transactions import (
     router as subject_transactions_router,
@@ -18,10 +22,30 @@ from backend.src.api.v1.wallet.routers.wallet_transactions import (
     router as wallet_transactions_router,
 )
 from backend.src.api.v1.wallet.routers.wallet_transfer import router as wallet_transfer
+from backend.src.database.setup import create_engine, create_session_factory
+from backend.src.dependencies.auth.creators import (
+    get_crypt_context,
+    get_password_hashing_executor,
+    get_token_service,
+)
 from backend.src.exception_handlers import http_exception_handler
 from backend.src.core.modules.common.exceptions import BaseHttpException
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(application: FastAPI) -> AsyncIterator[None]:
+    async_engine = create_engine()
+    application.state.session_factory = create_session_factory(async_engine)
+    get_crypt_context()
+    get_token_service()
+
+    yield
+
+    await async_engine.dispose()
+    get_password_hashing_executor().shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.include_router(user_router)
 app.include_router(user_me_router)
@@ -34,6 +58,7 @@ app.include_router(transaction_router)
 app.include_router(subject_router)
 app.include_router(subject_transactions_router)
 app.include_router(auth_router)
+app.include_router(metrics_router)
 
 app.add_exception_handler(BaseHttpException, http_exception_handler)
 
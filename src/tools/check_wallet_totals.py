@@ -0,0 +1,48 @@
+"""
+Compares the running totals stored on wallets with the sums of their
+transactions and reports every wallet that drifted. With --fix the drifted
+wallets are recomputed from their transactions:
+
+    python -m backend.src.tools.check_wallet_totals [--fix]
+"""
+import argparse
+import asyncio
+
+from backend.src.database.setup import create_engine, create_session_factory
+from backend.src.database.unit_of_work import UnitOfWork
+from backend.src.core.modules.wallet.repository import WalletRepository
+
+
+async def check_wallet_totals(fix: bool) -> int:
+    engine = create_engine()
+
+    try:
+        async with create_session_factory(engine)() as session:
+            repository = WalletRepository(session)
+            drift = await repository.get_totals_drift()
+
+            for wallet_drift in drift:
+                print(
+                    f"wallet {wallet_drift.wallet_id}: "
+                    f"stored {wallet_drift.stored.model_dump()}, "
+                    f"expected {wallet_drift.expected.model_dump()}"
+                )
+
+            if fix and drift:
+                await repository.reconcile_totals(
+                    [wallet_drift.wallet_id for wallet_drift in drift]
+                )
+                await UnitOfWork(session).commit()
+    finally:
+        await engine.dispose()
+
+    return len(drift)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fix", action="store_true")
+    arguments = parser.parse_args()
+
+    drifted = asyncio.run(check_wallet_totals(arguments.fix))
+    print(f"{drifted} wallet(s) drifted")
@@ -0,0 +1,26 @@
+"""
+Recomputes wallet_monthly_summary from the transactions table. Run it after
+importing transactions outside the API or whenever the summary drifts:
+
+    python -m backend.src.tools.rebuild_wallet_summary
+"""
+import asyncio
+
+from backend.src.database.setup import create_engine, create_session_factory
+from backend.src.database.unit_of_work import UnitOfWork
+from backend.src.core.modules.wallet_summary.repository import WalletSummaryRepository
+
+
+async def rebuild_wallet_summary() -> None:
+    engine = create_engine()
+
+    try:
+        async with create_session_factory(engine)() as session:
+            await WalletSummaryRepository(session).rebuild()
+            await UnitOfWork(session).commit()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(rebuild_wallet_summary())
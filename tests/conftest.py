@@ -1,23 +1,42 @@
 # pylint: disable=W0621,W0108
-from typing import Dict, Any
+from typing import Dict, Any, Iterator
 
 import pytest
 from httpx import AsyncClient
 
+from backend.src.database.setup import get_unit_of_work
+from backend.src.core.modules.transaction.statistics_cache import (
+    TransactionStatisticsCache,
+)
 from backend.src.dependencies.category.creators import get_category_repository
+from backend.src.dependencies.ownership.creators import get_ownership_repository
 from backend.src.dependencies.subject.creators import get_subject_repository
+from backend.src.dependencies.transaction.cache import (
+    get_transaction_statistics_cache,
+)
 from backend.src.dependencies.transaction.creators import get_transaction_repository
 from backend.src.dependencies.user.creators import get_user_repository
 from backend.src.dependencies.wallet.creators import get_wallet_repository
+from backend.src.dependencies.wallet_summary.creators import (
+    get_wallet_summary_repository,
+)
 from backend.src.main import app
 from backend.tests.database import get_user_db
 from backend.tests.integration.category.repository import InMemoryCategoryRepository
+from backend.tests.integration.ownership.repository import (
+    InMemoryOwnershipRepository,
+)
 from backend.tests.integration.subject.repository import InMemorySubjectRepository
 from backend.tests.integration.transaction.repository import (
     InMemoryTransactionRepository,
 )
+from backend.tests.integration.unit_of_work import InMemoryUnitOfWork
 from backend.tests.integration.user.repository import InMemoryUserRepository
 from backend.tests.integration.wallet.repository import InMemoryWalletRepository
+from backend.tests.integration.wallet_summary.repository import (
+    InMemoryWalletSummaryRepository,
+)
+from backend.tests.overrides import DependencyOverrides
 
 app.dependency_overrides[get_user_repository] = lambda: InMemoryUserRepository()
 app.dependency_overrides[get_wallet_repository] = lambda: InMemoryWalletRepository()
@@ -26,6 +45,13 @@ app.dependency_overrides[get_subject_repository] = lambda: InMemorySubjectReposi
 app.dependency_overrides[
     get_transaction_repository
 ] = lambda: InMemoryTransactionRepository()
+app.dependency_overrides[
+    get_ownership_repository
+] = lambda: InMemoryOwnershipRepository()
+app.dependency_overrides[
+    get_wallet_summary_repository
+] = lambda: InMemoryWalletSummaryRepository()
+app.dependency_overrides[get_unit_of_work] = lambda: InMemoryUnitOfWork()
 
 
 @pytest.fixture
@@ -43,3 +69,36 @@ def test_user() -> Dict[str, str]:
 async def access_token(async_client: AsyncClient, test_user: Dict[str, str]) -> Any:
     response = await async_client.post("/api/v1/auth/login", data=test_user)
     return response.json()["access_token"]
+
+
+@pytest.fixture
+def dependency_overrides() -> Iterator[DependencyOverrides]:
+    dependency_overrides = DependencyOverrides()
+    yield dependency_overrides
+    dependency_overrides.restore()
+
+
+@pytest.fixture
+def statistics_cache(
+    dependency_overrides: DependencyOverrides,
+) -> TransactionStatisticsCache:
+    return dependency_overrides.set(
+        get_transaction_statistics_cache,
+        TransactionStatisticsCache(max_size=10, ttl_seconds=60),
+    )
+
+
+@pytest.fixture
+def wallet_summary_repository(
+    dependency_overrides: DependencyOverrides,
+) -> InMemoryWalletSummaryRepository:
+    return dependency_overrides.set(
+        get_wallet_summary_repository, InMemoryWalletSummaryRepository()
+    )
+
+
+@pytest.fixture
+def wallet_repository(
+    dependency_overrides: DependencyOverrides,
+) -> InMemoryWalletRepository:
+    return dependency_overrides.set(get_wallet_repository, InMemoryWalletRepository())
@@ -73,6 +73,10 @@ def get_wallet_data() -> List[Wallet]:
             name=BASE_WALLET_DATA["name"],
             description=BASE_WALLET_DATA["description"],
             user_id=BASE_WALLET_DATA["user_id"],
+            balance=Decimal("0.00"),
+            incomes=Decimal("20.00"),
+            expenses=Decimal("20.00"),
+            transfers=Decimal("0.00"),
             created_at=datetime.now(),
             updated_at=datetime.now(),
             transactions=[get_transaction_data()[0], get_transaction_data()[1]],
@@ -82,6 +86,10 @@ def get_wallet_data() -> List[Wallet]:
             name="Konto_user_2",
             description="description",
             user_id=2,
+            balance=Decimal("20.00"),
+            incomes=Decimal("20.00"),
+            expenses=Decimal("0.00"),
+            transfers=Decimal("0.00"),
             created_at=datetime.now(),
             updated_at=datetime.now(),
             transactions=[get_transaction_data()[2]],
@@ -183,7 +191,10 @@ def get_transaction_data() -> List[Transaction]:
             category_id=BASE_CATEGORY_ID,
         ),
         Transaction(
-            **(BASE_TRANSACTION_DATA | {"id": 2, "type": TransactionType.EXPENSE}),
+            **(
+                BASE_TRANSACTION_DATA
+                | {"id": 2, "name": "name 2", "type": TransactionType.EXPENSE}
+            ),
             created_at=datetime.now(),
             updated_at=datetime.now(),
             user_id=BASE_USER_ID,
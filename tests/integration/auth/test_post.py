@@ -0,0 +1,112 @@
+# pylint: disable=W0611,W0108,W0621
+import time
+from datetime import datetime, timedelta
+from typing import Dict
+
+import pytest
+from httpx import AsyncClient
+from jose import jwt
+
+from backend.src.core.modules.common.cache import TTLCache
+from backend.src.dependencies.auth.creators import get_token_service
+from backend.src.dependencies.user.creators import get_admin_role_cache
+from backend.tests.overrides import DependencyOverrides
+
+
+@pytest.fixture
+def admin_role_cache(dependency_overrides: DependencyOverrides) -> TTLCache[bool]:
+    admin_role_cache: TTLCache[bool] = TTLCache(max_size=10)
+    return dependency_overrides.set(get_admin_role_cache, admin_role_cache)
+
+
+def _encode_stale_admin_claim(user_id: int, email: str) -> str:
+    token_service = get_token_service()
+    token: str = jwt.encode(
+        claims={
+            "id": user_id,
+            "sub": email,
+            "is_admin": True,
+            "iat": int(time.time()) - 3600,
+            "exp": datetime.now() + timedelta(minutes=5),
+        },
+        key=token_service.secret_key,
+        algorithm=token_service.algorithm,
+    )
+
+    return token
+
+
+@pytest.mark.asyncio
+async def test_refresh_token(async_client: AsyncClient, test_user: Dict[str, str]):
+    # Given
+    login_response = await async_client.post("/api/v1/auth/login", data=test_user)
+    refresh_token = login_response.json()["refresh_token"]
+
+    # When
+    response = await async_client.post(
+        "/api/v1/auth/refresh-token",
+        headers={"Authorization": f"Bearer {refresh_token}"},
+    )
+
+    # Then
+    assert response.status_code == 200
+    admin_response = await async_client.get(
+        "/api/v1/users",
+        headers={"Authorization": f"Bearer {response.json()['access_token']}"},
+    )
+    assert admin_response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_admin_permission_for_non_admin(async_client: AsyncClient):
+    # Given
+    login_response = await async_client.post(
+        "/api/v1/auth/login", data={"username": "user", "password": "1234"}
+    )
+
+    # When
+    response = await async_client.get(
+        "/api/v1/users",
+        headers={"Authorization": f"Bearer {login_response.json()['access_token']}"},
+    )
+
+    # Then
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_admin_permission_rechecks_stale_admin_claim(
+    async_client: AsyncClient, admin_role_cache: TTLCache[bool]
+):
+    # Given
+    token = _encode_stale_admin_claim(2, "user@email.pl")
+
+    # When
+    response = await async_client.get(
+        "/api/v1/users", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    # Then
+    assert response.status_code == 403
+    assert admin_role_cache.get(2) is False
+
+
+@pytest.mark.asyncio
+async def test_admin_permission_caches_role_recheck(
+    async_client: AsyncClient, admin_role_cache: TTLCache[bool]
+):
+    # Given
+    token = _encode_stale_admin_claim(1, "email@email.pl")
+
+    # When
+    responses = [
+        await async_client.get(
+            "/api/v1/users", headers={"Authorization": f"Bearer {token}"}
+        )
+        for _ in range(2)
+    ]
+
+    # Then
+    metrics = admin_role_cache.get_metrics()
+    assert [response.status_code for response in responses] == [200, 200]
+    assert (metrics.hits, metrics.misses) == (1, 1)
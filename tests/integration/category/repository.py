@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import List
 
+from backend.src.core.modules.common.exceptions import ObjectAlreadyExists
 from backend.src.core.modules.category.repository_interface import (
     CategoryRepositoryInterface,
 )
@@ -14,12 +15,14 @@ class InMemoryCategoryRepository(CategoryRepositoryInterface):
         self._categories: List[Category] = get_category_data()
 
     async def save(self, category: Category) -> Category:
+        self._ensure_unique(category)
         category.id = len(self._categories) + 1
         category.created_at = category.updated_at = datetime.utcnow()
         self._categories.append(category)
         return category
 
     async def update(self, category: Category) -> Category:
+        self._ensure_unique(category)
         return category
 
     async def delete(self, category: Category) -> None:
@@ -46,8 +49,11 @@ class InMemoryCategoryRepository(CategoryRepositoryInterface):
                 return category
         return None
 
-    async def get_by_name_and_user_id(self, name: str, user_id: int) -> Category | None:
-        for category in self._categories:
-            if category.name == name and category.user_id == user_id:
-                return category
-        return None
+    def _ensure_unique(self, category: Category) -> None:
+        if any(
+            other is not category
+            and other.user_id == category.user_id
+            and other.name == category.name
+            for other in self._categories
+        ):
+            raise ObjectAlreadyExists()
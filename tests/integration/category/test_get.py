@@ -1,9 +1,14 @@
+# pylint: disable=W0621
 from typing import Coroutine, Any
 
 import pytest
 from httpx import AsyncClient
 
+from backend.src.core.modules.category.model import Category
+from backend.src.dependencies.category.creators import get_category_repository
 from backend.tests.database import BASE_CATEGORY_ID, BASE_CATEGORY_DATA
+from backend.tests.integration.category.repository import InMemoryCategoryRepository
+from backend.tests.overrides import DependencyOverrides
 
 
 @pytest.mark.asyncio
@@ -70,3 +75,42 @@ async def test_get_category_by_id_does_not_exist(
 
     # Then
     assert response.status_code == 404
+
+
+class CountingCategoryRepository(InMemoryCategoryRepository):
+    def __init__(self):
+        super().__init__()
+        self.get_by_id_calls = 0
+
+    async def get_by_id(self, category_id: int) -> Category | None:
+        self.get_by_id_calls += 1
+        return await super().get_by_id(category_id)
+
+
+@pytest.fixture
+def counting_category_repository(
+    dependency_overrides: DependencyOverrides,
+) -> CountingCategoryRepository:
+    return dependency_overrides.set(
+        get_category_repository, CountingCategoryRepository()
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_category_by_id_loads_category_once(
+    async_client: AsyncClient,
+    access_token: Coroutine[Any, Any, str],
+    counting_category_repository: CountingCategoryRepository,
+):
+    # Given
+    category_id = BASE_CATEGORY_ID
+
+    # When
+    response = await async_client.get(
+        f"/api/v1/categories/{category_id}",
+        headers={"Authorization": f"Bearer {await access_token}"},
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert counting_category_repository.get_by_id_calls == 1
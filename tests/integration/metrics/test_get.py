@@ -0,0 +1,71 @@
+# pylint: disable=W0611,W0108,W0621
+from typing import Coroutine, Any
+
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_get_admission_metrics(
+    async_client: AsyncClient, access_token: Coroutine[Any, Any, str]
+):
+    # When
+    response = await async_client.get(
+        "/api/v1/metrics/admission",
+        headers={"Authorization": f"Bearer {await access_token}"},
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert response.json()["admitted"] >= 1
+    assert response.json()["queue_depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_get_admission_metrics_unauthorized(async_client: AsyncClient):
+    # When
+    response = await async_client.get("/api/v1/metrics/admission")
+
+    # Then
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_get_token_cache_metrics(
+    async_client: AsyncClient, access_token: Coroutine[Any, Any, str]
+):
+    # Given
+    headers = {"Authorization": f"Bearer {await access_token}"}
+    await async_client.get("/api/v1/metrics/token-cache", headers=headers)
+
+    # When
+    response = await async_client.get("/api/v1/metrics/token-cache", headers=headers)
+
+    # Then
+    assert response.status_code == 200
+    assert response.json()["hits"] >= 1
+    assert response.json()["size"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_get_statistics_cache_metrics(
+    async_client: AsyncClient, access_token: Coroutine[Any, Any, str]
+):
+    # Given
+    headers = {"Authorization": f"Bearer {await access_token}"}
+
+    # When
+    response = await async_client.get(
+        "/api/v1/metrics/statistics-cache", headers=headers
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert response.json().keys() == {
+        "max_size",
+        "size",
+        "hits",
+        "misses",
+        "evictions",
+        "invalidations",
+    }
@@ -0,0 +1,35 @@
+from typing import Dict, Sequence, Tuple
+
+from backend.src.core.modules.ownership.enum import OwnedResource
+from backend.src.core.modules.ownership.repository_interface import (
+    OwnershipRepositoryInterface,
+)
+from backend.tests.database import (
+    get_category_data,
+    get_subject_data,
+    get_transaction_data,
+    get_wallet_data,
+)
+
+
+class InMemoryOwnershipRepository(OwnershipRepositoryInterface):
+    def __init__(self):
+        self.owner_ids: Dict[Tuple[OwnedResource, int], int] = {}
+
+        for resource, objects in (
+            (OwnedResource.WALLET, get_wallet_data()),
+            (OwnedResource.SUBJECT, get_subject_data()),
+            (OwnedResource.CATEGORY, get_category_data()),
+            (OwnedResource.TRANSACTION, get_transaction_data()),
+        ):
+            for owned_object in objects:
+                self.owner_ids[(resource, owned_object.id)] = owned_object.user_id
+
+    async def get_owner_ids(
+        self, identifiers: Sequence[Tuple[OwnedResource, int]]
+    ) -> Dict[Tuple[OwnedResource, int], int]:
+        return {
+            identifier: self.owner_ids[identifier]
+            for identifier in identifiers
+            if identifier in self.owner_ids
+        }
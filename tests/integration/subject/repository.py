@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import List
 
+from backend.src.core.modules.common.exceptions import ObjectAlreadyExists
 from backend.src.core.modules.subject.repository_interface import (
     SubjectRepositoryInterface,
 )
@@ -13,6 +14,7 @@ class InMemorySubjectRepository(SubjectRepositoryInterface):
         self._subjects: List[Subject] = get_subject_data()
 
     async def save(self, subject: Subject) -> Subject:
+        self._ensure_unique(subject)
         subject.id = len(self._subjects) + 1
         subject.created_at = subject.updated_at = datetime.utcnow()
         self._subjects.append(subject)
@@ -20,6 +22,7 @@ class InMemorySubjectRepository(SubjectRepositoryInterface):
         return subject
 
     async def update(self, subject: Subject) -> Subject:
+        self._ensure_unique(subject)
         return subject
 
     async def delete(self, subject: Subject) -> None:
@@ -35,9 +38,11 @@ class InMemorySubjectRepository(SubjectRepositoryInterface):
 
         return None
 
-    async def get_by_name_and_user_id(self, name: str, user_id: int) -> Subject | None:
-        for subject in self._subjects:
-            if subject.name == name and subject.user_id == user_id:
-                return subject
-
-        return None
+    def _ensure_unique(self, subject: Subject) -> None:
+        if any(
+            other is not subject
+            and other.user_id == subject.user_id
+            and other.name == subject.name
+            for other in self._subjects
+        ):
+            raise ObjectAlreadyExists()
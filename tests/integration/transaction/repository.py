@@ -1,13 +1,23 @@
-from datetime import date, datetime
+from datetime import date, timedelta
 from decimal import Decimal
-from typing import List, Sequence, Optional
+from typing import AsyncIterator, Dict, List, Sequence, Optional
 
-from backend.src.core.modules.transaction.enum import TransactionType
+from backend.src.core.modules.common.exceptions import ObjectAlreadyExists
+from backend.src.core.modules.transaction.enum import (
+    BalanceSeriesBucket,
+    TransactionType,
+)
 from backend.src.core.modules.transaction.repository_interface import (
     TransactionRepositoryInterface,
 )
 from backend.src.core.modules.transaction.model import Transaction
+from backend.src.core.modules.transaction.schemas.statistic import (
+    BalancePointDTO,
+    BalanceSeriesQueryDTO,
+)
 from backend.src.core.modules.transaction.schemas.transaction import (
+    TransactionListItemDTO,
+    TransactionListQueryDTO,
     TransactionValueSumDTO,
 )
 from backend.tests.database import get_transaction_data
@@ -18,10 +28,12 @@ class InMemoryTransactionRepository(TransactionRepositoryInterface):
         self.transactions: List[Transaction] = get_transaction_data()
 
     async def save(self, transaction: Transaction) -> Transaction:
+        self._ensure_unique(transaction)
         self.transactions.append(transaction)
         return transaction
 
     async def update(self, transaction: Transaction) -> Transaction:
+        self._ensure_unique(transaction)
         return transaction
 
     async def delete(self, transaction: Transaction) -> None:
@@ -37,75 +49,103 @@ class InMemoryTransactionRepository(TransactionRepositoryInterface):
 
         return None
 
-    async def get_by_name_and_wallet_and_type(
-        self, name: str, wallet_id: int, transaction_date: date
-    ) -> Transaction | None:
-        for transaction in self.transactions:
-            if (
-                transaction.name == name
-                and transaction.wallet_id == wallet_id
-                and transaction.date == transaction_date
-            ):
-                return transaction
-
-        return None
+    async def get_by_id_for_update(self, transaction_id: int) -> Transaction | None:
+        return await self.get_by_id(transaction_id)
 
     async def get_by_user_id(
         self,
         user_id: int,
-        start_date: Optional[date] = None,
-        end_date: Optional[date] = None,
-    ) -> Sequence[Transaction]:
+        list_query: TransactionListQueryDTO,
+    ) -> Sequence[TransactionListItemDTO]:
         filtered_transactions = []
 
         for transaction in self.transactions:
             is_matching_user = transaction.user_id == user_id
             is_within_date_range = (
-                start_date is None or transaction.date >= start_date
-            ) and (end_date is None or transaction.date <= end_date)
+                list_query.start_date is None
+                or transaction.date >= list_query.start_date
+            ) and (
+                list_query.end_date is None or transaction.date <= list_query.end_date
+            )
 
             if is_matching_user and is_within_date_range:
                 filtered_transactions.append(transaction)
 
-        return filtered_transactions
+        return self._paginate(filtered_transactions, list_query)
 
     async def get_by_wallet_id(
-        self, wallet_id: int, start_date: Optional[date], end_date: Optional[date]
-    ) -> Sequence[Transaction]:
+        self,
+        wallet_id: int,
+        list_query: TransactionListQueryDTO,
+    ) -> Sequence[TransactionListItemDTO]:
         filtered_transactions = []
 
         for transaction in self.transactions:
             is_matching_wallet = transaction.wallet_id == wallet_id
             is_within_date_range = (
-                start_date is None or transaction.date >= start_date
-            ) and (end_date is None or transaction.date <= end_date)
+                list_query.start_date is None
+                or transaction.date >= list_query.start_date
+            ) and (
+                list_query.end_date is None or transaction.date <= list_query.end_date
+            )
 
             if is_matching_wallet and is_within_date_range:
                 filtered_transactions.append(transaction)
 
-        return filtered_transactions
+        return self._paginate(filtered_transactions, list_query)
 
     async def get_by_subject_id(
-        self, subject_id: int, start_date: Optional[date], end_date: Optional[date]
-    ) -> Sequence[Transaction]:
+        self,
+        subject_id: int,
+        list_query: TransactionListQueryDTO,
+    ) -> Sequence[TransactionListItemDTO]:
         filtered_transactions = []
 
         for transaction in self.transactions:
             is_matching_subject = transaction.subject_id == subject_id
             is_within_date_range = (
-                start_date is None or transaction.date >= start_date
-            ) and (end_date is None or transaction.date <= end_date)
+                list_query.start_date is None
+                or transaction.date >= list_query.start_date
+            ) and (
+                list_query.end_date is None or transaction.date <= list_query.end_date
+            )
 
             if is_matching_subject and is_within_date_range:
                 filtered_transactions.append(transaction)
 
-        return filtered_transactions
+        return self._paginate(filtered_transactions, list_query)
+
+    def stream_by_user_id(
+        self,
+        user_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> AsyncIterator[Transaction]:
+        return self._stream(
+            [
+                transaction
+                for transaction in sorted(
+                    self.transactions,
+                    key=lambda transaction: (transaction.date, transaction.id),
+                )
+                if transaction.user_id == user_id
+                and (start_date is None or transaction.date >= start_date)
+                and (end_date is None or transaction.date <= end_date)
+            ]
+        )
+
+    @staticmethod
+    async def _stream(
+        transactions: Sequence[Transaction],
+    ) -> AsyncIterator[Transaction]:
+        for transaction in transactions:
+            yield transaction
 
     async def get_sum_values_by_user_id(
         self,
         user_id: int,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
     ) -> TransactionValueSumDTO:
         incomes = Decimal(
             sum(
@@ -134,8 +174,8 @@ class InMemoryTransactionRepository(TransactionRepositoryInterface):
     async def get_sum_values_by_wallet_id(
         self,
         wallet_id: int,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
     ) -> TransactionValueSumDTO:
         incomes = Decimal(
             sum(
@@ -189,3 +229,89 @@ class InMemoryTransactionRepository(TransactionRepositoryInterface):
             transfer_expenses=transfer_expenses,
             transfer_incomes=transfer_incomes,
         )
+
+    async def get_balance_series_by_wallet_id(
+        self,
+        wallet_id: int,
+        query_dto: BalanceSeriesQueryDTO,
+        opening_balance: Decimal,
+    ) -> Sequence[BalancePointDTO]:
+        deltas: Dict[date, Decimal] = {}
+
+        for transaction in self.transactions:
+            if (
+                transaction.wallet_id == wallet_id
+                and query_dto.start_date <= transaction.date <= query_dto.end_date
+            ):
+                bucket = max(
+                    self._get_bucket(transaction.date, query_dto.bucket),
+                    query_dto.start_date,
+                )
+                value = Decimal(transaction.value)
+                deltas[bucket] = deltas.get(bucket, Decimal(0)) + (
+                    value if transaction.type == TransactionType.INCOME else -value
+                )
+
+        points = []
+        balance = opening_balance
+
+        for bucket in sorted(deltas):
+            balance += deltas[bucket]
+            points.append(BalancePointDTO(date=bucket, balance=balance))
+
+        return points
+
+    @staticmethod
+    def _get_bucket(value: date, bucket: BalanceSeriesBucket) -> date:
+        if bucket == BalanceSeriesBucket.WEEK:
+            return value - timedelta(days=value.weekday())
+
+        if bucket == BalanceSeriesBucket.MONTH:
+            return value.replace(day=1)
+
+        return value
+
+    @staticmethod
+    def _paginate(
+        transactions: List[Transaction],
+        list_query: TransactionListQueryDTO,
+    ) -> Sequence[TransactionListItemDTO]:
+        ordered_transactions = sorted(
+            transactions,
+            key=lambda transaction: (transaction.date, transaction.id),
+            reverse=True,
+        )
+
+        if list_query.cursor is not None:
+            ordered_transactions = [
+                transaction
+                for transaction in ordered_transactions
+                if (transaction.date, transaction.id)
+                < (list_query.cursor.date, list_query.cursor.id)
+            ]
+
+        return [
+            TransactionListItemDTO(
+                id=transaction.id,
+                name=transaction.name,
+                value=transaction.value,
+                type=transaction.type,
+                description=(
+                    transaction.description if list_query.include_description else None
+                ),
+                date=transaction.date,
+                created_at=transaction.created_at,
+                updated_at=transaction.updated_at,
+            )
+            for transaction in ordered_transactions[: list_query.limit + 1]
+        ]
+
+    def _ensure_unique(self, transaction: Transaction) -> None:
+        if any(
+            other is not transaction
+            and other.name == transaction.name
+            and other.wallet_id == transaction.wallet_id
+            and other.date == transaction.date
+            for other in self.transactions
+        ):
+            raise ObjectAlreadyExists()
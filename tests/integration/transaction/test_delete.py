@@ -1,8 +1,25 @@
+from datetime import date
+from decimal import Decimal
+
+# pylint: disable=W0621
 from typing import Coroutine, Any
 
 import pytest
 from httpx import AsyncClient
 
+from backend.src.core.modules.transaction.enum import TransactionType
+from backend.src.core.modules.wallet_summary.schemas import to_year_month
+from backend.src.core.modules.transaction.model import Transaction
+from backend.src.dependencies.transaction.creators import get_transaction_repository
+from backend.tests.integration.transaction.repository import (
+    InMemoryTransactionRepository,
+)
+from backend.tests.integration.wallet.repository import InMemoryWalletRepository
+from backend.tests.integration.wallet_summary.repository import (
+    InMemoryWalletSummaryRepository,
+)
+from backend.tests.overrides import DependencyOverrides
+
 
 @pytest.mark.asyncio
 async def test_delete_transaction(
@@ -67,3 +84,67 @@ async def test_delete_transaction_does_not_exist(
 
     # Then
     assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_delete_transaction_updates_wallet_summary(
+    async_client: AsyncClient,
+    access_token: Coroutine[Any, Any, str],
+    wallet_summary_repository: InMemoryWalletSummaryRepository,
+):
+    # Given
+    transaction_id = 1
+
+    # When
+    response = await async_client.delete(
+        f"/api/v1/transactions/{transaction_id}",
+        headers={"Authorization": f"Bearer {await access_token}"},
+    )
+
+    # Then
+    row = wallet_summary_repository.rows[
+        (1, to_year_month(date.today()), TransactionType.INCOME, False)
+    ]
+    assert response.status_code == 204
+    assert row.value == Decimal("0.00")
+    assert row.transaction_count == 0
+
+
+class DeletedMeanwhileTransactionRepository(InMemoryTransactionRepository):
+    async def get_by_id_for_update(self, transaction_id: int) -> Transaction | None:
+        return None
+
+
+@pytest.fixture
+def deleted_meanwhile_transaction_repository(
+    dependency_overrides: DependencyOverrides,
+) -> DeletedMeanwhileTransactionRepository:
+    return dependency_overrides.set(
+        get_transaction_repository, DeletedMeanwhileTransactionRepository()
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("deleted_meanwhile_transaction_repository")
+async def test_delete_transaction_deleted_meanwhile(
+    async_client: AsyncClient,
+    access_token: Coroutine[Any, Any, str],
+    wallet_repository: InMemoryWalletRepository,
+    wallet_summary_repository: InMemoryWalletSummaryRepository,
+):
+    # Given
+    transaction_id = 1
+    wallet = await wallet_repository.get_by_id(1)
+    assert wallet is not None
+    balance = wallet.balance
+
+    # When
+    response = await async_client.delete(
+        f"/api/v1/transactions/{transaction_id}",
+        headers={"Authorization": f"Bearer {await access_token}"},
+    )
+
+    # Then
+    assert response.status_code == 404
+    assert wallet.balance == balance
+    assert wallet_summary_repository.rows == InMemoryWalletSummaryRepository().rows
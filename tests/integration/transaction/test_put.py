@@ -1,10 +1,25 @@
 from datetime import date
 from decimal import Decimal
+
+# pylint: disable=W0621
 from typing import Coroutine, Any
 
 import pytest
 from httpx import AsyncClient
 
+from backend.src.core.modules.transaction.enum import TransactionType
+from backend.src.core.modules.wallet_summary.schemas import to_year_month
+from backend.src.core.modules.transaction.model import Transaction
+from backend.src.core.modules.wallet_summary.schemas import WalletSummaryDeltaDTO
+from backend.src.dependencies.transaction.creators import get_transaction_repository
+from backend.tests.integration.transaction.repository import (
+    InMemoryTransactionRepository,
+)
+from backend.tests.integration.wallet_summary.repository import (
+    InMemoryWalletSummaryRepository,
+)
+from backend.tests.overrides import DependencyOverrides
+
 
 @pytest.mark.asyncio
 async def test_update_transaction(
@@ -227,3 +242,102 @@ async def test_update_transaction_conflict(
 
     # Then
     assert response.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_update_transaction_updates_wallet_summary(
+    async_client: AsyncClient,
+    access_token: Coroutine[Any, Any, str],
+    wallet_summary_repository: InMemoryWalletSummaryRepository,
+):
+    # Given
+    transaction_id = 1
+    data_to_update = {
+        "name": "name",
+        "description": "description",
+        "date": date.today().strftime("%Y-%m-%d"),
+        "value": str(Decimal("30.00")),
+        "subject_id": 1,
+        "category_id": 1,
+    }
+
+    # When
+    response = await async_client.put(
+        f"/api/v1/transactions/{transaction_id}",
+        headers={"Authorization": f"Bearer {await access_token}"},
+        json=data_to_update,
+    )
+
+    # Then
+    row = wallet_summary_repository.rows[
+        (1, to_year_month(date.today()), TransactionType.INCOME, False)
+    ]
+    assert response.status_code == 200
+    assert row.value == Decimal("30.00")
+    assert row.transaction_count == 1
+
+
+class ConcurrentlyUpdatedTransactionRepository(InMemoryTransactionRepository):
+    async def get_by_id_for_update(self, transaction_id: int) -> Transaction | None:
+        transaction = await self.get_by_id(transaction_id)
+
+        if transaction is not None:
+            transaction.value = Decimal("50.00")
+
+        return transaction
+
+
+@pytest.fixture
+def concurrently_updated_transaction_repository(
+    dependency_overrides: DependencyOverrides,
+) -> ConcurrentlyUpdatedTransactionRepository:
+    return dependency_overrides.set(
+        get_transaction_repository, ConcurrentlyUpdatedTransactionRepository()
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("concurrently_updated_transaction_repository")
+async def test_update_transaction_takes_summary_delta_from_locked_row(
+    async_client: AsyncClient,
+    access_token: Coroutine[Any, Any, str],
+    wallet_summary_repository: InMemoryWalletSummaryRepository,
+):
+    # Given
+    transaction_id = 1
+    data_to_update = {
+        "name": "name",
+        "description": "description",
+        "date": date.today().strftime("%Y-%m-%d"),
+        "value": str(Decimal("30.00")),
+        "subject_id": 1,
+        "category_id": 1,
+    }
+    await wallet_summary_repository.apply_deltas(
+        [
+            WalletSummaryDeltaDTO(
+                wallet_id=1,
+                user_id=1,
+                year_month=to_year_month(date.today()),
+                type=TransactionType.INCOME,
+                is_transfer=False,
+                value=Decimal("30.00"),
+                transaction_count=0,
+            )
+        ]
+    )
+
+    # When
+    response = await async_client.put(
+        f"/api/v1/transactions/{transaction_id}",
+        headers={"Authorization": f"Bearer {await access_token}"},
+        json=data_to_update,
+    )
+
+    # Then
+    row = wallet_summary_repository.rows[
+        (1, to_year_month(date.today()), TransactionType.INCOME, False)
+    ]
+    assert response.status_code == 200
+    assert row.value == Decimal("30.00")
+    assert row.transaction_count == 1
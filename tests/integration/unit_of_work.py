@@ -0,0 +1,9 @@
+from backend.src.database.unit_of_work import UnitOfWorkInterface
+
+
+class InMemoryUnitOfWork(UnitOfWorkInterface):
+    async def commit(self) -> None:
+        self._run_after_commit_hooks()
+
+    async def rollback(self) -> None:
+        self._after_commit_hooks = []
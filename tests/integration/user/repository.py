@@ -1,7 +1,9 @@
 from typing import List
 
+from backend.src.core.modules.common.exceptions import ObjectAlreadyExists
 from backend.src.core.modules.user.repository_interface import UserRepositoryInterface
 from backend.src.core.modules.user.model import User
+from backend.src.core.modules.user.schemas import UserCredentialsDTO
 from backend.tests.database import get_user_db
 
 
@@ -10,12 +12,14 @@ class InMemoryUserRepository(UserRepositoryInterface):
         self._users: List[User] = get_user_db()
 
     async def save(self, user: User) -> User:
+        self._ensure_unique(user)
         user.id = len(self._users) + 1
         self._users.append(user)
 
         return user
 
     async def update(self, user: User) -> User:
+        self._ensure_unique(user)
         return user
 
     async def delete(self, user: User) -> None:
@@ -44,3 +48,31 @@ class InMemoryUserRepository(UserRepositoryInterface):
                 return user
 
         return None
+
+    async def get_credentials_by_username_or_email(
+        self, value: str
+    ) -> UserCredentialsDTO | None:
+        user = await self.get_by_email(value) or await self.get_by_username(value)
+
+        if user is None:
+            return None
+
+        return UserCredentialsDTO(
+            id=user.id,
+            email=user.email,
+            password=user.password,
+            is_admin=bool(user.is_admin),
+        )
+
+    async def get_is_admin(self, user_id: int) -> bool | None:
+        user = await self.get_by_id(user_id)
+
+        return bool(user.is_admin) if user is not None else None
+
+    def _ensure_unique(self, user: User) -> None:
+        if any(
+            other is not user
+            and (other.username == user.username or other.email == user.email)
+            for other in self._users
+        ):
+            raise ObjectAlreadyExists()
@@ -2,6 +2,10 @@
 import pytest
 from httpx import AsyncClient
 
+from backend.src.core.modules.common.admission import AdmissionController
+from backend.src.dependencies.auth.creators import get_auth_admission_controller
+from backend.tests.overrides import DependencyOverrides
+
 
 @pytest.mark.asyncio
 async def test_create_user(async_client: AsyncClient):
@@ -84,3 +88,28 @@ async def test_create_user_with_duplicated_username(async_client: AsyncClient):
 
     # Then
     assert response.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_create_user_service_overloaded(
+    async_client: AsyncClient, dependency_overrides: DependencyOverrides
+):
+    # Given
+    data = {
+        "username": "Overloaded",
+        "email": "overloaded@gmail.pl",
+        "password": "string11",
+        "password_confirmation": "string11",
+        "first_name": "Over",
+        "last_name": "Loaded",
+    }
+    dependency_overrides.set(
+        get_auth_admission_controller,
+        AdmissionController(max_concurrency=0, max_queue_depth=0, wait_timeout=0),
+    )
+
+    # When
+    response = await async_client.post("/api/v1/users", json=data)
+
+    # Then
+    assert response.status_code == 503
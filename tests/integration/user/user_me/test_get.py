@@ -1,10 +1,21 @@
+# pylint: disable=W0621
+import csv
+import io
+import json
+from datetime import date
 from typing import Coroutine, Any
 
 import pytest
 from httpx import AsyncClient
 
 from backend.src.core.modules.transaction.enum import TransactionType
+from backend.src.core.modules.transaction.statistics_cache import (
+    TransactionStatisticsCache,
+)
+from backend.src.database.setup import get_unit_of_work
 from backend.tests.database import BASE_WALLET_DATA
+from backend.tests.integration.unit_of_work import InMemoryUnitOfWork
+from backend.tests.overrides import DependencyOverrides
 
 
 @pytest.mark.asyncio
@@ -109,7 +120,7 @@ async def test_get_subjects(
 
     # Then
     assert response.status_code == 200
-    assert len(response.json()) == 1
+    assert len(response.json()) == 2
 
 
 @pytest.mark.asyncio
@@ -135,7 +146,87 @@ async def test_get_transactions(
 
     # Then
     assert response.status_code == 200
-    assert len(response.json()) == 2
+    assert len(response.json()["items"]) == 2
+    assert response.json()["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_get_transactions_paginated(
+    async_client: AsyncClient, access_token: Coroutine[Any, Any, str]
+):
+    # Given
+    token = await access_token
+
+    # When
+    first_page = await async_client.get(
+        "/api/v1/user/me/transactions/",
+        params={"limit": 1},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    second_page = await async_client.get(
+        "/api/v1/user/me/transactions/",
+        params={"limit": 1, "cursor": first_page.json()["next_cursor"]},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    # Then
+    assert first_page.status_code == 200
+    assert [item["id"] for item in first_page.json()["items"]] == [2]
+    assert second_page.status_code == 200
+    assert [item["id"] for item in second_page.json()["items"]] == [1]
+    assert second_page.json()["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_get_transactions_invalid_cursor(
+    async_client: AsyncClient, access_token: Coroutine[Any, Any, str]
+):
+    # When
+    response = await async_client.get(
+        "/api/v1/user/me/transactions/",
+        params={"cursor": "invalid"},
+        headers={"Authorization": f"Bearer {await access_token}"},
+    )
+
+    # Then
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_export_transactions_ndjson(
+    async_client: AsyncClient, access_token: Coroutine[Any, Any, str]
+):
+    # When
+    response = await async_client.get(
+        "/api/v1/user/me/transactions/export",
+        headers={"Authorization": f"Bearer {await access_token}"},
+    )
+
+    # Then
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [row["id"] for row in rows] == [1, 2]
+    assert rows[0]["value"] == "20.00"
+
+
+@pytest.mark.asyncio
+async def test_export_transactions_csv(
+    async_client: AsyncClient, access_token: Coroutine[Any, Any, str]
+):
+    # When
+    response = await async_client.get(
+        "/api/v1/user/me/transactions/export",
+        params={"format": "csv"},
+        headers={"Authorization": f"Bearer {await access_token}"},
+    )
+
+    # Then
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert [row["id"] for row in rows] == ["1", "2"]
+    assert rows[1]["type"] == "expense"
 
 
 @pytest.mark.asyncio
@@ -147,3 +238,120 @@ async def test_get_transactions_not_authenticated(async_client: AsyncClient):
 
     # Then
     assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_get_statistics(
+    async_client: AsyncClient, access_token: Coroutine[Any, Any, str]
+):
+    # Given
+    current_month = date.today().strftime("%Y-%m")
+
+    # When
+    response = await async_client.get(
+        "/api/v1/user/me/transactions/statistics",
+        headers={"Authorization": f"Bearer {await access_token}"},
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert len(response.json()["monthly"]) == 13
+    assert response.json()["monthly"][current_month] == {
+        "balance": "0.00",
+        "incomes": "20.00",
+        "expenses": "20.00",
+    }
+    assert response.json()["total"] == response.json()["monthly"][current_month]
+
+
+@pytest.mark.asyncio
+async def test_get_balance(
+    async_client: AsyncClient, access_token: Coroutine[Any, Any, str]
+):
+    # When
+    response = await async_client.get(
+        "/api/v1/user/me/transactions/balance",
+        headers={"Authorization": f"Bearer {await access_token}"},
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert response.json() == {
+        "balance": "0.00",
+        "incomes": "20.00",
+        "expenses": "20.00",
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_statistics_cached_until_write(
+    async_client: AsyncClient,
+    access_token: Coroutine[Any, Any, str],
+    statistics_cache: TransactionStatisticsCache,
+):
+    # Given
+    headers = {"Authorization": f"Bearer {await access_token}"}
+    transaction = {
+        "name": "1name",
+        "description": "description",
+        "date": date.today().strftime("%Y-%m-%d"),
+        "subject_id": 1,
+        "category_id": 1,
+        "type": TransactionType.EXPENSE,
+        "value": "30.00",
+    }
+
+    # When
+    for _ in range(2):
+        await async_client.get(
+            "/api/v1/user/me/transactions/statistics", headers=headers
+        )
+    cached = statistics_cache.get_metrics()
+
+    await async_client.post(
+        "/api/v1/wallets/1/transactions", headers=headers, json=transaction
+    )
+    await async_client.get("/api/v1/user/me/transactions/statistics", headers=headers)
+
+    # Then
+    metrics = statistics_cache.get_metrics()
+    assert (cached.hits, cached.misses) == (1, 1)
+    assert metrics.invalidations == 1
+    assert (metrics.hits, metrics.misses) == (1, 2)
+
+
+class RecordingUnitOfWork(InMemoryUnitOfWork):
+    def __init__(self):
+        super().__init__()
+        self.rollbacks = 0
+
+    async def rollback(self) -> None:
+        self.rollbacks += 1
+        await super().rollback()
+
+
+@pytest.fixture
+def recording_unit_of_work(
+    dependency_overrides: DependencyOverrides,
+) -> RecordingUnitOfWork:
+    return dependency_overrides.set(get_unit_of_work, RecordingUnitOfWork())
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("statistics_cache")
+async def test_get_statistics_reads_sums_from_fresh_snapshot(
+    async_client: AsyncClient,
+    access_token: Coroutine[Any, Any, str],
+    recording_unit_of_work: RecordingUnitOfWork,
+):
+    # Given
+    headers = {"Authorization": f"Bearer {await access_token}"}
+
+    # When
+    for _ in range(2):
+        await async_client.get(
+            "/api/v1/user/me/transactions/statistics", headers=headers
+        )
+
+    # Then
+    assert recording_unit_of_work.rollbacks == 1
@@ -1,17 +1,30 @@
-from typing import List, Optional
+from decimal import Decimal
+from typing import List, Optional, Sequence
 
+from backend.src.core.modules.common.exceptions import ObjectAlreadyExists
 from backend.src.core.modules.wallet.repository_interface import (
     WalletRepositoryInterface,
 )
+from backend.src.core.modules.transaction.enum import TransactionType
+from backend.src.core.modules.transaction.schemas.transaction import (
+    TransactionValueSumDTO,
+)
 from backend.src.core.modules.wallet.model import Wallet
-from backend.tests.database import get_wallet_data
+from backend.src.core.modules.wallet.schemas import (
+    WalletTotalsDeltaDTO,
+    WalletTotalsDriftDTO,
+    WalletTotalsDTO,
+)
+from backend.tests.database import get_transaction_data, get_wallet_data
 
 
 class InMemoryWalletRepository(WalletRepositoryInterface):
     def __init__(self):
         self._wallets: List[Wallet] = get_wallet_data()
+        self.locked_ids: List[int] = []
 
     async def save(self, wallet: Wallet) -> Wallet:
+        self._ensure_unique(wallet)
         wallet_id = len(self._wallets) + 1
         wallet.id = wallet_id
 
@@ -19,26 +32,110 @@ class InMemoryWalletRepository(WalletRepositoryInterface):
         return wallet
 
     async def update(self, wallet: Wallet) -> Wallet:
+        self._ensure_unique(wallet)
         return wallet
 
     async def delete(self, wallet: Wallet) -> None:
         self._wallets.remove(wallet)
 
-    async def get_by_user_id(self, user_id: int) -> List[Wallet]:
+    async def get_by_user_id(
+        self, user_id: int, with_transactions: bool = False
+    ) -> List[Wallet]:
         return [wallet for wallet in self._wallets if wallet.user_id == user_id]
 
-    async def get_by_id(self, wallet_id: int) -> Optional[Wallet]:
+    async def get_by_id(
+        self, wallet_id: int, with_transactions: bool = False
+    ) -> Optional[Wallet]:
         for wallet in self._wallets:
             if wallet.id == wallet_id:
                 return wallet
 
         return None
 
-    async def get_by_user_id_and_name(
-        self, user_id: int, name: str
-    ) -> Optional[Wallet]:
+    async def lock_by_ids(self, wallet_ids: Sequence[int]) -> None:
+        self.locked_ids.extend(wallet_ids)
+
+    async def adjust_totals(self, delta: WalletTotalsDeltaDTO) -> None:
+        wallet = await self.get_by_id(delta.wallet_id)
+
+        if wallet is None:
+            return
+
+        wallet.balance += delta.incomes - delta.expenses + delta.transfers
+        wallet.incomes += delta.incomes
+        wallet.expenses += delta.expenses
+        wallet.transfers += delta.transfers
+
+    async def get_sum_values_by_user_id(self, user_id: int) -> TransactionValueSumDTO:
+        wallets = await self.get_by_user_id(user_id)
+
+        return TransactionValueSumDTO(
+            incomes=Decimal(sum(wallet.incomes for wallet in wallets)),
+            expenses=Decimal(sum(wallet.expenses for wallet in wallets)),
+        )
+
+    async def get_totals_drift(self) -> Sequence[WalletTotalsDriftDTO]:
+        drift = []
+
         for wallet in self._wallets:
-            if wallet.user_id == user_id and wallet.name == name:
-                return wallet
+            stored = WalletTotalsDTO(
+                balance=wallet.balance,
+                incomes=wallet.incomes,
+                expenses=wallet.expenses,
+                transfers=wallet.transfers,
+            )
+            expected = self._get_expected_totals(wallet.id)
 
-        return None
+            if stored != expected:
+                drift.append(
+                    WalletTotalsDriftDTO(
+                        wallet_id=wallet.id, stored=stored, expected=expected
+                    )
+                )
+
+        return drift
+
+    async def reconcile_totals(self, wallet_ids: Sequence[int]) -> None:
+        for wallet in self._wallets:
+            if wallet.id in wallet_ids:
+                for key, value in (
+                    self._get_expected_totals(wallet.id).model_dump().items()
+                ):
+                    setattr(wallet, key, value)
+
+    @staticmethod
+    def _get_expected_totals(wallet_id: int) -> WalletTotalsDTO:
+        totals = WalletTotalsDTO(
+            balance=Decimal(0),
+            incomes=Decimal(0),
+            expenses=Decimal(0),
+            transfers=Decimal(0),
+        )
+
+        for transaction in get_transaction_data():
+            if transaction.wallet_id != wallet_id:
+                continue
+
+            value = Decimal(transaction.value)
+            if transaction.type == TransactionType.EXPENSE:
+                value = -value
+
+            if transaction.is_transfer:
+                totals.transfers += value
+            elif transaction.type == TransactionType.INCOME:
+                totals.incomes += value
+            else:
+                totals.expenses -= value
+
+            totals.balance += value
+
+        return totals
+
+    def _ensure_unique(self, wallet: Wallet) -> None:
+        if any(
+            other is not wallet
+            and other.user_id == wallet.user_id
+            and other.name == wallet.name
+            for other in self._wallets
+        ):
+            raise ObjectAlreadyExists()
@@ -3,6 +3,9 @@ from typing import Coroutine, Any
 import pytest
 from httpx import AsyncClient
 
+from backend.src.core.modules.transaction.statistics_cache import (
+    TransactionStatisticsCache,
+)
 from backend.tests.database import BASE_WALLET_ID
 
 
@@ -55,3 +58,27 @@ async def test_delete_wallet_does_not_exist(
 
     # Then
     assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_delete_wallet_invalidates_statistics(
+    async_client: AsyncClient,
+    access_token: Coroutine[Any, Any, str],
+    statistics_cache: TransactionStatisticsCache,
+):
+    # Given
+    wallet_id = BASE_WALLET_ID
+    headers = {"Authorization": f"Bearer {await access_token}"}
+    await async_client.get("/api/v1/user/me/transactions/statistics", headers=headers)
+
+    # When
+    response = await async_client.delete(
+        f"/api/v1/wallets/{wallet_id}", headers=headers
+    )
+    await async_client.get("/api/v1/user/me/transactions/statistics", headers=headers)
+
+    # Then
+    metrics = statistics_cache.get_metrics()
+    assert response.status_code == 204
+    assert metrics.invalidations == 1
+    assert (metrics.hits, metrics.misses) == (0, 2)
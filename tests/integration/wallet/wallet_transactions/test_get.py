@@ -1,3 +1,4 @@
+from datetime import date, timedelta
 from typing import Coroutine, Any
 
 import pytest
@@ -19,7 +20,27 @@ async def test_get_transactions(
 
     # Then
     assert response.status_code == 200
-    assert len(response.json()) == 2
+    assert len(response.json()["items"]) == 2
+    assert response.json()["items"][0]["description"] is None
+
+
+@pytest.mark.asyncio
+async def test_get_transactions_with_description(
+    async_client: AsyncClient, access_token: Coroutine[Any, Any, str]
+):
+    # Given
+    wallet_id = 1
+
+    # When
+    response = await async_client.get(
+        f"/api/v1/wallets/{wallet_id}/transactions",
+        params={"include_description": True},
+        headers={"Authorization": f"Bearer {await access_token}"},
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert response.json()["items"][0]["description"] == "description"
 
 
 @pytest.mark.asyncio
@@ -68,3 +89,187 @@ async def test_get_transactions_wallet_does_not_exist(
 
     # Then
     assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_statistics(
+    async_client: AsyncClient, access_token: Coroutine[Any, Any, str]
+):
+    # Given
+    wallet_id = 1
+    current_month = date.today().strftime("%Y-%m")
+
+    # When
+    response = await async_client.get(
+        f"/api/v1/wallets/{wallet_id}/transactions/statistics",
+        headers={"Authorization": f"Bearer {await access_token}"},
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert len(response.json()["monthly"]) == 13
+    assert response.json()["monthly"][current_month] == {
+        "balance": "0.00",
+        "incomes": "20.00",
+        "expenses": "20.00",
+        "transfers": "0.0",
+    }
+    assert response.json()["total"] == response.json()["monthly"][current_month]
+
+
+@pytest.mark.asyncio
+async def test_get_balance(
+    async_client: AsyncClient, access_token: Coroutine[Any, Any, str]
+):
+    # Given
+    wallet_id = 1
+
+    # When
+    response = await async_client.get(
+        f"/api/v1/wallets/{wallet_id}/transactions/balance",
+        headers={"Authorization": f"Bearer {await access_token}"},
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert response.json() == {
+        "balance": "0.00",
+        "incomes": "20.00",
+        "expenses": "20.00",
+        "transfers": "0.00",
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_balance_as_of(
+    async_client: AsyncClient, access_token: Coroutine[Any, Any, str]
+):
+    # Given
+    wallet_id = 1
+    as_of = date.today().strftime("%Y-%m-%d")
+
+    # When
+    response = await async_client.get(
+        f"/api/v1/wallets/{wallet_id}/transactions/balance",
+        headers={"Authorization": f"Bearer {await access_token}"},
+        params={"as_of": as_of},
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert response.json() == {
+        "balance": "0.00",
+        "incomes": "20.00",
+        "expenses": "20.00",
+        "transfers": "0.0",
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_balance_as_of_before_first_transaction(
+    async_client: AsyncClient, access_token: Coroutine[Any, Any, str]
+):
+    # Given
+    wallet_id = 1
+    as_of = (date.today() - timedelta(days=40)).strftime("%Y-%m-%d")
+
+    # When
+    response = await async_client.get(
+        f"/api/v1/wallets/{wallet_id}/transactions/balance",
+        headers={"Authorization": f"Bearer {await access_token}"},
+        params={"as_of": as_of},
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert response.json() == {
+        "balance": "0",
+        "incomes": "0",
+        "expenses": "0",
+        "transfers": "0.0",
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_balance_series(
+    async_client: AsyncClient, access_token: Coroutine[Any, Any, str]
+):
+    # Given
+    wallet_id = 1
+
+    # When
+    response = await async_client.get(
+        f"/api/v1/wallets/{wallet_id}/transactions/balance-series",
+        headers={"Authorization": f"Bearer {await access_token}"},
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert response.json() == {
+        "opening_balance": "0",
+        "points": [{"date": date.today().strftime("%Y-%m-%d"), "balance": "0.00"}],
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_balance_series_monthly(
+    async_client: AsyncClient, access_token: Coroutine[Any, Any, str]
+):
+    # Given
+    wallet_id = 1
+    month_start = date.today().replace(day=1)
+
+    # When
+    response = await async_client.get(
+        f"/api/v1/wallets/{wallet_id}/transactions/balance-series",
+        headers={"Authorization": f"Bearer {await access_token}"},
+        params={"start_date": month_start.strftime("%Y-%m-%d"), "bucket": "month"},
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert response.json()["points"] == [
+        {"date": month_start.strftime("%Y-%m-%d"), "balance": "0.00"}
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("bucket", ["week", "month"])
+async def test_get_balance_series_clamps_first_bucket_to_start_date(
+    async_client: AsyncClient, access_token: Coroutine[Any, Any, str], bucket: str
+):
+    # Given
+    wallet_id = 1
+    start_date = date.today()
+
+    # When
+    response = await async_client.get(
+        f"/api/v1/wallets/{wallet_id}/transactions/balance-series",
+        headers={"Authorization": f"Bearer {await access_token}"},
+        params={"start_date": start_date.strftime("%Y-%m-%d"), "bucket": bucket},
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert response.json()["points"] == [
+        {"date": start_date.strftime("%Y-%m-%d"), "balance": "0.00"}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_balance_series_from_earliest_date(
+    async_client: AsyncClient, access_token: Coroutine[Any, Any, str]
+):
+    # Given
+    wallet_id = 1
+
+    # When
+    response = await async_client.get(
+        f"/api/v1/wallets/{wallet_id}/transactions/balance-series",
+        headers={"Authorization": f"Bearer {await access_token}"},
+        params={"start_date": date.min.isoformat()},
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert response.json()["opening_balance"] == "0"
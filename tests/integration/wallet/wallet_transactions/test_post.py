@@ -1,11 +1,15 @@
+import json
 from datetime import date
 from decimal import Decimal
+from types import SimpleNamespace
 from typing import Coroutine, Any
 
 import pytest
 from httpx import AsyncClient
+from starlette import requests
 
 from backend.src.core.modules.transaction.enum import TransactionType
+from backend.tests.integration.wallet.repository import InMemoryWalletRepository
 
 
 @pytest.mark.asyncio
@@ -265,3 +269,99 @@ async def test_create_transaction_conflict(
 
     # Then
     assert response.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_create_transaction_decodes_body_once(
+    async_client: AsyncClient,
+    access_token: Coroutine[Any, Any, str],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    # Given
+    wallet_id = 1
+    data = {
+        "name": "1name",
+        "description": "d" * 2000,
+        "date": date.today().strftime("%Y-%m-%d"),
+        "subject_id": 1,
+        "category_id": 1,
+        "type": TransactionType.EXPENSE,
+        "value": str(Decimal(30.0)),
+    }
+    headers = {"Authorization": f"Bearer {await access_token}"}
+    decoded_bodies = []
+
+    def counting_loads(*args, **kwargs):
+        decoded_bodies.append(args[0])
+        return json.loads(*args, **kwargs)
+
+    monkeypatch.setattr(requests, "json", SimpleNamespace(loads=counting_loads))
+
+    # When
+    response = await async_client.post(
+        f"/api/v1/wallets/{wallet_id}/transactions", headers=headers, json=data
+    )
+
+    # Then
+    assert response.status_code == 201
+    assert len(decoded_bodies) == 1
+
+
+@pytest.mark.asyncio
+async def test_create_transaction_missing_body_identifier(
+    async_client: AsyncClient, access_token: Coroutine[Any, Any, str]
+):
+    # Given
+    wallet_id = 1
+    data = {
+        "name": "1name",
+        "description": "description",
+        "date": date.today().strftime("%Y-%m-%d"),
+        "category_id": 1,
+        "type": TransactionType.EXPENSE,
+        "value": str(Decimal(30.0)),
+    }
+
+    # When
+    response = await async_client.post(
+        f"/api/v1/wallets/{wallet_id}/transactions",
+        headers={"Authorization": f"Bearer {await access_token}"},
+        json=data,
+    )
+
+    # Then
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_create_transaction_adjusts_wallet_totals(
+    async_client: AsyncClient,
+    access_token: Coroutine[Any, Any, str],
+    wallet_repository: InMemoryWalletRepository,
+):
+    # Given
+    wallet_id = 1
+    data = {
+        "name": "1name",
+        "description": "description",
+        "date": date.today().strftime("%Y-%m-%d"),
+        "subject_id": 1,
+        "category_id": 1,
+        "type": TransactionType.EXPENSE,
+        "value": str(Decimal("30.00")),
+    }
+
+    # When
+    response = await async_client.post(
+        f"/api/v1/wallets/{wallet_id}/transactions",
+        headers={"Authorization": f"Bearer {await access_token}"},
+        json=data,
+    )
+
+    # Then
+    wallet = await wallet_repository.get_by_id(wallet_id)
+    assert response.status_code == 201
+    assert wallet is not None
+    assert wallet.balance == Decimal("-30.00")
+    assert wallet.expenses == Decimal("50.00")
+    assert wallet_repository.locked_ids == [wallet_id]
@@ -0,0 +1,125 @@
+from datetime import date
+from decimal import Decimal
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from backend.src.core.modules.transaction.enum import TransactionType
+from backend.src.core.modules.transaction.schemas.transaction import (
+    TransactionMonthlyValueSumDTO,
+    TransactionValueSumDTO,
+)
+from backend.src.core.modules.wallet_summary.repository_interface import (
+    WalletSummaryRepositoryInterface,
+)
+from backend.src.core.modules.wallet_summary.schemas import (
+    WalletSummaryDeltaDTO,
+    to_year_month,
+)
+from backend.src.core.modules.wallet_summary.use_case import WalletSummaryUseCase
+from backend.tests.database import get_transaction_data
+
+
+class InMemoryWalletSummaryRepository(WalletSummaryRepositoryInterface):
+    def __init__(self):
+        self.rows: Dict[
+            Tuple[int, int, TransactionType, bool], WalletSummaryDeltaDTO
+        ] = {}
+        self._rebuild()
+
+    async def apply_deltas(self, deltas: Sequence[WalletSummaryDeltaDTO]) -> None:
+        self._apply(deltas)
+
+    async def rebuild(self) -> None:
+        self._rebuild()
+
+    async def get_sum_values_by_wallet_id(
+        self, wallet_id: int, before_month: date
+    ) -> TransactionValueSumDTO:
+        result = TransactionValueSumDTO(
+            incomes=Decimal(0),
+            expenses=Decimal(0),
+            transfer_incomes=Decimal(0),
+            transfer_expenses=Decimal(0),
+        )
+
+        for row in self.rows.values():
+            if row.wallet_id == wallet_id and row.year_month < to_year_month(
+                before_month
+            ):
+                self._add(result, row)
+
+        return result
+
+    async def get_monthly_sum_values_by_user_id(
+        self, user_id: int, start_date: date, end_date: date
+    ) -> Sequence[TransactionMonthlyValueSumDTO]:
+        return self._sum_monthly(
+            lambda row: row.user_id == user_id, start_date, end_date
+        )
+
+    async def get_monthly_sum_values_by_wallet_id(
+        self, wallet_id: int, start_date: date, end_date: date
+    ) -> Sequence[TransactionMonthlyValueSumDTO]:
+        return self._sum_monthly(
+            lambda row: row.wallet_id == wallet_id, start_date, end_date
+        )
+
+    def _rebuild(self) -> None:
+        self.rows = {}
+        self._apply(
+            [
+                WalletSummaryUseCase.to_delta(transaction)
+                for transaction in get_transaction_data()
+            ]
+        )
+
+    def _apply(self, deltas: Sequence[WalletSummaryDeltaDTO]) -> None:
+        for delta in deltas:
+            key = (delta.wallet_id, delta.year_month, delta.type, delta.is_transfer)
+            row = self.rows.get(key)
+
+            if row is not None:
+                delta = delta.model_copy(
+                    update={
+                        "value": row.value + delta.value,
+                        "transaction_count": row.transaction_count
+                        + delta.transaction_count,
+                    }
+                )
+
+            self.rows[key] = delta
+
+    def _sum_monthly(
+        self,
+        predicate: Callable[[WalletSummaryDeltaDTO], bool],
+        start_date: date,
+        end_date: date,
+    ) -> List[TransactionMonthlyValueSumDTO]:
+        monthly: Dict[int, TransactionMonthlyValueSumDTO] = {}
+
+        for row in self.rows.values():
+            if not predicate(row) or not (
+                to_year_month(start_date) <= row.year_month <= to_year_month(end_date)
+            ):
+                continue
+
+            result = monthly.setdefault(
+                row.year_month,
+                TransactionMonthlyValueSumDTO(
+                    year=row.year_month // 100,
+                    month=row.year_month % 100,
+                    incomes=Decimal(0),
+                    expenses=Decimal(0),
+                    transfer_incomes=Decimal(0),
+                    transfer_expenses=Decimal(0),
+                ),
+            )
+            self._add(result, row)
+
+        return list(monthly.values())
+
+    @staticmethod
+    def _add(result: TransactionValueSumDTO, row: WalletSummaryDeltaDTO) -> None:
+        field = ("transfer_" if row.is_transfer else "") + (
+            "incomes" if row.type == TransactionType.INCOME else "expenses"
+        )
+        setattr(result, field, getattr(result, field) + row.value)
@@ -0,0 +1,25 @@
+from typing import Any, Callable, Dict, TypeVar
+
+from backend.src.main import app
+
+ValueT = TypeVar("ValueT")
+
+
+class DependencyOverrides:
+    """
+    Overrides app dependencies for one test and puts back whatever was
+    registered before, including the in-memory defaults from conftest.
+    """
+
+    def __init__(self):
+        self._previous: Dict[Callable[..., Any], Callable[..., Any]] = dict(
+            app.dependency_overrides
+        )
+
+    def set(self, dependency: Callable[..., Any], value: ValueT) -> ValueT:
+        app.dependency_overrides[dependency] = lambda: value
+        return value
+
+    def restore(self) -> None:
+        app.dependency_overrides.clear()
+        app.dependency_overrides.update(self._previous)